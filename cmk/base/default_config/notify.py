@@ -27,6 +27,10 @@ notification_rules: list[EventRule] = []
 # Check every 10 seconds for ripe bulks
 notification_bulk_interval = 10
 notification_plugin_timeout = 60
+# Number of notification plugins executed in parallel in keepalive mode
+notification_plugin_workers = 4
+# Optional per plugin limits of parallel executions, e.g. [("mail", 2)]
+notification_plugin_concurrency: list[tuple[NotificationPluginNameStr, int]] = []
 
 # Notification Spooling.
 
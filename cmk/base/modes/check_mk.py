@@ -45,6 +45,8 @@ from cmk.utils.everythingtype import EVERYTHING
 from cmk.utils.exceptions import MKBailOut, MKGeneralException, MKTimeout, OnError
 from cmk.utils.hostaddress import HostAddress, HostName, Hosts
 from cmk.utils.log import console, section
+from cmk.utils.misc import pnp_cleanup
+from cmk.utils.prediction import precompute_predictions, PredictionStore
 from cmk.utils.resulttype import Result
 from cmk.utils.rulesets.ruleset_matcher import RulesetMatcher
 from cmk.utils.sectionname import SectionMap, SectionName
@@ -781,6 +783,57 @@ modes.register(
     )
 )
 
+# .
+#   .--predictions---------------------------------------------------------.
+#   |                             _ _      _   _                           |
+#   |          _ __  _ __ ___  __| (_) ___| |_(_) ___  _ __  ___           |
+#   |         | '_ \| '__/ _ \/ _` | |/ __| __| |/ _ \| '_ \/ __|          |
+#   |         | |_) | | |  __/ (_| | | (__| |_| | (_) | | | \__ \          |
+#   |         | .__/|_|  \___|\__,_|_|\___|\__|_|\___/|_| |_|___/          |
+#   |         |_|                                                          |
+#   '----------------------------------------------------------------------'
+
+_PREDICTION_LEAD_TIME: Final = 6 * 3600
+
+
+def mode_precompute_predictions() -> None:
+    now = time.time()
+    connection = livestatus.LocalConnection()
+    computed = 0
+    for host_name, service_description in connection.query(
+        "GET services\nColumns: host_name description"
+    ):
+        # Same path as used by the checkers
+        store_path = cmk.utils.paths.predictions_dir / host_name / pnp_cleanup(service_description)
+        if not store_path.exists():
+            continue
+        computed += precompute_predictions(
+            PredictionStore(store_path),
+            partial(livestatus.get_rrd_data, connection, host_name, service_description),
+            now,
+            _PREDICTION_LEAD_TIME,
+        )
+    console.verbose(f"Computed {computed} predictions\n")
+
+
+modes.register(
+    Mode(
+        long_option="precompute-predictions",
+        handler_function=mode_precompute_predictions,
+        needs_config=False,
+        needs_checks=False,
+        short_help="Compute predictions of predictive levels ahead of time",
+        long_help=[
+            "Computes the predictions of predictive levels for the next day "
+            "during the last %d hours before the current ones expire. Each "
+            "prediction gets its own point in time within that window, so calling "
+            "this periodically spreads the work instead of computing all predictions "
+            "during the first check cycle after midnight. Checks fall back to "
+            "computing missing predictions on demand." % (_PREDICTION_LEAD_TIME // 3600)
+        ],
+    )
+)
+
 # .
 #   .--clean.-piggyb.------------------------------------------------------.
 #   |        _                               _                   _         |
@@ -15,20 +15,27 @@
 #    => These already bear all information about the contact, the plugin
 #       to call and its parameters.
 
+import codecs
 import datetime
 import io
 import logging
 import os
 import re
+import selectors
 import subprocess
 import sys
+import threading
 import time
 import traceback
 import uuid
-from collections.abc import Mapping, Sequence
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from functools import cache
 from pathlib import Path
-from typing import Any, cast, Literal, overload
+from typing import Any, cast, Final, Literal, NamedTuple, overload
 
 import cmk.utils.debug
 import cmk.utils.log as log
@@ -70,7 +77,6 @@ from cmk.utils.notify_types import (
 )
 from cmk.utils.regex import regex
 from cmk.utils.store.host_storage import ContactgroupName
-from cmk.utils.timeout import MKTimeout, Timeout
 from cmk.utils.timeperiod import is_timeperiod_active, load_timeperiods, timeperiod_active
 
 import cmk.base.config as config
@@ -416,11 +422,22 @@ def notification_test(
 
 # TODO: Make use of the generic do_keepalive() mechanism?
 def notify_keepalive() -> None:
+    global _plugin_pool
     cmk.base.utils.register_sigint_handler()
+    plugin_pool = _plugin_pool = NotificationPluginPool(
+        max_workers=config.notification_plugin_workers,
+        plugin_limits=dict(config.notification_plugin_concurrency),
+    )
+
+    def call_every_loop() -> None:
+        send_ripe_bulks()
+        plugin_pool.log_stats()
+
     events.event_keepalive(
         event_function=notify_notify,
-        call_every_loop=send_ripe_bulks,
+        call_every_loop=call_every_loop,
         loop_interval=config.notification_bulk_interval,
+        shutdown_function=plugin_pool.shutdown,
     )
 
 
@@ -457,10 +474,25 @@ def notify_rulebased(
     num_rule_matches = 0
     rule_info = []
 
-    for rule in config.notification_rules + user_notification_rules():
+    if analyse:
+        # The analysis evaluates the current configuration rule by rule
+        rule_index = NotificationRuleIndex(config.notification_rules + user_notification_rules())
+        candidates = set(range(len(rule_index.rules)))
+    else:
+        rule_index = _notification_rule_index()
+        candidates = rule_index.candidates(raw_context)
+
+    for nr, compiled_rule in enumerate(rule_index.rules):
+        rule = compiled_rule.rule
         contact_info = _get_contact_info_text(rule)
 
-        why_not = rbn_match_rule(rule, raw_context, analyse)
+        if nr in candidates:
+            why_not = rbn_match_rule(rule, raw_context, analyse)
+        elif logger.isEnabledFor(log.VERBOSE):
+            why_not = rbn_match_rule(rule, raw_context, analyse) or _NOT_A_CANDIDATE
+        else:
+            why_not = _NOT_A_CANDIDATE
+
         if why_not:
             logger.log(log.VERBOSE, contact_info)
             logger.log(log.VERBOSE, " -> does not match: %s", why_not)
@@ -471,7 +503,7 @@ def notify_rulebased(
             num_rule_matches += 1
 
             notifications, rule_info = _create_notifications(
-                raw_context, rule, notifications, rule_info
+                raw_context, compiled_rule, notifications, rule_info
             )
 
     plugin_info = _process_notifications(
@@ -481,6 +513,103 @@ def notify_rulebased(
     return rule_info, plugin_info
 
 
+_NOT_A_CANDIDATE = "The rule cannot match this kind of notification"
+
+
+class CompiledNotificationRule:
+    """A notification rule with its contacts resolved as far as possible in advance"""
+
+    def __init__(self, rule: EventRule) -> None:
+        self.rule: Final = rule
+        self.static_contacts: Final = rbn_rule_static_contacts(rule)
+        self._contact_restrictions: dict[ContactName, str | None] = {}
+
+    def contact_restriction(self, contactname: ContactName, contact: Contact) -> str | None:
+        """Why the contact is excluded by the contact macros and groups of the rule (cached)"""
+        try:
+            return self._contact_restrictions[contactname]
+        except KeyError:
+            pass
+        reason = self._contact_restrictions[contactname] = rbn_match_contact_macros(
+            self.rule, contactname, contact
+        ) or rbn_match_contact_groups(self.rule, contactname, contact)
+        return reason
+
+
+class NotificationRuleIndex:
+    """Decision structure over all notification rules
+
+    Each rule is filed under the most selective of its conditions which can be looked up
+    directly: the host names, the host labels, the contact groups or the type of event (host or
+    service) it is restricted to. Rules without such a condition are candidates for every
+    notification, disabled rules for none. Candidates still have to pass rbn_match_rule, all
+    other rules cannot match.
+    """
+
+    def __init__(self, rules: Sequence[EventRule]) -> None:
+        self.rules: Final = [CompiledNotificationRule(rule) for rule in rules]
+        self._unconditional: set[int] = set()
+        self._by_key: dict[tuple[str, object], set[int]] = {}
+        # Rules restricted to contact groups match if the groups are unknown
+        self._by_contactgroups: set[int] = set()
+        for nr, rule in enumerate(rules):
+            self._add(nr, rule)
+
+    def _add(self, nr: int, rule: EventRule) -> None:
+        if rule.get("disabled"):
+            return
+
+        if "match_hosts" in rule:
+            keys: list[tuple[str, object]] = [("host", name) for name in rule["match_hosts"]]
+        elif rule.get("match_hostlabels"):
+            keys = [("hostlabel", next(iter(rule["match_hostlabels"].items())))]
+        elif "match_contactgroups" in rule:
+            self._by_contactgroups.add(nr)
+            keys = [("contactgroup", group) for group in rule["match_contactgroups"]]
+        elif "match_host_event" in rule and "match_service_event" not in rule:
+            keys = [("what", "HOST")]
+        elif (
+            "match_service_event" in rule and "match_host_event" not in rule
+        ) or "match_services" in rule:
+            keys = [("what", "SERVICE")]
+        else:
+            self._unconditional.add(nr)
+            return
+
+        for key in keys:
+            self._by_key.setdefault(key, set()).add(nr)
+
+    def candidates(self, context: EventContext) -> set[int]:
+        """The numbers of the rules which may match the notification"""
+        keys: list[tuple[str, object]] = [
+            ("what", context["WHAT"]),
+            ("host", context["HOSTNAME"]),
+            *(("hostlabel", label) for label in _context_labels(context, "host").items()),
+        ]
+        candidates = set(self._unconditional)
+        if context["WHAT"] == "SERVICE":
+            contactgroup_names = context.get("SERVICECONTACTGROUPNAMES")
+        else:
+            contactgroup_names = context.get("HOSTCONTACTGROUPNAMES")
+        if contactgroup_names is None:
+            candidates.update(self._by_contactgroups)
+        elif contactgroup_names:
+            keys.extend(("contactgroup", group) for group in contactgroup_names.split(","))
+
+        for key in keys:
+            candidates.update(self._by_key.get(key, ()))
+        return candidates
+
+
+@cache
+def _notification_rule_index() -> NotificationRuleIndex:
+    """Compile the global and user notification rules
+
+    Is computed once for the process lifetime, just like _contactgroup_members.
+    """
+    return NotificationRuleIndex(config.notification_rules + user_notification_rules())
+
+
 def _get_contact_info_text(rule: EventRule) -> str:
     if "contact" in rule:
         return "User {}'s rule '{}'...".format(rule["contact"], rule["description"])
@@ -489,11 +618,12 @@ def _get_contact_info_text(rule: EventRule) -> str:
 
 def _create_notifications(
     raw_context: EventContext,
-    rule: EventRule,
+    compiled_rule: CompiledNotificationRule,
     notifications: Notifications,
     rule_info: list[NotifyRuleInfo],
 ) -> tuple[Notifications, list[NotifyRuleInfo]]:
-    contacts = rbn_rule_contacts(rule, raw_context)
+    rule = compiled_rule.rule
+    contacts = rbn_rule_contacts(rule, raw_context, compiled_rule)
     contactstxt = ", ".join(contacts)
 
     plugin_name, plugin_parameters = rule["notify_plugin"]
@@ -589,7 +719,7 @@ def _process_notifications(  # pylint: disable=too-many-branches
                     else rbn_split_plugin_context(plugin_context)
                 )
                 for context in plugin_contexts:
-                    call_notification_script(plugin_name, context)
+                    _dispatch_notification_script(plugin_name, context)
             else:
                 logger.info("No rule matched, would notify fallback contacts, but none configured")
     else:
@@ -640,7 +770,7 @@ def _process_notifications(  # pylint: disable=too-many-branches
                             NotificationViaPlugin({"context": context, "plugin": plugin_name}),
                         )
                     else:
-                        call_notification_script(plugin_name, context)
+                        _dispatch_notification_script(plugin_name, context)
 
             except Exception as e:
                 if cmk.utils.debug.enabled():
@@ -1029,13 +1159,9 @@ def rbn_match_event(
     )
 
 
-def rbn_rule_contacts(  # pylint: disable=too-many-branches
-    rule: EventRule,
-    context: EventContext,
-) -> ContactNames:
-    the_contacts = set()
-    if rule.get("contact_object"):
-        the_contacts.update(rbn_object_contact_names(context))
+def rbn_rule_static_contacts(rule: EventRule) -> frozenset[ContactName]:
+    """The contacts of the rule which do not depend on the notified object"""
+    the_contacts: set[ContactName] = set()
     if rule.get("contact_all"):
         the_contacts.update(rbn_all_contacts())
     if rule.get("contact_all_with_email"):
@@ -1046,6 +1172,19 @@ def rbn_rule_contacts(  # pylint: disable=too-many-branches
         the_contacts.update(rbn_groups_contacts(rule["contact_groups"]))
     if "contact_emails" in rule:
         the_contacts.update(rbn_emails_contacts(rule["contact_emails"]))
+    return frozenset(the_contacts)
+
+
+def rbn_rule_contacts(
+    rule: EventRule,
+    context: EventContext,
+    compiled_rule: CompiledNotificationRule | None = None,
+) -> ContactNames:
+    the_contacts = set(
+        rbn_rule_static_contacts(rule) if compiled_rule is None else compiled_rule.static_contacts
+    )
+    if rule.get("contact_object"):
+        the_contacts.update(rbn_object_contact_names(context))
 
     all_enabled = []
     for contactname in the_contacts:
@@ -1072,9 +1211,12 @@ def rbn_rule_contacts(  # pylint: disable=too-many-branches
                     )
                     continue
 
-            reason = rbn_match_contact_macros(
-                rule, contactname, contact
-            ) or rbn_match_contact_groups(rule, contactname, contact)
+            reason = (
+                rbn_match_contact_macros(rule, contactname, contact)
+                or rbn_match_contact_groups(rule, contactname, contact)
+                if compiled_rule is None
+                else compiled_rule.contact_restriction(contactname, contact)
+            )
 
             if reason:
                 logger.info("   - skipping contact %s: %s", contactname, reason)
@@ -1175,17 +1317,20 @@ def rbn_match_servicelabels(
     return None
 
 
-def _rbn_handle_labels(
-    rule: EventRule, context: EventContext, what: Literal["host", "service"]
-) -> str | None:
-    labels: dict[str, Any] = {}
+def _context_labels(context: EventContext, what: Literal["host", "service"]) -> dict[str, Any]:
     context_str = "%sLABEL" % what.upper()
-    labels = {
+    return {
         variable.replace("%s_" % context_str, ""): value
         for variable, value in context.items()
         if variable.startswith(context_str)
     }
 
+
+def _rbn_handle_labels(
+    rule: EventRule, context: EventContext, what: Literal["host", "service"]
+) -> str | None:
+    labels = _context_labels(context, what)
+
     key: Literal["match_servicelabels", "match_hostlabels"] = (
         "match_servicelabels" if what == "service" else "match_hostlabels"
     )
@@ -1385,62 +1530,250 @@ def call_notification_script(
     def plugin_log(s: str) -> None:
         logger.info("     %s", s)
 
+    exitcode, output_lines = _execute_notification_script(plugin_name, plugin_context, plugin_log)
+
+    # Result is already logged to history for spoolfiles by
+    # mknotifyd.spool_handler
+    if not is_spoolfile:
+        log_to_history(
+            notification_result_message(
+                NotificationPluginName(plugin_name),
+                NotificationContext(plugin_context),
+                NotificationResultCode(exitcode),
+                output_lines,
+            )
+        )
+
+    return exitcode
+
+
+def _execute_notification_script(
+    plugin_name: NotificationPluginNameStr,
+    plugin_context: NotificationContext,
+    plugin_log: Callable[[str], None],
+) -> tuple[int, list[str]]:
     # Call actual script without any arguments
     path = path_to_notification_script(plugin_name)
     if not path:
-        return 2
+        return 2, []
 
     plugin_log("executing %s" % path)
 
+    # The timeout is enforced by waiting on the output with a deadline instead of
+    # SIGALRM, because this is also executed by the workers of the
+    # NotificationPluginPool.
+    deadline = time.monotonic() + config.notification_plugin_timeout
+    timed_out = False
     with subprocess.Popen(
         [path],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         env=notification_script_env(plugin_context),
-        encoding="utf-8",
         close_fds=True,
-    ) as p:
+    ) as p, selectors.DefaultSelector() as selector:
         output_lines: list[str] = []
         assert p.stdout is not None
-
-        with Timeout(
-            config.notification_plugin_timeout,
-            message="Notification plugin timed out",
-        ) as timeout_guard:
-            try:
-                while True:
-                    # read and output stdout linewise to ensure we don't force python to produce
-                    # one - potentially huge - memory buffer
-                    if not (line := p.stdout.readline()):
-                        break
-                    output = line.rstrip()
-                    plugin_log("Output: %s" % output)
-                    output_lines.append(output)
-                    if _log_to_stdout:
-                        out.output(line)
-            except MKTimeout:
-                plugin_log(
-                    "Notification plugin did not finish within %d seconds. Terminating."
-                    % config.notification_plugin_timeout
-                )
+        selector.register(p.stdout, selectors.EVENT_READ)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+
+        def handle_line(line: str) -> None:
+            output = line.rstrip()
+            plugin_log("Output: %s" % output)
+            output_lines.append(output)
+            if _log_to_stdout:
+                out.output(line)
+
+        while True:
+            # read and output stdout linewise to ensure we don't force python to produce
+            # one - potentially huge - memory buffer
+            if (remaining := deadline - time.monotonic()) <= 0 or not selector.select(remaining):
+                timed_out = True
                 p.kill()
+                break
+            if not (chunk := os.read(p.stdout.fileno(), 4096)):
+                break
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                handle_line(line + "\n")
+        if pending := pending + decoder.decode(b"", final=True):
+            handle_line(pending)
+
+    if timed_out:
+        plugin_log(
+            "Notification plugin did not finish within %d seconds. Terminating."
+            % config.notification_plugin_timeout
+        )
 
-    if exitcode := 1 if timeout_guard.signaled else p.returncode:
+    if exitcode := 1 if timed_out else p.returncode:
         plugin_log("Plugin exited with code %d" % exitcode)
 
-    # Result is already logged to history for spoolfiles by
-    # mknotifyd.spool_handler
-    if not is_spoolfile:
+    return exitcode, output_lines
+
+
+class _PluginJob(NamedTuple):
+    plugin_name: NotificationPluginNameStr
+    plugin_context: NotificationContext
+    enqueued: float
+
+
+@dataclass
+class NotificationPluginPoolStats:
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    max_queued: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    def __str__(self) -> str:
+        done = max(self.completed, 1)
+        return (
+            "queued: %d (max %d), running: %d, completed: %d, "
+            "wait time: %.2fs avg/%.2fs max, run time: %.2fs avg/%.2fs max"
+            % (
+                self.queued,
+                self.max_queued,
+                self.running,
+                self.completed,
+                self.total_wait_time / done,
+                self.max_wait_time,
+                self.total_run_time / done,
+                self.max_run_time,
+            )
+        )
+
+
+class NotificationPluginPool:
+    """Executes notification plugins in a bounded number of worker threads
+
+    Used in keepalive mode to keep a slow plugin (e.g. a hanging mail relay or
+    ticket system) from blocking all other notifications. Jobs of plugins that
+    reached their concurrency limit wait in a per plugin queue and do not occupy
+    a worker. The history entry announcing a notification is written on
+    submission, its result is written by the worker once the plugin finished.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        plugin_limits: Mapping[NotificationPluginNameStr, int],
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="notification-plugin"
+        )
+        self._plugin_limits = plugin_limits
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._waiting: dict[NotificationPluginNameStr, deque[_PluginJob]] = defaultdict(deque)
+        self._active: Counter[NotificationPluginNameStr] = Counter()
+        self._stats = NotificationPluginPoolStats()
+        self._logged_stats = NotificationPluginPoolStats()
+
+    def submit(
+        self, plugin_name: NotificationPluginNameStr, plugin_context: NotificationContext
+    ) -> None:
         log_to_history(
-            notification_result_message(
+            notification_message(
                 NotificationPluginName(plugin_name),
-                NotificationContext(plugin_context),
+                plugin_context,
+            )
+        )
+        with self._lock:
+            self._waiting[plugin_name].append(_PluginJob(plugin_name, plugin_context, time.time()))
+            self._stats.queued += 1
+            self._stats.max_queued = max(self._stats.max_queued, self._stats.queued)
+            self._dispatch(plugin_name)
+
+    def stats(self) -> NotificationPluginPoolStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def shutdown(self) -> None:
+        """Wait for all queued and running plugins to finish"""
+        with self._idle:
+            self._idle.wait_for(lambda: not self._stats.queued and not self._stats.running)
+        self._executor.shutdown(wait=True)
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        if stats != self._logged_stats:
+            logger.info("Notification plugin pool: %s", stats)
+            self._logged_stats = stats
+
+    def _dispatch(self, plugin_name: NotificationPluginNameStr) -> None:
+        # Needs to be called with self._lock held
+        waiting = self._waiting[plugin_name]
+        limit = self._plugin_limits.get(plugin_name)
+        while waiting and (limit is None or self._active[plugin_name] < limit):
+            self._active[plugin_name] += 1
+            self._executor.submit(self._run, waiting.popleft())
+
+    def _run(self, job: _PluginJob) -> None:
+        started = time.time()
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.running += 1
+            wait_time = started - job.enqueued
+            self._stats.total_wait_time += wait_time
+            self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+
+        # Collect the log lines and write them en bloc to keep the lines of
+        # concurrently executed plugins apart in the notification log.
+        log_lines: list[str] = []
+        try:
+            exitcode, output_lines = _execute_notification_script(
+                job.plugin_name, job.plugin_context, log_lines.append
+            )
+        except Exception as e:
+            log_lines.append("ERROR: %s" % e)
+            exitcode, output_lines = 2, [str(e)]
+
+        logger.info(
+            "Executed %s for %s (%s):\n%s",
+            job.plugin_name,
+            job.plugin_context.get("CONTACTNAME", "?"),
+            ";".join(
+                filter(
+                    None,
+                    (job.plugin_context.get("HOSTNAME"), job.plugin_context.get("SERVICEDESC")),
+                )
+            ),
+            "\n".join("     %s" % line for line in log_lines),
+        )
+        log_to_history(
+            notification_result_message(
+                NotificationPluginName(job.plugin_name),
+                NotificationContext(job.plugin_context),
                 NotificationResultCode(exitcode),
                 output_lines,
             )
         )
 
-    return exitcode
+        with self._lock:
+            run_time = time.time() - started
+            self._stats.running -= 1
+            self._stats.completed += 1
+            self._stats.total_run_time += run_time
+            self._stats.max_run_time = max(self._stats.max_run_time, run_time)
+            self._active[job.plugin_name] -= 1
+            self._dispatch(job.plugin_name)
+            self._idle.notify_all()
+
+
+_plugin_pool: NotificationPluginPool | None = None
+
+
+def _dispatch_notification_script(
+    plugin_name: NotificationPluginNameStr,
+    plugin_context: NotificationContext,
+) -> None:
+    if _plugin_pool is None:
+        call_notification_script(plugin_name, plugin_context)
+    else:
+        _plugin_pool.submit(plugin_name, plugin_context)
 
 
 # Construct the environment for the notification script
@@ -1671,13 +2004,19 @@ def do_bulk_notify(  # pylint: disable=too-many-branches
         )
 
     logger.info("    --> storing for bulk notification %s", "|".join(bulk_path))
-    bulk_dir = _create_bulk_dir(bulk_path)
-    notify_uuid = str(uuid.uuid4())
-    filename_new = bulk_dir / f"{notify_uuid}.new"
-    filename_final = bulk_dir / notify_uuid
-    filename_new.write_text(f"{(params, plugin_context)!r}\n")
-    filename_new.rename(filename_final)  # We need an atomic creation!
-    logger.info("        - stored in %s", filename_final)
+    with _modified_bulk_index() as index:
+        bulk_dir = _create_bulk_dir(bulk_path)
+        notify_uuid = str(uuid.uuid4())
+        filename_new = bulk_dir / f"{notify_uuid}.new"
+        filename_final = bulk_dir / notify_uuid
+        filename_new.write_text(f"{(params, plugin_context)!r}\n")
+        filename_new.rename(filename_final)  # We need an atomic creation!
+        logger.info("        - stored in %s", filename_final)
+
+        key = str(bulk_dir.relative_to(notification_bulkdir))
+        mtime = filename_final.stat().st_mtime
+        oldest, count = index.get(key, (mtime, 0))
+        index[key] = min(oldest, mtime), count + 1
 
 
 def _create_bulk_dir(bulk_path: Sequence[str]) -> Path:
@@ -1747,14 +2086,78 @@ def remove_if_orphaned(bulk_dir: str, max_age: float, ref_time: float | None = N
             logger.info("    -> Error removing it: %s", e)
 
 
-def find_bulks(only_ripe: bool) -> NotifyBulks:  # pylint: disable=too-many-branches
+# The bulk index maps the path of each bulk directory relative to the
+# notification_bulkdir (e.g. "hh/mail/60,10,host,localhost") to the
+# time stamp of its oldest notification and the number of notifications
+# in it. It is updated whenever a notification is added to or sent from a
+# bulk. This way the ripeness of the bulks can be determined without
+# scanning the whole spool. The interval, time period and maximum count are
+# encoded in the name of the bulk directory (see bulk_parts()).
+_BulkIndex = dict[str, tuple[float, int]]
+
+# A crash between storing a notification and saving the index leaves the
+# notification out of the index. The index is rebuilt from the spool at this
+# interval (in seconds), so such notifications are sent with some delay.
+_BULK_INDEX_RESCAN_INTERVAL = 600
+
+
+def _bulk_index_path() -> Path:
+    return Path(notification_bulkdir, ".index")
+
+
+def _bulk_index_scanned_path() -> Path:
+    return Path(notification_bulkdir, ".index_scanned")
+
+
+def _load_bulk_index() -> _BulkIndex:
+    path = _bulk_index_path()
+    with store.locked(path):
+        if (index := store.load_object_from_pickle_file(path, default=None)) is None:
+            index = _scan_bulk_dirs()
+            store.save_object_to_pickle_file(path, index)
+    return index
+
+
+@contextmanager
+def _modified_bulk_index() -> Iterator[_BulkIndex]:
+    path = _bulk_index_path()
+    with store.locked(path):
+        if (index := store.load_object_from_pickle_file(path, default=None)) is None:
+            index = _scan_bulk_dirs()
+        yield index
+        store.save_object_to_pickle_file(path, index)
+
+
+def _rescan_bulk_index_if_due(now: float) -> None:
     if not os.path.exists(notification_bulkdir):
-        return []
+        return
+
+    scanned_path = _bulk_index_scanned_path()
+    try:
+        if now - scanned_path.stat().st_mtime < _BULK_INDEX_RESCAN_INTERVAL:
+            return
+    except FileNotFoundError:
+        pass
+
+    path = _bulk_index_path()
+    with store.locked(path):
+        store.save_object_to_pickle_file(path, _scan_bulk_dirs())
+        scanned_path.touch()
+
+
+def _scan_bulk_dirs() -> _BulkIndex:
+    """Build the bulk index from the files in the spool
+
+    This is needed in case the index is missing, e.g. after an update, and from
+    time to time to pick up notifications missing in the index."""
+    if not os.path.exists(notification_bulkdir):
+        return {}
 
     def listdir_visible(path: str) -> list[str]:
         return [x for x in os.listdir(path) if not x.startswith(".")]
 
-    bulks: NotifyBulks = []
+    logger.info("Creating index of bulk notifications")
+    index: _BulkIndex = {}
     now = time.time()
     for contact in listdir_visible(notification_bulkdir):
         contact_dir = os.path.join(notification_bulkdir, contact)
@@ -1762,80 +2165,122 @@ def find_bulks(only_ripe: bool) -> NotifyBulks:  # pylint: disable=too-many-bran
             method_dir = os.path.join(contact_dir, method)
             for bulk in listdir_visible(method_dir):
                 bulk_dir = os.path.join(method_dir, bulk)
-
                 uuids, oldest = bulk_uuids(bulk_dir)
                 if not uuids:
                     remove_if_orphaned(bulk_dir, max_age=60, ref_time=now)
                     continue
-                age = now - oldest
+                index[os.path.join(contact, method, bulk)] = (oldest, len(uuids))
+    return index
+
+
+def _update_bulk_index(bulk_dir: str) -> UUIDs:
+    """Bring the index entry of a bulk in line with the files in its directory
+
+    Empty bulk directories are removed."""
+    with _modified_bulk_index() as index:
+        key = os.path.relpath(bulk_dir, notification_bulkdir)
+        uuids, oldest = bulk_uuids(bulk_dir) if os.path.isdir(bulk_dir) else ([], 0.0)
+        if uuids:
+            index[key] = (oldest, len(uuids))
+            return uuids
+
+        index.pop(key, None)
+        try:
+            os.rmdir(bulk_dir)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.info("Warning: cannot remove directory %s: %s", bulk_dir, e)
+        return []
+
 
-                # e.g. 60,10,host,localhost OR timeperiod:late_night,1000,host,localhost
-                parts = bulk_parts(method_dir, bulk)
-                if parts is None:
+def find_bulks(only_ripe: bool) -> NotifyBulks:  # pylint: disable=too-many-branches
+    if not os.path.exists(notification_bulkdir):
+        return []
+
+    bulks: NotifyBulks = []
+    now = time.time()
+    for key, (oldest, num_uuids) in sorted(_load_bulk_index().items()):
+        bulk_dir = os.path.join(notification_bulkdir, key)
+        method_dir, bulk = os.path.split(bulk_dir)
+        age = now - oldest
+
+        # e.g. 60,10,host,localhost OR timeperiod:late_night,1000,host,localhost
+        parts = bulk_parts(method_dir, bulk)
+        if parts is None:
+            continue
+        interval, timeperiod, count = parts
+
+        if interval is not None:
+            if age >= interval:
+                logger.info("Bulk %s is ripe: age %d >= %d", bulk_dir, age, interval)
+            elif num_uuids >= count:
+                logger.info("Bulk %s is ripe: count %d >= %d", bulk_dir, num_uuids, count)
+            else:
+                logger.info(
+                    "Bulk %s is not ripe yet (age: %d, count: %d)!",
+                    bulk_dir,
+                    age,
+                    num_uuids,
+                )
+                if only_ripe:
                     continue
-                interval, timeperiod, count = parts
 
-                if interval is not None:
-                    if age >= interval:
-                        logger.info("Bulk %s is ripe: age %d >= %d", bulk_dir, age, interval)
-                    elif len(uuids) >= count:
-                        logger.info("Bulk %s is ripe: count %d >= %d", bulk_dir, len(uuids), count)
-                    else:
-                        logger.info(
-                            "Bulk %s is not ripe yet (age: %d, count: %d)!",
-                            bulk_dir,
-                            age,
-                            len(uuids),
-                        )
-                        if only_ripe:
-                            continue
+            if uuids := _bulk_uuids_of_indexed(bulk_dir):
+                bulks.append((bulk_dir, age, interval, "n.a.", count, uuids))
+        else:
+            try:
+                active = timeperiod_active(str(timeperiod))
+            except Exception:
+                # This prevents sending bulk notifications if a
+                # livestatus connection error appears. It also implies
+                # that an ongoing connection error will hold back bulk
+                # notifications.
+                logger.info(
+                    "Error while checking activity of time period %s: assuming active",
+                    timeperiod,
+                )
+                active = True
 
-                    bulks.append((bulk_dir, age, interval, "n.a.", count, uuids))
-                else:
-                    try:
-                        active = timeperiod_active(str(timeperiod))
-                    except Exception:
-                        # This prevents sending bulk notifications if a
-                        # livestatus connection error appears. It also implies
-                        # that an ongoing connection error will hold back bulk
-                        # notifications.
-                        logger.info(
-                            "Error while checking activity of time period %s: assuming active",
-                            timeperiod,
-                        )
-                        active = True
-
-                    if active is True and len(uuids) < count:
-                        # Only add a log entry every 10 minutes since timeperiods
-                        # can be very long (The default would be 10s).
-                        if now % 600 <= config.notification_bulk_interval:
-                            logger.info(
-                                "Bulk %s is not ripe yet (time period %s: active, count: %d)",
-                                bulk_dir,
-                                timeperiod,
-                                len(uuids),
-                            )
-
-                        if only_ripe:
-                            continue
-                    elif active is False:
-                        logger.info(
-                            "Bulk %s is ripe: time period %s has ended", bulk_dir, timeperiod
-                        )
-                    elif len(uuids) >= count:
-                        logger.info("Bulk %s is ripe: count %d >= %d", bulk_dir, len(uuids), count)
-                    else:
-                        logger.info(
-                            "Bulk %s is ripe: time period %s is not known anymore",
-                            bulk_dir,
-                            timeperiod,
-                        )
+            if active is True and num_uuids < count:
+                # Only add a log entry every 10 minutes since timeperiods
+                # can be very long (The default would be 10s).
+                if now % 600 <= config.notification_bulk_interval:
+                    logger.info(
+                        "Bulk %s is not ripe yet (time period %s: active, count: %d)",
+                        bulk_dir,
+                        timeperiod,
+                        num_uuids,
+                    )
 
-                    bulks.append((bulk_dir, age, "n.a.", timeperiod, count, uuids))
+                if only_ripe:
+                    continue
+            elif active is False:
+                logger.info("Bulk %s is ripe: time period %s has ended", bulk_dir, timeperiod)
+            elif num_uuids >= count:
+                logger.info("Bulk %s is ripe: count %d >= %d", bulk_dir, num_uuids, count)
+            else:
+                logger.info(
+                    "Bulk %s is ripe: time period %s is not known anymore",
+                    bulk_dir,
+                    timeperiod,
+                )
+
+            if uuids := _bulk_uuids_of_indexed(bulk_dir):
+                bulks.append((bulk_dir, age, "n.a.", timeperiod, count, uuids))
     return bulks
 
 
+def _bulk_uuids_of_indexed(bulk_dir: str) -> UUIDs:
+    if os.path.isdir(bulk_dir) and (uuids := bulk_uuids(bulk_dir)[0]):
+        return uuids
+    # The spool has been changed behind our back, e.g. by deleting the directory
+    logger.info("Bulk %s is gone, removing it from the index", bulk_dir)
+    return _update_bulk_index(bulk_dir)
+
+
 def send_ripe_bulks() -> None:
+    _rescan_bulk_index_if_due(time.time())
     ripe = find_bulks(True)
     if ripe:
         logger.info("Sending out %d ripe bulk notifications", len(ripe))
@@ -1925,12 +2370,9 @@ def notify_bulk(dirname: str, uuids: UUIDs) -> None:  # pylint: disable=too-many
     if unhandled_uuids:
         notify_bulk(dirname, unhandled_uuids)
 
-    # Remove directory. Not necessary if emtpy
-    try:
-        os.rmdir(dirname)
-    except Exception as e:
-        if not unhandled_uuids:
-            logger.info("Warning: cannot remove directory %s: %s", dirname, e)
+    # Notifications added in the meantime stay in the index. The directory is
+    # removed once it is empty.
+    _update_bulk_index(dirname)
 
 
 def call_bulk_notification_script(
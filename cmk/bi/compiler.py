@@ -6,9 +6,14 @@
 from __future__ import annotations
 
 import ast
+import multiprocessing
 import os
 import pickle
+import sys
+import threading
 import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from redis import Redis
@@ -23,11 +28,13 @@ from cmk.utils.redis import get_redis_client
 
 from cmk.bi.aggregation import BIAggregation
 from cmk.bi.data_fetcher import BIStructureFetcher, get_cache_dir, SiteProgramStart
-from cmk.bi.lib import SitesCallback
+from cmk.bi.lib import BIHostData, SitesCallback
 from cmk.bi.packs import BIAggregationPacks
+from cmk.bi.rule import BIRule
+from cmk.bi.rule_interface import bi_rule_id_registry
 from cmk.bi.searcher import BISearcher
 from cmk.bi.trees import BICompiledAggregation, BICompiledRule, FrozenBIInfo
-from cmk.bi.type_defs import frozen_aggregations_dir
+from cmk.bi.type_defs import AggrConfigDict, frozen_aggregations_dir
 
 
 class ConfigStatus(TypedDict):
@@ -36,6 +43,121 @@ class ConfigStatus(TypedDict):
     online_sites: set[SiteProgramStart]
 
 
+# Aggregations and searcher of the running compilation. They are set right before the
+# worker processes are forked, so the workers inherit them and only read them.
+_compile_context: tuple[dict[str, BIAggregation], BISearcher] | None = None
+
+
+def compile_aggregations(
+    aggregations: Sequence[BIAggregation],
+    bi_searcher: BISearcher,
+    processes: int | None = None,
+) -> Iterator[tuple[BICompiledAggregation, dict, float]]:
+    """Compiles the aggregations, spread across worker processes if there are several
+
+    Yields the compiled aggregation, its serialized form and the compile duration in
+    the order of the given aggregations. The loaded rule packs (bi_rule_id_registry) and the
+    structure data of the searcher are shared with the forked workers copy-on-write.
+
+    Forking is only safe as long as no other thread may hold a lock (logging, Redis, livestatus
+    connections, ...) that the children would inherit in a locked state. Multithreaded callers,
+    like the request threads of the GUI, therefore fork the workers from a freshly spawned
+    interpreter.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(aggregations))
+    if processes <= 1:
+        for aggregation in aggregations:
+            start = time.time()
+            compiled_aggregation = aggregation.compile(bi_searcher)
+            duration = time.time() - start
+            yield compiled_aggregation, compiled_aggregation.serialize(), duration
+        return
+
+    if threading.active_count() > 1:
+        results = _compile_in_spawned_process(aggregations, bi_searcher, processes)
+    else:
+        results = _compile_in_forked_workers(aggregations, bi_searcher, processes)
+
+    for aggregation in aggregations:
+        result, duration = results[aggregation.id]
+        yield BIAggregation.create_trees_from_schema(result), result, duration
+
+
+def _compile_in_forked_workers(
+    aggregations: Sequence[BIAggregation], bi_searcher: BISearcher, processes: int
+) -> dict[str, tuple[dict, float]]:
+    global _compile_context
+
+    _compile_context = ({x.id: x for x in aggregations}, bi_searcher)
+    try:
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            return {
+                aggr_id: (result, duration)
+                for aggr_id, result, duration in pool.imap_unordered(
+                    _compile_aggregation_in_worker, [x.id for x in aggregations]
+                )
+            }
+    finally:
+        _compile_context = None
+
+
+def _compile_aggregation_in_worker(aggr_id: str) -> tuple[str, dict, float]:
+    assert _compile_context is not None
+    aggregations, bi_searcher = _compile_context
+    start = time.time()
+    compiled_aggregation = aggregations[aggr_id].compile(bi_searcher)
+    return aggr_id, compiled_aggregation.serialize(), time.time() - start
+
+
+def _compile_in_spawned_process(
+    aggregations: Sequence[BIAggregation], bi_searcher: BISearcher, processes: int
+) -> dict[str, tuple[dict, float]]:
+    """Hands the compilation over to a single threaded interpreter, which forks the workers
+
+    The spawned interpreter does not inherit anything, so the rules, the aggregations and the
+    structure data are passed in their serialized form.
+    """
+    context = multiprocessing.get_context("spawn")
+    # Within mod_wsgi, sys.executable is the Apache binary
+    context.set_executable(os.path.join(sys.exec_prefix, "bin", "python3"))
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(
+            _compile_serialized_aggregations,
+            [
+                (rule.pack_id, rule.serialize())
+                for rule in bi_rule_id_registry.values()
+                if isinstance(rule, BIRule)
+            ],
+            [(x.pack_id, x.serialize()) for x in aggregations],
+            bi_searcher.hosts,
+            processes,
+        ).result()
+
+
+def _compile_serialized_aggregations(
+    rules: list[tuple[str, dict]],
+    aggregations: list[tuple[str, AggrConfigDict]],
+    hosts: dict[str, BIHostData],
+    processes: int,
+) -> dict[str, tuple[dict, float]]:
+    for pack_id, rule_config in rules:
+        BIRule(rule_config, pack_id)  # Registers itself in bi_rule_id_registry
+    bi_searcher = BISearcher()
+    bi_searcher.set_hosts(hosts)
+    return _compile_in_forked_workers(
+        [BIAggregation(aggr_config, pack_id) for pack_id, aggr_config in aggregations],
+        bi_searcher,
+        processes,
+    )
+
+
+# Compiled aggregations loaded by this process, keyed by file path along with the
+# (mtime, size) of the file they were loaded from
+_loaded_aggregations: dict[str, tuple[tuple[int, int], BICompiledAggregation]] = {}
+
+
 class BICompiler:
     def __init__(self, bi_configuration_file: str, sites_callback: SitesCallback) -> None:
         self._sites_callback = sites_callback
@@ -45,6 +167,7 @@ class BICompiler:
         self._compiled_aggregations: dict[str, BICompiledAggregation] = {}
         self._path_compilation_lock = Path(get_cache_dir(), "compilation.LOCK")
         self._path_compilation_timestamp = Path(get_cache_dir(), "last_compilation")
+        self._path_compilation_structure = Path(get_cache_dir(), "last_compilation_structure")
         self._path_compiled_aggregations = Path(get_cache_dir(), "compiled_aggregations")
         self._path_compiled_aggregations.mkdir(parents=True, exist_ok=True)
 
@@ -194,13 +317,29 @@ class BICompiler:
             if aggr_id.endswith(".new") or aggr_id in self._compiled_aggregations:
                 continue
 
-            self._logger.debug("Loading cached aggregation results %s" % aggr_id)
-            self._compiled_aggregations[aggr_id] = BIAggregation.create_trees_from_schema(
-                self._load_data(path_object)
-            )
+            self._compiled_aggregations[aggr_id] = self._load_compiled_aggregation(path_object)
 
         self._compiled_aggregations = self._manage_frozen_branches(self._compiled_aggregations)
 
+    def _load_compiled_aggregation(self, path_object: Path) -> BICompiledAggregation:
+        # Keep the loaded aggregations of unchanged files across the instances of this process.
+        # Besides saving the unpickling, this keeps the compiled nodes identical, which is what
+        # the BINodeResultCache of the computer is bound to.
+        stat_result = path_object.stat()
+        file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cache_key = str(path_object)
+        if (cached := _loaded_aggregations.get(cache_key)) and cached[0] == file_signature:
+            return cached[1]
+
+        self._logger.debug("Loading cached aggregation results %s" % path_object.name)
+        compiled_aggregation = BIAggregation.create_trees_from_schema(self._load_data(path_object))
+        if compiled_aggregation.computation_options.freeze_aggregations:
+            # The frozen branch management modifies these aggregations after loading
+            _loaded_aggregations.pop(cache_key, None)
+        else:
+            _loaded_aggregations[cache_key] = (file_signature, compiled_aggregation)
+        return compiled_aggregation
+
     def _check_compilation_status(self) -> None:
         current_configstatus = self.compute_current_configstatus()
         if not self._compilation_required(current_configstatus):
@@ -217,24 +356,34 @@ class BICompiler:
 
             self.prepare_for_compilation(current_configstatus["online_sites"])
 
+            structure_checksum = self._bi_structure_fetcher.structure_checksum()
+            if self._compiled_structure_unchanged(current_configstatus, structure_checksum):
+                # Only the program starts of the sites changed, e.g. by a core restart. The
+                # compiled aggregations on disk are still based on the same structure data.
+                self._logger.debug("No compilation required. The structure data is unchanged")
+                known_sites = {kv[0]: kv[1] for kv in current_configstatus["known_sites"]}
+                self._bi_structure_fetcher.cleanup_orphaned_files(known_sites)
+                return
+
             # Compile the raw tree
             all_aggregations_by_id: dict[str, BIAggregation] = {
                 x.id: x for x in self._bi_packs.get_all_aggregations()
             }
-            for aggregation in all_aggregations_by_id.values():
-                start = time.time()
-                self._compiled_aggregations[aggregation.id] = aggregation.compile(self.bi_searcher)
-                self._logger.debug(f"Compilation of {aggregation.id} took {time.time() - start:f}")
+            serialized_aggregations: dict[str, dict] = {}
+            compile_durations: dict[str, float] = {}
+            for compiled_aggr, result, duration in compile_aggregations(
+                list(all_aggregations_by_id.values()), self.bi_searcher
+            ):
+                self._compiled_aggregations[compiled_aggr.id] = compiled_aggr
+                serialized_aggregations[compiled_aggr.id] = result
+                compile_durations[compiled_aggr.id] = duration
+                self._logger.debug(f"Compilation of {compiled_aggr.id} took {duration:f}")
             self._verify_aggregation_title_uniqueness(self._compiled_aggregations)
 
-            for aggr_id, compiled_aggr in self._compiled_aggregations.items():
-                start = time.time()
-                result = compiled_aggr.serialize()
-                self._logger.debug(
-                    "Schema dump %s took config took %f (%d branches)"
-                    % (aggr_id, time.time() - start, len(compiled_aggr.branches))
-                )
+            for aggr_id, result in serialized_aggregations.items():
                 self._save_data(self._path_compiled_aggregations.joinpath(aggr_id), result)
+            self._log_compile_durations(compile_durations)
+            store.save_text_to_file(self._path_compilation_structure, structure_checksum)
 
             self._compiled_aggregations = self._manage_frozen_branches(self._compiled_aggregations)
             self._generate_part_of_aggregation_lookup(self._compiled_aggregations)
@@ -246,6 +395,26 @@ class BICompiler:
             str(self._path_compilation_timestamp), str(current_configstatus["configfile_timestamp"])
         )
 
+    def _compiled_structure_unchanged(
+        self, current_configstatus: ConfigStatus, structure_checksum: str
+    ) -> bool:
+        if current_configstatus["configfile_timestamp"] > self._get_compilation_timestamp():
+            return False
+        try:
+            return self._path_compilation_structure.read_text() == structure_checksum
+        except FileNotFoundError:
+            return False
+
+    def _log_compile_durations(self, compile_durations: dict[str, float]) -> None:
+        slowest = sorted(compile_durations.items(), key=lambda x: x[1], reverse=True)[:5]
+        self._logger.info(
+            "Compiled %d aggregations, most expensive: %s"
+            % (
+                len(compile_durations),
+                ", ".join(f"{aggr_id} ({duration:.2f}s)" for aggr_id, duration in slowest),
+            )
+        )
+
     def _cleanup_vanished_aggregations(self) -> None:
         valid_aggregations = list(self._compiled_aggregations.keys())
         for path_object in self._path_compiled_aggregations.iterdir():
@@ -4,16 +4,25 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import copy
+import threading
+import weakref
 from collections.abc import Iterator
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from cmk.utils.hostaddress import HostName
 from cmk.utils.plugin_registry import Registry
 from cmk.utils.servicename import ServiceName
 
 from cmk.bi.data_fetcher import BIStatusFetcher
-from cmk.bi.lib import NodeResultBundle, RequiredBIElement
-from cmk.bi.trees import BICompiledAggregation, BICompiledRule
+from cmk.bi.lib import (
+    ABCBICompiledNode,
+    ABCBIStatusFetcher,
+    BIAggregationComputationOptions,
+    BIHostSpec,
+    NodeResultBundle,
+    RequiredBIElement,
+)
+from cmk.bi.trees import BICompiledAggregation, BICompiledLeaf, BICompiledRule
 
 
 class BIAggregationFilter(NamedTuple):
@@ -53,14 +62,143 @@ class BIComputerPostprocessingRegistry(Registry[ABCPostprocessComputeResult]):
 bi_computer_postprocessing_registry = BIComputerPostprocessingRegistry()
 
 
+class _NodeCacheEntry(NamedTuple):
+    computation_options: BIAggregationComputationOptions
+    inputs: Any
+    result: NodeResultBundle | None
+
+
+class BINodeResultCache:
+    """Remembers the computed result of each compiled node together with its inputs
+
+    The inputs of a leaf are the status values it is computed from, the inputs of a
+    rule are the results of its child nodes. A node is only recomputed when its inputs
+    changed since the last computation, so a single state change only recomputes the
+    nodes on the path from the changed leaf up to the branch root. Unchanged branches
+    return the very same result objects as before.
+
+    The entries are bound to the compiled node objects. They vanish together with the
+    nodes once the compiled aggregations are reloaded or recompiled.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[
+            ABCBICompiledNode, _NodeCacheEntry
+        ] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def compute_branches(
+        self,
+        compiled_aggregation: BICompiledAggregation,
+        branches: list[BICompiledRule],
+        bi_status_fetcher: ABCBIStatusFetcher,
+    ) -> list[NodeResultBundle]:
+        assumed_state_ids = set(bi_status_fetcher.assumed_states)
+        computation_options = compiled_aggregation.computation_options
+        aggregation_results = []
+        for bi_compiled_branch in branches:
+            if assumed_state_ids.intersection(bi_compiled_branch.required_elements()):
+                # Assumed states are a temporary what-if view, not worth remembering
+                result = bi_compiled_branch.compute(
+                    computation_options, bi_status_fetcher, use_assumed=True
+                )
+            else:
+                result = self._compute_node(
+                    bi_compiled_branch, computation_options, bi_status_fetcher
+                )
+            if result is not None:
+                aggregation_results.append(result)
+        return aggregation_results
+
+    def _compute_node(
+        self,
+        node: ABCBICompiledNode,
+        computation_options: BIAggregationComputationOptions,
+        bi_status_fetcher: ABCBIStatusFetcher,
+    ) -> NodeResultBundle | None:
+        if isinstance(node, BICompiledLeaf):
+            inputs: Any = _leaf_inputs(node, bi_status_fetcher)
+        elif isinstance(node, BICompiledRule):
+            inputs = tuple(
+                self._compute_node(child, computation_options, bi_status_fetcher)
+                for child in node.nodes
+            )
+        else:
+            return node.compute(computation_options, bi_status_fetcher)
+
+        # The cache is shared by all threads of the process. Only the access to the entries is
+        # locked, the nodes are computed concurrently. Should two threads compute the same node,
+        # the result stored last wins, which is as good as the other one.
+        with self._lock:
+            entry = self._entries.get(node)
+            if (
+                entry is not None
+                and entry.computation_options is computation_options
+                and _same_inputs(node, entry.inputs, inputs)
+            ):
+                self.hits += 1
+                return entry.result
+            self.misses += 1
+
+        if isinstance(node, BICompiledRule):
+            result = node.compute_from_results(
+                [bundle for bundle in inputs if bundle is not None], computation_options
+            )
+        else:
+            result = node.compute(computation_options, bi_status_fetcher)
+        with self._lock:
+            self._entries[node] = _NodeCacheEntry(computation_options, inputs, result)
+        return result
+
+
+def _leaf_inputs(leaf: BICompiledLeaf, bi_status_fetcher: ABCBIStatusFetcher) -> tuple | None:
+    assert leaf.site_id is not None
+    host_row = bi_status_fetcher.states.get(BIHostSpec(leaf.site_id, leaf.host_name))
+    if host_row is None:
+        return None
+    if leaf.service_description is None:
+        # Everything except the services and the unused remaining columns
+        return (
+            host_row.state,
+            host_row.has_been_checked,
+            host_row.hard_state,
+            host_row.plugin_output,
+            host_row.scheduled_downtime_depth,
+            host_row.in_service_period,
+            host_row.acknowledged,
+        )
+    return (
+        host_row.scheduled_downtime_depth,
+        host_row.services_with_fullstate.get(leaf.service_description),
+    )
+
+
+def _same_inputs(node: ABCBICompiledNode, cached: Any, current: Any) -> bool:
+    if isinstance(node, BICompiledRule):
+        # An unchanged child node returns its cached result object
+        return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))
+    return bool(cached == current)
+
+
 class BIComputer:
     def __init__(
         self,
         compiled_aggregations: dict[str, BICompiledAggregation],
         bi_status_fetcher: BIStatusFetcher,
+        node_result_cache: BINodeResultCache | None = None,
     ) -> None:
         self._compiled_aggregations = compiled_aggregations
         self._bi_status_fetcher = bi_status_fetcher
+        self._node_result_cache = node_result_cache
         self._legacy_branch_cache: dict = {}
 
     def compute_aggregation_result(
@@ -113,10 +251,17 @@ class BIComputer:
     ) -> list[tuple[BICompiledAggregation, list[NodeResultBundle]]]:
         results = []
         for compiled_aggregation, branches in required_aggregations:
-            node_result_bundles = compiled_aggregation.compute_branches(
-                branches,
-                self._bi_status_fetcher,
-            )
+            if self._node_result_cache is None:
+                node_result_bundles = compiled_aggregation.compute_branches(
+                    branches,
+                    self._bi_status_fetcher,
+                )
+            else:
+                node_result_bundles = self._node_result_cache.compute_branches(
+                    compiled_aggregation,
+                    branches,
+                    self._bi_status_fetcher,
+                )
 
             # Postprocess results. Custom user plugins may add additional information for each node
             node_result_bundles = list(
@@ -3,15 +3,19 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import hashlib
 import marshal
 import os
+import struct
 import time
 from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 from livestatus import LivestatusColumn, LivestatusOutputFormat, LivestatusResponse, SiteId
 
 from cmk.utils.hostaddress import HostName
+from cmk.utils.log import logger
 from cmk.utils.paths import tmp_dir
 
 from cmk.bi.lib import (
@@ -62,12 +66,116 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+# Site structure files start with this header, followed by the marshalled index of the hosts
+# and the separately marshalled host records. Files without it contain a single marshalled
+# dict of all hosts (format of previous versions).
+_STRUCTURE_FILE_MAGIC = b"BISTRUC1"
+_STRUCTURE_FILE_HEADER = struct.Struct("!8sQ")
+
+# host name -> (checksum, offset, length) of the host record
+SiteStructureIndex = dict[HostName, tuple[str, int, int]]
+
+
+def host_structure_checksum(values: tuple) -> str:
+    """Checksum of the structure data of a host, independent of any set or dict ordering"""
+    # Note: repr instead of marshal, the output of marshal depends on the reference counts
+    return hashlib.blake2b(repr(_normalize_structure(values)).encode(), digest_size=16).hexdigest()
+
+
+def _normalize_structure(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((_normalize_structure(k), _normalize_structure(v)) for k, v in value.items()),
+                key=repr,
+            )
+        )
+    if isinstance(value, set | frozenset):
+        return tuple(sorted((_normalize_structure(x) for x in value), key=repr))
+    if isinstance(value, tuple | list):
+        return tuple(_normalize_structure(x) for x in value)
+    if isinstance(value, str):
+        # Drop types like HostName, their repr differs
+        return str(value)
+    return value
+
+
+def save_site_structure(filepath: Path, hosts: Mapping[HostName, tuple]) -> SiteStructureIndex:
+    """Write the structure data of a site, each host as a separately loadable record"""
+    index: SiteStructureIndex = {}
+    records = []
+    offset = 0
+    for host_name, values in hosts.items():
+        record = marshal.dumps(values)
+        index[host_name] = (host_structure_checksum(values), offset, len(record))
+        records.append(record)
+        offset += len(record)
+
+    raw_index = marshal.dumps(index)
+    with open(filepath, "wb") as f:
+        f.write(_STRUCTURE_FILE_HEADER.pack(_STRUCTURE_FILE_MAGIC, len(raw_index)))
+        f.write(raw_index)
+        for record in records:
+            f.write(record)
+        os.fsync(f.fileno())
+    return index
+
+
+def load_site_structure_index(filepath: Path) -> SiteStructureIndex:
+    """Read the host checksums of a structure file without loading the host records"""
+    with open(filepath, "rb") as f:
+        if (index := _read_structure_index(f)) is not None:
+            return index
+        f.seek(0)
+        return _index_of_hosts(marshal.load(f))
+
+
+def load_site_structure_with_index(
+    filepath: Path,
+) -> tuple[dict[HostName, tuple], SiteStructureIndex]:
+    """Read the structure data of a site together with the host checksums"""
+    with open(filepath, "rb") as f:
+        if (index := _read_structure_index(f)) is None:
+            f.seek(0)
+            hosts: dict[HostName, tuple] = marshal.load(f)
+            return hosts, _index_of_hosts(hosts)
+        records = f.read()
+    return {
+        host_name: marshal.loads(records[offset : offset + length])
+        for host_name, (_checksum, offset, length) in index.items()
+    }, index
+
+
+def _read_structure_index(f: Any) -> SiteStructureIndex | None:
+    header = f.read(_STRUCTURE_FILE_HEADER.size)
+    if len(header) < _STRUCTURE_FILE_HEADER.size:
+        return None
+    magic, index_length = _STRUCTURE_FILE_HEADER.unpack(header)
+    if magic != _STRUCTURE_FILE_MAGIC:
+        return None
+    return marshal.loads(f.read(index_length))
+
+
+def _index_of_hosts(hosts: Mapping[HostName, tuple]) -> SiteStructureIndex:
+    return {
+        host_name: (host_structure_checksum(values), 0, 0) for host_name, values in hosts.items()
+    }
+
+
+def site_structure_checksum(index: SiteStructureIndex) -> str:
+    return hashlib.sha256(
+        repr(sorted((host_name, entry[0]) for host_name, entry in index.items())).encode()
+    ).hexdigest()
+
+
 class BIStructureFetcher:
     def __init__(self, sites_callback: SitesCallback) -> None:
         self.sites_callback = sites_callback
+        self._logger = logger.getChild("bi.structure_fetcher")
         # The key may be a pattern / regex, so `str` is the correct type for the key.
         self._hosts: dict[str, BIHostData] = {}
         self._have_sites: set[SiteId] = set()
+        self._site_checksums: dict[SiteId, str] = {}
         self._path_lock_structure_cache = Path(get_cache_dir(), "bi_structure_cache.LOCK")
 
         self._site_cache_prefix = "bi_site_cache"
@@ -77,6 +185,15 @@ class BIStructureFetcher:
     def cleanup(self) -> None:
         self._have_sites.clear()
         self._hosts.clear()
+        self._site_checksums.clear()
+
+    def structure_checksum(self) -> str:
+        """Checksum over the structure data of all sites read so far
+
+        Stays the same as long as no host of these sites changed, e.g. across core
+        restarts without configuration changes.
+        """
+        return hashlib.sha256(repr(sorted(self._site_checksums.items())).encode()).hexdigest()
 
     @property
     def hosts(self) -> dict[str, BIHostData]:
@@ -123,7 +240,7 @@ class BIStructureFetcher:
         ):
             host_service_lookup.setdefault(row[1], []).append(row[2:])
 
-        site_data: dict[SiteId, dict] = {x: {} for x in only_sites}
+        site_data: dict[SiteId, dict[HostName, tuple]] = {x: {} for x in only_sites}
         for (
             site,
             host_name,
@@ -165,27 +282,60 @@ class BIStructureFetcher:
                 host_name,
             )
 
+        previous_files = self._latest_site_data_files()
         for site_id, hosts in site_data.items():
-            self.add_site_data(site_id, hosts)
             path = self._path_site_structure_data.joinpath(
                 self._site_data_filename(site_id, only_sites[site_id])
             )
-            self._marshal_save_data(path, hosts)
+            index = save_site_structure(path, hosts)
+            if previous_path := previous_files.get(site_id):
+                self._log_structure_changes(site_id, previous_path, index)
+
+            self.add_site_data(site_id, hosts)
+            self._site_checksums[site_id] = site_structure_checksum(index)
+
+    def _latest_site_data_files(self) -> dict[SiteId, Path]:
+        latest: dict[SiteId, tuple[int, Path]] = {}
+        for path_object, (site_id, timestamp) in self._get_site_data_files():
+            if site_id not in latest or latest[site_id][0] < timestamp:
+                latest[site_id] = (timestamp, path_object)
+        return {site_id: path_object for site_id, (_timestamp, path_object) in latest.items()}
+
+    def _log_structure_changes(
+        self, site_id: SiteId, previous_path: Path, index: SiteStructureIndex
+    ) -> None:
+        try:
+            previous_index = load_site_structure_index(previous_path)
+        except (OSError, ValueError, EOFError, TypeError):
+            return
+
+        changed_hosts = {
+            host_name
+            for host_name, entry in index.items()
+            if (previous_entry := previous_index.get(host_name)) is None
+            or previous_entry[0] != entry[0]
+        }
+        removed_hosts = previous_index.keys() - index.keys()
+        self._logger.debug(
+            "Structure of site %s: %d of %d hosts new or changed, %d removed"
+            % (site_id, len(changed_hosts), len(index), len(removed_hosts))
+        )
 
     def _read_cached_data(self, required_program_starts: set[SiteProgramStart]) -> None:
-        required_sites = {x[0] for x in required_program_starts}
-        for path_object, (site_id, _timestamp) in self._get_site_data_files():
+        for path_object, (site_id, timestamp) in self._get_site_data_files():
             if site_id in self._have_sites:
                 # This data was already read during the live query
                 continue
 
-            if site_id not in required_sites:
+            if (site_id, timestamp) not in required_program_starts:
                 # The data for this site is no longer required
                 # The site probably got disabled in the distributed monitoring page
+                # or this is the outdated data of a previous program start
                 continue
 
-            site_data = self._marshal_load_data(path_object)
+            site_data, index = load_site_structure_with_index(path_object)
             self.add_site_data(site_id, site_data)
+            self._site_checksums[site_id] = site_structure_checksum(index)
 
     @classmethod
     def _host_structure_columns(cls) -> list[str]:
@@ -266,15 +416,6 @@ class BIStructureFetcher:
             data_files.append((path_object, (SiteId(site_id), int(timestamp))))
         return data_files
 
-    def _marshal_save_data(self, filepath: Path, data: dict) -> None:
-        with open(filepath, "wb") as f:
-            marshal.dump(data, f)
-            os.fsync(f.fileno())
-
-    def _marshal_load_data(self, filepath: Path) -> dict:
-        with open(filepath, "rb") as f:
-            return marshal.load(f)
-
 
 #   .--BIState Fetcher-----------------------------------------------------.
 #   | ____ ___ ____  _        _         _____    _       _                 |
@@ -3,13 +3,15 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import bisect
 from collections.abc import Iterable, Mapping
 from typing import Any
 
+from cmk.utils.hostaddress import HostName
 from cmk.utils.labels import LabelGroups
 from cmk.utils.regex import regex
 from cmk.utils.rulesets.ruleset_matcher import matches_labels, matches_tag_condition, TagCondition
-from cmk.utils.tags import TagGroupID
+from cmk.utils.tags import TagGroupID, TagID
 
 from cmk.bi.lib import ABCBISearcher, BIHostData, BIHostSearchMatch, BIServiceSearchMatch
 
@@ -35,10 +37,21 @@ from cmk.bi.lib import ABCBISearcher, BIHostData, BIHostSearchMatch, BIServiceSe
 
 
 class BISearcher(ABCBISearcher):
+    def __init__(self) -> None:
+        super().__init__()
+        # Inverted indexes over the host structure, built once per set_hosts. The searches
+        # intersect them to narrow down the candidates before evaluating any conditions.
+        self._host_positions: dict[HostName, int] = {}
+        self._sorted_host_names: list[HostName] = []
+        self._hosts_by_tag: dict[tuple[TagGroupID, TagID], set[HostName]] = {}
+        self._hosts_by_label: dict[tuple[str, str], set[HostName]] = {}
+        self._hosts_by_folder: dict[str, set[HostName]] = {}
+
     def set_hosts(self, hosts: dict[str, BIHostData]) -> None:
         self.cleanup()
         # The key may be a pattern / regex, so `str` is the correct type for the key.
         self.hosts = hosts
+        self._build_indexes()
 
     def cleanup(self) -> None:
         # Note: Do not call clear() on hosts
@@ -46,16 +59,129 @@ class BISearcher(ABCBISearcher):
         self.hosts = {}
         self._host_regex_match_cache.clear()
         self._host_regex_miss_cache.clear()
+        self._host_positions = {}
+        self._sorted_host_names = []
+        self._hosts_by_tag = {}
+        self._hosts_by_label = {}
+        self._hosts_by_folder = {}
+
+    def _build_indexes(self) -> None:
+        self._host_positions = {host.name: idx for idx, host in enumerate(self.hosts.values())}
+        self._sorted_host_names = sorted(self._host_positions)
+        for host in self.hosts.values():
+            for tag in host.tags:
+                self._hosts_by_tag.setdefault(tag, set()).add(host.name)
+            for label in host.labels.items():
+                self._hosts_by_label.setdefault(label, set()).add(host.name)
+            # Register the host for every parent folder, see filter_host_folder
+            for idx, char in enumerate(host.folder):
+                if char == "/":
+                    self._hosts_by_folder.setdefault(host.folder[: idx + 1], set()).add(host.name)
 
     def search_hosts(self, conditions: dict) -> list[BIHostSearchMatch]:
-        hosts, matched_re_groups = self.filter_host_choice(
-            list(self.hosts.values()), conditions["host_choice"]
-        )
-        matched_hosts = self.filter_host_folder(hosts, conditions["host_folder"])
-        matched_hosts = self.filter_host_tags(matched_hosts, conditions["host_tags"])
+        if (candidates := self._indexed_candidates(conditions)) is None:
+            hosts = list(self.hosts.values())
+            filter_folder_and_tags = True
+        else:
+            hosts = [
+                self.hosts[name]
+                for name in sorted(candidates, key=self._host_positions.__getitem__)
+            ]
+            # The indexes resolve the folder and tag conditions exactly
+            filter_folder_and_tags = False
+
+        hosts, matched_re_groups = self.filter_host_choice(hosts, conditions["host_choice"])
+        matched_hosts: Iterable[BIHostData] = hosts
+        if filter_folder_and_tags:
+            matched_hosts = self.filter_host_folder(matched_hosts, conditions["host_folder"])
+            matched_hosts = self.filter_host_tags(matched_hosts, conditions["host_tags"])
         matched_hosts = self.filter_host_labels(matched_hosts, conditions["host_label_groups"])
         return [BIHostSearchMatch(x, matched_re_groups[x.name]) for x in matched_hosts]
 
+    def _indexed_candidates(self, conditions: dict) -> set[HostName] | None:
+        """Names of the hosts matching the folder and tag conditions
+
+        The result also considers the host name and label conditions as far as the indexes
+        can tell, so it may still contain hosts not matching them. Returns None if the
+        conditions do not restrict the hosts at all.
+        """
+        required: list[set[HostName]] = []
+        excluded: list[set[HostName]] = []
+
+        if folder_path := conditions["host_folder"]:
+            required.append(self._hosts_by_folder.get(f"{folder_path}/", set()))
+
+        for taggroup_id, tag_condition in conditions["host_tags"].items():
+            if isinstance(tag_condition, dict):
+                if "$ne" in tag_condition:
+                    excluded.append(self._hosts_of_tags(taggroup_id, [tag_condition["$ne"]]))
+                elif "$or" in tag_condition:
+                    required.append(self._hosts_of_tags(taggroup_id, tag_condition["$or"]))
+                elif "$nor" in tag_condition:
+                    excluded.append(self._hosts_of_tags(taggroup_id, tag_condition["$nor"]))
+                else:
+                    raise NotImplementedError()
+            else:
+                required.append(self._hosts_of_tags(taggroup_id, [tag_condition]))
+
+        required.extend(self._hosts_of_required_labels(conditions["host_label_groups"]))
+
+        host_choice = conditions["host_choice"]
+        if host_choice["type"] == "host_name_regex":
+            if (host_names := self._host_names_of_pattern(host_choice["pattern"])) is not None:
+                required.append(host_names)
+
+        if not required and not excluded:
+            return None
+
+        if required:
+            candidates = set.intersection(*sorted(required, key=len))
+        else:
+            candidates = set(self._host_positions)
+        return candidates.difference(*excluded)
+
+    def _hosts_of_tags(self, taggroup_id: TagGroupID, tag_ids: Iterable[Any]) -> set[HostName]:
+        return set().union(
+            *(self._hosts_by_tag.get((taggroup_id, tag_id), set()) for tag_id in tag_ids)
+        )
+
+    def _hosts_of_required_labels(self, label_groups: LabelGroups) -> Iterable[set[HostName]]:
+        # Only plain "and" groups of "and" labels can be resolved via the index. Everything else
+        # is left to the label filter.
+        for group_operator, label_group in label_groups:
+            if group_operator != "and":
+                continue
+            if any(label and label_operator != "and" for label_operator, label in label_group):
+                continue
+            for _label_operator, label in label_group:
+                if not label:
+                    continue
+                key, sep, value = label.partition(":")
+                if not sep or ":" in value:
+                    continue
+                yield self._hosts_by_label.get((key, value), set())
+
+    def _host_names_of_pattern(self, pattern: str) -> set[HostName] | None:
+        """Names of the hosts a host name pattern may match, None if all of them"""
+        if pattern == "(.*)":
+            return None
+
+        if not _is_host_name_regex(pattern):
+            return {HostName(pattern)} if pattern in self.hosts else set()
+
+        if not (prefix := _literal_prefix(pattern)):
+            return None
+        return set(self._host_names_with_prefix(prefix))
+
+    def _host_names_with_prefix(self, prefix: str) -> list[HostName]:
+        start = bisect.bisect_left(self._sorted_host_names, prefix)
+        end = start
+        while end < len(self._sorted_host_names) and self._sorted_host_names[end].startswith(
+            prefix
+        ):
+            end += 1
+        return self._sorted_host_names[start:end]
+
     def filter_host_choice(
         self,
         hosts: list[BIHostData],
@@ -83,8 +209,7 @@ class BISearcher(ABCBISearcher):
         if pattern == "(.*)":
             return hosts, self._host_match_groups(hosts)
 
-        is_regex_match = any(map(lambda x: x in pattern, ["(", ")", "*", "$", "|", "[", "]"]))
-        if not is_regex_match:
+        if not _is_host_name_regex(pattern):
             host = self.hosts.get(pattern)
             if host:
                 return [host], {pattern: (pattern,)}
@@ -95,6 +220,15 @@ class BISearcher(ABCBISearcher):
         if not pattern_with_anchor.endswith("$"):
             pattern_with_anchor += "$"
 
+        if len(hosts) == len(self.hosts) and (prefix := _literal_prefix(pattern)):
+            # Searching all hosts: Only the hosts starting with the literal prefix can match
+            hosts = [
+                self.hosts[name]
+                for name in sorted(
+                    self._host_names_with_prefix(prefix), key=self._host_positions.__getitem__
+                )
+            ]
+
         matched_hosts = []
         matched_re_groups = {}
         regex_pattern = regex(pattern_with_anchor)
@@ -214,3 +348,29 @@ class BISearcher(ABCBISearcher):
             if matches_labels(service_data.labels, required_label_groups):
                 matched_services.append(service)
         return matched_services
+
+
+def _is_host_name_regex(pattern: str) -> bool:
+    return any(map(lambda x: x in pattern, ["(", ")", "*", "$", "|", "[", "]"]))
+
+
+def _literal_prefix(pattern: str) -> str:
+    """The literal text every match of the pattern starts with
+
+    >>> _literal_prefix("web(.*)")
+    'web'
+    >>> _literal_prefix("webs?rv.*")
+    'web'
+    >>> _literal_prefix("db|web.*")
+    ''
+    """
+    if "|" in pattern:
+        # An alternative may start with anything else
+        return ""
+    for idx, char in enumerate(pattern):
+        if char in ".^$*+?{}[]\\|()":
+            if char in "*?{":
+                # The quantifier also makes the preceding character optional
+                return pattern[: max(idx - 1, 0)]
+            return pattern[:idx]
+    return pattern
@@ -361,15 +361,15 @@ class BICompiledRule(ABCBICompiledNode):
             ]
             if bundle is not None
         ]
+        if not use_assumed:
+            return self.compute_from_results(bundled_results, computation_options)
+
         if not bundled_results:
             return None
         actual_result = self._process_node_compute_result(
             [x.actual_result for x in bundled_results], computation_options
         )
 
-        if not use_assumed:
-            return NodeResultBundle(actual_result, None, bundled_results, self)
-
         assumed_result_items = [
             bundle.assumed_result if bundle.assumed_result is not None else bundle.actual_result
             for bundle in bundled_results
@@ -379,6 +379,19 @@ class BICompiledRule(ABCBICompiledNode):
         )
         return NodeResultBundle(actual_result, assumed_result, bundled_results, self)
 
+    def compute_from_results(
+        self,
+        bundled_results: list[NodeResultBundle],
+        computation_options: BIAggregationComputationOptions,
+    ) -> NodeResultBundle | None:
+        """Aggregate the already computed results of the child nodes, ignoring assumed states"""
+        if not bundled_results:
+            return None
+        actual_result = self._process_node_compute_result(
+            [x.actual_result for x in bundled_results], computation_options
+        )
+        return NodeResultBundle(actual_result, None, bundled_results, self)
+
     def _process_node_compute_result(
         self, results: list[NodeComputeResult], computation_options: BIAggregationComputationOptions
     ) -> NodeComputeResult:
@@ -16,6 +16,7 @@ import abc
 import ast
 import contextlib
 import errno
+import heapq
 import ipaddress
 import itertools
 import json
@@ -62,7 +63,6 @@ from .host_config import HostConfig
 from .perfcounters import Perfcounters
 from .query import (
     Columns,
-    filter_operator_in,
     MKClientError,
     Query,
     QueryCOMMAND,
@@ -99,6 +99,15 @@ Response = Iterable[Sequence[object]] | Mapping[str, object] | None
 
 LimitKind = Literal["overall", "by_rule", "by_host"]
 
+# Responses to GET queries are sent in pieces of (roughly) this size
+_RESPONSE_CHUNK_SIZE = 65536
+
+_LIMIT_HIT_COUNTERS: Mapping[LimitKind, str] = {
+    "overall": "overall_limit_hits",
+    "by_host": "host_limit_hits",
+    "by_rule": "rule_limit_hits",
+}
+
 
 # .
 #   .--Helper functions----------------------------------------------------.
@@ -358,8 +367,10 @@ class EventServer(ECServerThread):
         self._syslog_udp: socket.socket | None = None
         self._syslog_tcp: socket.socket | None = None
         self._snmp_trap_socket: socket.socket | None = None
+        self._snmp_trap_parser: SNMPTrapParser | None = None
 
         self._rules: list[Rule] = []
+        self._expecting_rules: list[Rule] = []
         self._rule_by_id: dict[str | None, Rule] = {}
         self._rule_hash: dict[int, dict[int, Any]] = {}
         self._hash_stats: list[list[int]] = []  # facility/priority
@@ -392,7 +403,7 @@ class EventServer(ECServerThread):
         self.open_snmptrap()
         self._snmp_trap_parser = SNMPTrapParser(
             self.settings, self._config, self._logger.getChild("snmp")
-        ).parse
+        )
 
     @classmethod
     def status_columns(cls) -> Columns:
@@ -402,6 +413,7 @@ class EventServer(ECServerThread):
                 Perfcounters.status_columns(),
                 cls._replication_columns(),
                 cls._event_limit_columns(),
+                cls._snmp_translation_columns(),
             )
         )
 
@@ -432,6 +444,14 @@ class EventServer(ECServerThread):
             ("status_event_limit_active_overall", False),
         ]
 
+    @classmethod
+    def _snmp_translation_columns(cls) -> Columns:
+        return [
+            ("status_snmp_translation_cache_hits", 0),
+            ("status_snmp_translation_cache_misses", 0),
+            ("status_snmp_translation_cache_hit_ratio", 0.0),
+        ]
+
     def get_status(self) -> Iterable[Sequence[object]]:
         return [
             [
@@ -439,6 +459,7 @@ class EventServer(ECServerThread):
                 *self._perfcounters.get_status(),
                 *self._add_replication_status(),
                 *self._add_event_limit_status(),
+                *self._add_snmp_translation_status(),
             ]
         ]
 
@@ -472,6 +493,14 @@ class EventServer(ECServerThread):
             self.is_overall_event_limit_active(),
         ]
 
+    def _add_snmp_translation_status(self) -> list[object]:
+        hits, misses = (
+            (0, 0)
+            if self._snmp_trap_parser is None
+            else self._snmp_trap_parser.translation_cache_info()
+        )
+        return [hits, misses, hits / (hits + misses) if hits + misses else 0.0]
+
     def create_pipe(self) -> None:
         path = self.settings.paths.event_pipe.value
         with contextlib.suppress(Exception):
@@ -737,7 +766,9 @@ class EventServer(ECServerThread):
 
     def create_events_from_trap(self, data: bytes, address: tuple[str, int]) -> Iterator[Event]:
         try:
-            if varbinds_and_ipaddress := self._snmp_trap_parser(data, address):
+            if self._snmp_trap_parser is None:
+                return
+            if varbinds_and_ipaddress := self._snmp_trap_parser.parse(data, address):
                 yield create_event_from_trap(varbinds_and_ipaddress[0], varbinds_and_ipaddress[1])
         except Exception:
             self._logger.exception("exception while handling an SNMP trap, skipping this one")
@@ -774,6 +805,11 @@ class EventServer(ECServerThread):
             self.hk_cleanup_downtime_events()
         self._history.housekeeping()
 
+    def do_event_timeouts(self) -> None:
+        """The part of the housekeeping which is cheap enough to be done every second"""
+        with self._event_status.lock, self._lock_configuration:
+            self.hk_handle_event_timeouts()
+
     def hk_cleanup_downtime_events(self) -> None:
         """
         For all events that have been created in a host downtime check the host
@@ -804,11 +840,13 @@ class EventServer(ECServerThread):
            time is elapsed.
         2. Automatically delete all events that are in state "open"
            and whose lifetime is elapsed.
+        Only the events which have reached their timeout (see _event_timeout()) are
+        looked at, so this is cheap enough to be done much more often than the rest of
+        the housekeeping.
         """
         events_to_delete: list[tuple[Event, HistoryWhat]] = []
-        events = self._event_status.events()
         now = time.time()
-        for event in events:
+        for event in self._event_status.pop_due_events(now, self._event_timeout):
             rule = self._rule_by_id.get(event["rule_id"])
 
             if event["phase"] == "counting":
@@ -859,6 +897,7 @@ class EventServer(ECServerThread):
                             event["last_token"] = (
                                 last_token + new_tokens * secs_per_token
                             )  # not now! would be unfair
+                            self._event_status.mark_event_changed(event)
                             if event["count"] == 0:
                                 self._logger.info(
                                     "Rule %s/%s, event %d: again without allowed rate, dropping event",
@@ -893,6 +932,7 @@ class EventServer(ECServerThread):
                         event["rule_id"],
                     )
                     event["phase"] = "open"
+                    self._event_status.mark_event_changed(event)
                     self._history.add(event, "DELAYOVER")
                     if rule:
                         event_has_opened(
@@ -929,6 +969,36 @@ class EventServer(ECServerThread):
         for event, reason in events_to_delete:
             self._event_status.remove_event(event, reason)
 
+    def _event_timeout(self, event: Event) -> float | None:
+        """
+        The point in time when hk_handle_event_timeouts() has to look at the event
+        again, None if there is nothing to do until the event is changed.
+        """
+        if event["phase"] == "counting":
+            rule = self._rule_by_id.get(event["rule_id"])
+            if not rule or ("count" not in rule and "expect" not in rule):
+                return 0  # orphaned, delete it as soon as possible
+            if "count" not in rule:
+                return None  # expecting rules are handled by hk_check_expected_messages()
+            count = rule["count"]
+            if count.get("algorithm") in ["tokenbucket", "dynabucket"]:
+                secs_per_token = count["period"] / float(count["count"])
+                if count["algorithm"] == "dynabucket":
+                    if event["count"] <= 1:
+                        secs_per_token = count["period"]
+                    else:
+                        secs_per_token *= float(count["count"]) / float(event["count"])
+                return event.get("last_token", event["first"]) + secs_per_token
+            return event["first"] + count["period"]
+
+        if event["phase"] == "delayed":
+            return event.get("delay_until", 0)
+
+        if "live_until" in event and event["phase"] in event.get("live_until_phases", ["open"]):
+            return event["live_until"]
+
+        return None
+
     def hk_check_expected_messages(self) -> None:
         """
         "Expecting"-rules are rules that require one or several
@@ -944,64 +1014,60 @@ class EventServer(ECServerThread):
            in that case.
         """
         now = time.time()
-        for rule in self._rules:
-            if "expect" in rule:
-                if not self._rule_matcher.event_rule_matches_site(rule, event={}):
-                    continue
+        for rule in self._expecting_rules:
+            if not self._rule_matcher.event_rule_matches_site(rule, event={}):
+                continue
 
-                # Interval is either a number of seconds, or pair of a number of seconds
-                # (e.g. 86400, meaning one day) and a timezone offset relative to UTC in hours.
-                interval = rule["expect"]["interval"]
-                expected_count = rule["expect"]["count"]
+            # Interval is either a number of seconds, or pair of a number of seconds
+            # (e.g. 86400, meaning one day) and a timezone offset relative to UTC in hours.
+            interval = rule["expect"]["interval"]
+            expected_count = rule["expect"]["count"]
 
-                interval_start = self._event_status.interval_start(rule["id"], interval)
-                if interval_start >= now:
-                    continue
+            interval_start = self._event_status.interval_start(rule["id"], interval)
+            if interval_start >= now:
+                continue
 
-                next_interval_start = self._event_status.next_interval_start(
-                    interval, interval_start
-                )
-                if next_interval_start > now:
-                    continue
+            next_interval_start = self._event_status.next_interval_start(interval, interval_start)
+            if next_interval_start > now:
+                continue
 
-                # Interval has been elapsed. Now comes the truth: do we have enough
-                # rule matches?
-
-                # First do not forget to switch to next interval
-                self._event_status.start_next_interval(rule["id"], interval)
-
-                # First look for case 1: rule that already have at least one hit
-                # and this events in the state "counting" exist.
-                events_to_delete: list[tuple[Event, HistoryWhat]] = []
-                events = self._event_status.events()
-                for event in events:
-                    if event["rule_id"] == rule["id"] and event["phase"] == "counting":
-                        # time has elapsed. Now lets see if we have reached
-                        # the necessary count:
-                        if event["count"] < expected_count:  # no -> trigger alarm
-                            events_to_delete.append((event, "AUTODELETE"))
-                            self._handle_absent_event(
-                                rule, event["count"], expected_count, event["last"]
-                            )
-                        else:  # yes -> everything is fine. Just log.
-                            self._logger.info(
-                                "Rule %s/%s has reached %d occurrences (%d required). "
-                                "Starting next period.",
-                                rule["pack"],
-                                rule["id"],
-                                event["count"],
-                                expected_count,
-                            )
-                        # Counting event is no longer needed.
-                        events_to_delete.append((event, "COUNTREACHED"))
-                        break
+            # Interval has been elapsed. Now comes the truth: do we have enough
+            # rule matches?
+
+            # First do not forget to switch to next interval
+            self._event_status.start_next_interval(rule["id"], interval)
+
+            # First look for case 1: rule that already have at least one hit
+            # and this events in the state "counting" exist.
+            events_to_delete: list[tuple[Event, HistoryWhat]] = []
+            for event in self._event_status.get_events_of_rule(rule["id"]):
+                if event["phase"] == "counting":
+                    # time has elapsed. Now lets see if we have reached
+                    # the necessary count:
+                    if event["count"] < expected_count:  # no -> trigger alarm
+                        events_to_delete.append((event, "AUTODELETE"))
+                        self._handle_absent_event(
+                            rule, event["count"], expected_count, event["last"]
+                        )
+                    else:  # yes -> everything is fine. Just log.
+                        self._logger.info(
+                            "Rule %s/%s has reached %d occurrences (%d required). "
+                            "Starting next period.",
+                            rule["pack"],
+                            rule["id"],
+                            event["count"],
+                            expected_count,
+                        )
+                    # Counting event is no longer needed.
+                    events_to_delete.append((event, "COUNTREACHED"))
+                    break
 
-                # Ou ou, no event found at all.
-                else:
-                    self._handle_absent_event(rule, 0, expected_count, interval_start)
+            # Ou ou, no event found at all.
+            else:
+                self._handle_absent_event(rule, 0, expected_count, interval_start)
 
-                for event, reason in events_to_delete:
-                    self._event_status.remove_event(event, reason)
+            for event, reason in events_to_delete:
+                self._event_status.remove_event(event, reason)
 
     def _handle_absent_event(
         self, rule: Rule, event_count: int, expected_count: int, interval_start: float
@@ -1050,6 +1116,7 @@ class EventServer(ECServerThread):
             # Better rewrite (again). Rule might have changed. Also we have changed
             # the text and the user might have his own text added via set_text.
             self.rewrite_event(rule, merge_event, {}, set_first=False)
+            self._event_status.mark_event_changed(merge_event)
             self._history.add(merge_event, "COUNTFAILED")
         else:
             # Create artificial event from scratch. Make sure that all important
@@ -1097,7 +1164,7 @@ class EventServer(ECServerThread):
         self._history = history
         self._snmp_trap_parser = SNMPTrapParser(
             self.settings, self._config, self._logger.getChild("snmp")
-        ).parse
+        )
         self.compile_rules(self._config["rule_packs"])
         self.host_config = HostConfig(self._logger)
         self._rule_matcher = RuleMatcher(
@@ -1109,6 +1176,7 @@ class EventServer(ECServerThread):
     def compile_rules(self, rule_packs: Sequence[ECRulePack]) -> None:
         """Precompile regular expressions and similar stuff."""
         self._rules = []
+        self._expecting_rules = []
         self._rule_by_id = {}
         # Speedup-Hash for rule execution
         self._rule_hash = {}
@@ -1134,6 +1202,8 @@ class EventServer(ECServerThread):
                     rule["pack"] = rule_pack["id"]
                     self._rules.append(rule)
                     self._rule_by_id[rule["id"]] = rule
+                    if "expect" in rule:
+                        self._expecting_rules.append(rule)
                     try:
                         compile_rule(rule)
                     except Exception:
@@ -1590,6 +1660,8 @@ class EventServer(ECServerThread):
         if num_already_open < limit:
             return False
 
+        self._perfcounters.count(_LIMIT_HIT_COUNTERS[ty])
+
         # Delete oldest messages if that is the configure method of keeping the limit
         if action == "delete_oldest":
             while num_already_open > limit:
@@ -1851,15 +1923,53 @@ class StatusTableEvents(StatusTable):
         # NOTE: We depend on the dict insertion order below, but this is guaranteed for Python >= 3.7.
         self._columns_dict = dict(self.columns)
 
-    def _enumerate(self, query: QueryGET) -> Iterable[Sequence[object]]:
-        for event in self._event_status.get_events():
-            # Optimize filters that are set by the check_mkevents active check. Since users
-            # may have a lot of those checks running, it is a good idea to optimize this.
-            if not query.only_host or filter_operator_in(event["host"], query.only_host):
-                yield [
-                    event.get(column_name[6:], default)
-                    for column_name, default in self._columns_dict.items()
-                ]
+    def query(self, query: QueryGET) -> Iterable[Sequence[object]]:
+        """
+        Unlike the other tables, we neither build full rows nor look at all events: The
+        filters are evaluated directly on the event dicts, the host and rule ID filters
+        are served from the indexes of the event status and only the requested columns
+        are put into the result rows.
+        """
+        yield query.requested_columns
+
+        # Unknown columns are answered with None, see requested_column_indexes()
+        projection = [
+            (column_name[6:], self._columns_dict[column_name])
+            if column_name in self._columns_dict
+            else None
+            for column_name in query.requested_columns
+        ]
+        filters = [
+            (f.column_name[6:], self._columns_dict[f.column_name], f.predicate)
+            for f in query.filters
+        ]
+
+        num_rows = 0
+        for event in self._candidate_events(query):
+            if query.limit is not None and num_rows >= query.limit:
+                break  # The maximum number of rows has been reached
+            if all(predicate(event.get(key, default)) for key, default, predicate in filters):
+                yield [None if p is None else event.get(p[0], p[1]) for p in projection]
+                num_rows += 1
+
+    def _candidate_events(self, query: QueryGET) -> Iterable[Event]:
+        """
+        A superset of the events matching the query: The indexes are only used for
+        narrowing down, all filters are still applied to the returned events.
+        """
+        for f in query.filters:
+            if f.column_name == "event_host":
+                if f.operator_name == "in":
+                    # Like filter_operator_in(), but once per host instead of once per event
+                    host_names = {host_name.lower() for host_name in f.argument}
+                    return self._event_status.get_events_of_hosts(
+                        lambda host: host.lower() in host_names
+                    )
+                if f.operator_name in ("=", "=~"):
+                    return self._event_status.get_events_of_hosts(f.predicate)
+            if f.column_name == "event_rule_id" and f.operator_name == "=":
+                return self._event_status.get_events_of_rule(f.argument)
+        return self._event_status.get_events()
 
 
 class StatusTableHistory(StatusTable):
@@ -2166,18 +2276,48 @@ class StatusServer(ECServerThread):
             raise NotImplementedError()  # Make mypy happy
 
         if query.output_format == "plain":
+            chunk = bytearray()
             for row in response:
-                client_socket.sendall(b"\t".join([quote_tab(c) for c in row]) + b"\n")
+                chunk += b"\t".join([quote_tab(c) for c in row]) + b"\n"
+                if len(chunk) >= _RESPONSE_CHUNK_SIZE:
+                    client_socket.sendall(chunk)
+                    chunk.clear()
+            client_socket.sendall(chunk)
 
         elif query.output_format == "json":
-            client_socket.sendall((json.dumps(list(response)) + "\n").encode("utf-8"))
+            self._answer_query_streamed(client_socket, response, json.dumps)
 
         elif query.output_format == "python":
-            self._answer_query_python(client_socket, list(response))
+            self._answer_query_streamed(client_socket, response, repr)
 
         else:
             raise NotImplementedError()
 
+    def _answer_query_streamed(
+        self,
+        client_socket: socket.socket,
+        response: Iterable[Sequence[object]],
+        serialize: Callable[[Sequence[object]], str],
+    ) -> None:
+        """
+        Sends the same as serializing the list of all rows at once would do, but
+        without ever having the complete response or its serialization in memory.
+        """
+        chunk = ["["]
+        chunk_size = 1
+        separator = ""
+        for row in response:
+            serialized_row = separator + serialize(row)
+            separator = ", "
+            chunk.append(serialized_row)
+            chunk_size += len(serialized_row)
+            if chunk_size >= _RESPONSE_CHUNK_SIZE:
+                client_socket.sendall("".join(chunk).encode("utf-8"))
+                chunk = []
+                chunk_size = 0
+        chunk.append("]\n")
+        client_socket.sendall("".join(chunk).encode("utf-8"))
+
     def _answer_query_python(self, client_socket: socket.socket, response: Response) -> None:
         client_socket.sendall((repr(response) + "\n").encode("utf-8"))
 
@@ -2253,6 +2393,7 @@ class StatusServer(ECServerThread):
                 event["contact"] = contact
             if user:
                 event["owner"] = user
+            self._event_status.mark_event_changed(event)
             self._history.add(event, "UPDATE", user)
 
     def handle_command_create(self, arguments: list[str]) -> None:
@@ -2271,6 +2412,7 @@ class StatusServer(ECServerThread):
             event["state"] = int(newstate)
             if user:
                 event["owner"] = user
+            self._event_status.mark_event_changed(event)
             self._history.add(event, "CHANGESTATE", user)
 
     def handle_command_reload(self) -> None:
@@ -2318,6 +2460,7 @@ class StatusServer(ECServerThread):
         event: Event | None = self._event_status.event(int(event_id))
         if user and event is not None:
             event["owner"] = user
+            self._event_status.mark_event_changed(event)
 
         # TODO: De-duplicate code from do_event_actions()
         if action_id == "@NOTIFY" and event is not None:
@@ -2412,6 +2555,7 @@ def run_eventd(  # pylint: disable=too-many-branches
     next_housekeeping = now + config["housekeeping_interval"]
     next_retention = now + config["retention_interval"]
     next_statistics = now + config["statistics_interval"]
+    next_event_timeouts = now + 1
     next_replication = 0.0  # force immediate replication after restart
 
     while not terminate_main_event.is_set():
@@ -2421,7 +2565,12 @@ def run_eventd(  # pylint: disable=too-many-branches
                 # maximum 60 seconds. That way changes of the interval from a very
                 # high to a low value will never require more than 60 seconds
 
-                event_list = [next_housekeeping, next_retention, next_statistics]
+                event_list = [
+                    next_housekeeping,
+                    next_retention,
+                    next_statistics,
+                    next_event_timeouts,
+                ]
                 if is_replication_slave(config):
                     event_list.append(next_replication)
 
@@ -2432,6 +2581,10 @@ def run_eventd(  # pylint: disable=too-many-branches
                 if now > next_housekeeping:
                     event_server.do_housekeeping()
                     next_housekeeping = now + config["housekeeping_interval"]
+                elif now > next_event_timeouts:
+                    # Delays and lifetimes of events should not depend on the housekeeping interval
+                    event_server.do_event_timeouts()
+                next_event_timeouts = now + 1
 
                 if now > next_retention:
                     with event_status.lock:
@@ -2521,11 +2674,15 @@ class EventStatus:
         self.lock = threading.Lock()
         self._history = history
         self._logger = logger
+        # Increases with every snapshot, journal entries of other generations are stale
+        self._journal_generation = 0
         self.flush()
 
     def reload_configuration(self, config: Config, history: History) -> None:
         self._config = config
         self._history = history
+        # The timeouts of counting events depend on their rules
+        self.reschedule_event_timeouts()
 
     def flush(self) -> None:
         # TODO: Improve types!
@@ -2535,6 +2692,8 @@ class EventStatus:
         # needed for expecting rules
         self._interval_starts: dict[str, int] = {}
         self._initialize_event_limit_status()
+        self.reschedule_event_timeouts()
+        self._reset_journal()
 
         # TODO: might introduce some performance counters, like:
         # - number of received messages
@@ -2608,21 +2767,103 @@ class EventStatus:
         self._events = status["events"]
         self._rule_stats = status["rule_stats"]
         self._interval_starts = status["interval_starts"]
+        self._initialize_event_limit_status()
+        self.reschedule_event_timeouts()
+        # The events have been replaced as a whole, the journal can not describe that.
+        self._reset_journal()
+
+    def _reset_journal(self) -> None:
+        """Forget all pending changes and enforce a full snapshot on the next save"""
+        self._changed_events: dict[int, Event] = {}
+        self._removed_event_ids: set[int] = set()
+        self._num_journaled_events = 0
+        # Keep the generation: Only a new one makes the entries of the current journal stale
+        self._needs_compaction = True
+
+    def mark_event_changed(self, event: Event) -> None:
+        """
+        Events are modified in place all over the place. Everyone doing that on
+        an event which is already known to the status has to call this, otherwise
+        the change is only persisted with the next compaction of the journal.
+        """
+        self._changed_events[event["id"]] = event
+        self._events_to_schedule[event["id"]] = event
+        # Rewriting may have moved the event to another host or rule.
+        limit_keys = self._limit_keys.get(event["id"])
+        if limit_keys is not None and limit_keys != (
+            (event["host"], event["core_host"]),
+            event["rule_id"],
+        ):
+            self._reindex_event(event)
 
     def save_status(self) -> None:
+        """
+        The status is persisted as a snapshot (the full status) plus a journal of
+        changed and removed events since that snapshot. A regular save only appends
+        the pending changes to the journal, so its cost depends on the change rate,
+        not on the number of existing events. As soon as the journal has grown
+        beyond the size of the snapshot, both are compacted into a new snapshot.
+        """
+        if self._needs_compaction or self._num_journaled_events + len(self._changed_events) > max(
+            len(self._events), 1000
+        ):
+            self._save_snapshot()
+        else:
+            self._append_to_journal()
+
+    def _save_snapshot(self) -> None:
         now = time.time()
         status = self.pack_status()
         path = self.settings.paths.status_file.value
         path_new = path.parent / (path.name + ".new")
+        generation = self._journal_generation + 1
         # Believe it or not: cPickle is more than two times slower than repr()
         with path_new.open(mode="wb") as f:
-            f.write((repr(status) + "\n").encode("utf-8"))
+            f.write((repr({**status, "journal_generation": generation}) + "\n").encode("utf-8"))
             f.flush()
             os.fsync(f.fileno())
         path_new.rename(path)
+        # Journal entries of older generations are ignored during loading, so it
+        # does not matter if we die before removing the old journal.
+        self.settings.paths.status_journal_file.value.unlink(missing_ok=True)
+        self._changed_events = {}
+        self._removed_event_ids = set()
+        self._num_journaled_events = 0
+        self._journal_generation = generation
+        self._needs_compaction = False
         elapsed = time.time() - now
         self._logger.log(VERBOSE, "Saved event state to %s in %.3fms.", path, elapsed * 1000)
 
+    def _append_to_journal(self) -> None:
+        now = time.time()
+        path = self.settings.paths.status_journal_file.value
+        num_changed = len(self._changed_events)
+        num_removed = len(self._removed_event_ids)
+        entry = {
+            "journal_generation": self._journal_generation,
+            "next_event_id": self._next_event_id,
+            "rule_stats": self._rule_stats,
+            "interval_starts": self._interval_starts,
+            "changed": list(self._changed_events.values()),
+            "removed": sorted(self._removed_event_ids),
+        }
+        with path.open(mode="ab") as f:
+            f.write((repr(entry) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self._num_journaled_events += num_changed + num_removed
+        self._changed_events = {}
+        self._removed_event_ids = set()
+        elapsed = time.time() - now
+        self._logger.log(
+            VERBOSE,
+            "Appended %d changed and %d removed events to %s in %.3fms.",
+            num_changed,
+            num_removed,
+            path,
+            elapsed * 1000,
+        )
+
     def reset_counters(self, rule_id: str | None) -> None:
         if rule_id:
             if rule_id in self._rule_stats:
@@ -2640,10 +2881,12 @@ class EventStatus:
                 self._events = status["events"]
                 self._rule_stats = status["rule_stats"]
                 self._interval_starts = status.get("interval_starts", {})
+                self._journal_generation = status.get("journal_generation", 0)
                 self._logger.info("Loaded event state from %s.", path)
             except Exception:
                 self._logger.exception(f"Error loading event state from {path}")
                 raise
+            self._replay_journal()
 
         # Add new columns and fix broken events
         for event in self._events:
@@ -2658,6 +2901,41 @@ class EventStatus:
 
         # core_host is needed to initialize the status
         self._initialize_event_limit_status()
+        self.reschedule_event_timeouts()
+
+    def _replay_journal(self) -> None:
+        path = self.settings.paths.status_journal_file.value
+        if not path.exists():
+            self._needs_compaction = False
+            return
+
+        events_by_id = {event["id"]: event for event in self._events}
+        num_entries = 0
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = ast.literal_eval(line)
+                except (SyntaxError, ValueError):
+                    # Only the last entry can be incomplete, e.g. when we crashed during writing.
+                    self._logger.warning("Ignoring incomplete entry in %s", path)
+                    break
+                if entry["journal_generation"] != self._journal_generation:
+                    continue  # left over from before the last compaction
+                self._next_event_id = entry["next_event_id"]
+                self._rule_stats = entry["rule_stats"]
+                self._interval_starts = entry["interval_starts"]
+                for event in entry["changed"]:
+                    events_by_id[event["id"]] = event
+                for event_id in entry["removed"]:
+                    events_by_id.pop(event_id, None)
+                num_entries += 1
+
+        # Event IDs are increasing and the dict keeps the position of updated events,
+        # so this is still the order of creation.
+        self._events = list(events_by_id.values())
+        # Start a fresh snapshot, replaying the same journal again makes no sense.
+        self._needs_compaction = True
+        self._logger.info("Replayed %d entries of event state journal %s.", num_entries, path)
 
     def _initialize_event_limit_status(self) -> None:
         """
@@ -2669,27 +2947,93 @@ class EventStatus:
 
         self.num_existing_events_by_host: dict[tuple[str, HostName | None], int] = {}
         self.num_existing_events_by_rule: dict[Any, int] = {}
+        # Events per host/rule in order of creation (dicts keep the insertion order),
+        # so finding the oldest one is as cheap as counting.
+        self._events_by_host: dict[tuple[str, HostName | None], dict[int, Event]] = {}
+        self._events_by_rule: dict[Any, dict[int, Event]] = {}
+        # The host and rule an event has been counted for. Both can be rewritten
+        # when counting up an event, but it has to be uncounted from the same place.
+        self._limit_keys: dict[int, tuple[tuple[str, HostName | None], Any]] = {}
         for event in self._events:
             self._count_event_add(event)
 
     def _count_event_add(self, event: Event) -> None:
         host_key = (event["host"], event["core_host"])
+        rule_id = event["rule_id"]
+        self._limit_keys[event["id"]] = (host_key, rule_id)
+
         if host_key not in self.num_existing_events_by_host:
             self.num_existing_events_by_host[host_key] = 1
         else:
             self.num_existing_events_by_host[host_key] += 1
+        self._events_by_host.setdefault(host_key, {})[event["id"]] = event
 
-        if event["rule_id"] not in self.num_existing_events_by_rule:
-            self.num_existing_events_by_rule[event["rule_id"]] = 1
+        if rule_id not in self.num_existing_events_by_rule:
+            self.num_existing_events_by_rule[rule_id] = 1
         else:
-            self.num_existing_events_by_rule[event["rule_id"]] += 1
+            self.num_existing_events_by_rule[rule_id] += 1
+        self._events_by_rule.setdefault(rule_id, {})[event["id"]] = event
 
     def _count_event_remove(self, event: Event) -> None:
-        host_key = (event["host"], event["core_host"])
+        host_key, rule_id = self._limit_keys.pop(event["id"])
 
-        self.num_existing_events -= 1
         self.num_existing_events_by_host[host_key] -= 1
-        self.num_existing_events_by_rule[event["rule_id"]] -= 1
+        self.num_existing_events_by_rule[rule_id] -= 1
+
+        events_of_host = self._events_by_host[host_key]
+        del events_of_host[event["id"]]
+        if not events_of_host:
+            del self._events_by_host[host_key]
+
+        events_of_rule = self._events_by_rule[rule_id]
+        del events_of_rule[event["id"]]
+        if not events_of_rule:
+            del self._events_by_rule[rule_id]
+
+    def _reindex_event(self, event: Event) -> None:
+        """Move an event to the counters and indexes of its current host and rule"""
+        self._count_event_remove(event)
+        self._count_event_add(event)
+
+    def reschedule_event_timeouts(self) -> None:
+        """
+        Forget all scheduled timeouts and compute them again for all events, e.g.
+        because the rules they depend on may have changed.
+        """
+        # Heap of (timeout, event ID), _scheduled_timeouts is the truth: Entries
+        # which do not agree with it are outdated and simply skipped.
+        self._timeouts: list[tuple[float, int]] = []
+        self._scheduled_timeouts: dict[int, tuple[float, Event]] = {}
+        self._events_to_schedule: dict[int, Event] = {event["id"]: event for event in self._events}
+
+    # protected by self.lock
+    def pop_due_events(
+        self, now: float, get_timeout: Callable[[Event], float | None]
+    ) -> list[Event]:
+        """
+        Returns the events whose timeout has been reached. The timeouts are computed
+        by get_timeout() lazily for all new or changed events, None means that the
+        event has no timeout (yet). Due events are scheduled again with the next call,
+        so the caller can change them as needed.
+        """
+        for event_id, event in self._events_to_schedule.items():
+            self._scheduled_timeouts.pop(event_id, None)
+            if (timeout := get_timeout(event)) is not None:
+                self._scheduled_timeouts[event_id] = (timeout, event)
+                heapq.heappush(self._timeouts, (timeout, event_id))
+        self._events_to_schedule = {}
+
+        due_events = []
+        while self._timeouts and self._timeouts[0][0] <= now:
+            timeout, event_id = heapq.heappop(self._timeouts)
+            scheduled = self._scheduled_timeouts.get(event_id)
+            if scheduled is None or scheduled[0] != timeout:
+                continue  # outdated entry
+            del self._scheduled_timeouts[event_id]
+            event = scheduled[1]
+            self._events_to_schedule[event_id] = event
+            due_events.append(event)
+        return due_events
 
     def new_event(self, event: Event) -> None:
         self._perfcounters.count("events")
@@ -2698,6 +3042,7 @@ class EventStatus:
         self._events.append(event)
         self.num_existing_events += 1
         self._count_event_add(event)
+        self.mark_event_changed(event)
         self._history.add(event, "NEW")
 
     def archive_event(self, event: Event) -> None:
@@ -2711,7 +3056,12 @@ class EventStatus:
         try:
             self._events.remove(event)
             self._history.add(event, delete_reason, user)
+            self.num_existing_events -= 1
             self._count_event_remove(event)
+            self._changed_events.pop(event["id"], None)
+            self._removed_event_ids.add(event["id"])
+            self._events_to_schedule.pop(event["id"], None)
+            self._scheduled_timeouts.pop(event["id"], None)
         except ValueError:
             self._logger.exception("Cannot remove event %d: not present", event["id"])
 
@@ -2726,21 +3076,17 @@ class EventStatus:
             self._remove_oldest_event_of_rule(event["rule_id"])
         elif ty == "by_host" and event["host"] is not None:
             self._logger.log(VERBOSE, '  Removing oldest event of host "%s"', event["host"])
-            self._remove_oldest_event_of_host(event["host"])
+            self._remove_oldest_event_of_host((event["host"], event["core_host"]))
 
     # protected by self.lock
     def _remove_oldest_event_of_rule(self, rule_id: str) -> None:
-        for event in self._events:
-            if event["rule_id"] == rule_id:
-                self.remove_event(event, "AUTODELETE")
-                return
+        if events_of_rule := self._events_by_rule.get(rule_id):
+            self.remove_event(next(iter(events_of_rule.values())), "AUTODELETE")
 
     # protected by self.lock
-    def _remove_oldest_event_of_host(self, hostname: str) -> None:
-        for event in self._events:
-            if event["host"] == hostname:
-                self.remove_event(event, "AUTODELETE")
-                return
+    def _remove_oldest_event_of_host(self, host_key: tuple[str, HostName | None]) -> None:
+        if events_of_host := self._events_by_host.get(host_key):
+            self.remove_event(next(iter(events_of_host.values())), "AUTODELETE")
 
     # protected by self.lock
     def get_num_existing_events_by(self, ty: LimitKind, event: Event) -> int:
@@ -2947,6 +3293,7 @@ class EventStatus:
                 preserve["contact"] = found["contact"]
         found.update(event)
         found.update(preserve)
+        self.mark_event_changed(found)
 
     def count_expected_event(self, event_server: EventServer, event: Event) -> None:
         for ev in self._events:
@@ -3017,6 +3364,21 @@ class EventStatus:
     def get_events(self) -> Iterable[Event]:
         return self._events
 
+    def get_events_of_hosts(self, matches: Callable[[str], bool]) -> Iterable[Event]:
+        """The events of all hosts accepted by matches, in order of creation"""
+        events = [
+            event
+            for (host, _core_host), events_of_host in self._events_by_host.items()
+            if matches(host)
+            for event in events_of_host.values()
+        ]
+        events.sort(key=lambda event: event["id"])
+        return events
+
+    def get_events_of_rule(self, rule_id: str) -> Iterable[Event]:
+        """The events of a rule, in order of creation"""
+        return sorted(self._events_by_rule.get(rule_id, {}).values(), key=lambda event: event["id"])
+
     def get_rule_stats(self) -> Iterable[tuple[str, int]]:
         return sorted(self._rule_stats.items(), key=lambda x: x[0])
 
@@ -28,6 +28,9 @@ class Perfcounters:
         "overflows",
         "events",
         "connects",
+        "overall_limit_hits",
+        "host_limit_hits",
+        "rule_limit_hits",
     ]
 
     # Average processing times
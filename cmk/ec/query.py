@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import abc
 import operator
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
@@ -56,11 +55,10 @@ class StatusTable:
     prefix: str | None = None
     columns: Columns = []
 
-    @abc.abstractmethod
     def _enumerate(self, query: QueryGET) -> Iterable[Sequence[object]]:
         """
         Must return a enumerable type containing fully populated lists (rows) matching the
-        columns of the table.
+        columns of the table. Only needed by tables which do not override query().
         """
         raise NotImplementedError()
 
@@ -122,8 +120,7 @@ class Query:
 
 
 def filter_operator_in(a: Any, b: Any) -> bool:
-    """Implemented as a named function, as it is used in a second filter
-    cmk.ec.main: StatusTableEvents._enumerate
+    """Case insensitive membership test
     not implemented as regex/IGNORECASE due to performance"""
     return a.lower() in (e.lower() for e in b)
 
@@ -172,8 +169,6 @@ class QueryGET(Query):
         # NOTE: history's _get_mongodb and _get_files access filters and limits directly.
         self.filters: list[QueryFilter] = []
         self.limit: int | None = None
-        # NOTE: StatusTableEvents uses only_host for optimization.
-        self.only_host: set[Any] | None = None
         self._parse_header_lines(raw_query, logger)
 
     def _parse_header_lines(self, raw_query: list[str], logger: Logger) -> None:
@@ -194,11 +189,7 @@ class QueryGET(Query):
         elif header == "Columns":
             self.requested_columns = argument.split(" ")
         elif header == "Filter":
-            f = self._parse_filter(argument)
-            # Needed for later optimization (check_mkevents)
-            if f.column_name == "event_host" and f.operator_name == "in":
-                self.only_host = set(f.argument)
-            self.filters.append(f)
+            self.filters.append(self._parse_filter(argument))
         elif header == "Limit":
             self.limit = int(argument)
         else:
@@ -3,11 +3,12 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import functools
 import traceback
 from collections.abc import Iterable, Mapping
 from logging import Logger
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import pyasn1.error
 import pysnmp.debug  # type: ignore[import]
@@ -18,6 +19,7 @@ import pysnmp.proto.api  # type: ignore[import]
 import pysnmp.proto.errind  # type: ignore[import]
 import pysnmp.proto.rfc1155  # type: ignore[import]
 import pysnmp.proto.rfc1902  # type: ignore[import]
+import pysnmp.proto.rfc1905  # type: ignore[import]
 import pysnmp.smi.builder  # type: ignore[import]
 import pysnmp.smi.error  # type: ignore[import]
 import pysnmp.smi.rfc1902  # type: ignore[import]
@@ -34,6 +36,9 @@ from .settings import Settings
 VarBind = tuple[pysnmp.proto.rfc1902.ObjectName, SimpleAsn1Type]
 VarBinds = Iterable[VarBind]
 
+# Number of resolved OIDs to remember, traps of the same devices tend to repeat them
+_TRANSLATION_CACHE_SIZE = 10000
+
 
 class SNMPTrapParser:
     # Disable receiving of SNMPv3 INFORM messages. We do not support them (yet)
@@ -42,6 +47,7 @@ class SNMPTrapParser:
 
     def __init__(self, settings: Settings, config: Config, logger: Logger) -> None:
         self._logger = logger
+        self._snmp_trap_translator: SNMPTrapTranslator | None = None
         if settings.options.snmptrap_udp is None:
             return
         self.snmp_engine = pysnmp.entity.engine.SnmpEngine()
@@ -180,10 +186,17 @@ class SNMPTrapParser:
         # sender_address contains a (host: str, port: int) tuple
         ipaddress: str = self.snmp_engine.getUserContext("sender_address")[0]
         self._log_snmptrap_details(context_engine_id, context_name, var_binds, ipaddress)
+        assert self._snmp_trap_translator is not None
         trap = self._snmp_trap_translator.translate(ipaddress, var_binds)
         # NOTE: There can be only one trap per PDU, so we don't run into the risk of overwriting previous info.
         self._varbinds_and_ipaddress = trap, ipaddress
 
+    def translation_cache_info(self) -> tuple[int, int]:
+        """Hits and misses of the translation cache"""
+        if self._snmp_trap_translator is None:
+            return 0, 0
+        return self._snmp_trap_translator.cache_info()
+
     def _log_snmptrap_details(
         self,
         context_engine_id: pysnmp.smi.rfc1902.ObjectIdentity,
@@ -253,6 +266,21 @@ class SNMPTrapTranslator:
                 self.translate = self._translate_via_mibs
             case _:
                 raise Exception("invalid SNMP trap translation")
+        # Resolving via the MIB view is expensive, but it only depends on the OID (and on the
+        # syntax of the value), not on the value itself. The caches are never invalidated: We
+        # are constructed again whenever the configuration is reloaded, which is the case after
+        # MIBs have been uploaded, too.
+        self._resolve_oid_cached = functools.lru_cache(maxsize=_TRANSLATION_CACHE_SIZE)(
+            self._resolve_oid
+        )
+        self._var_bind_rendering_cached = functools.lru_cache(maxsize=_TRANSLATION_CACHE_SIZE)(
+            self._var_bind_rendering
+        )
+
+    def cache_info(self) -> tuple[int, int]:
+        """Hits and misses of the translation cache"""
+        info = self._var_bind_rendering_cached.cache_info()
+        return info.hits, info.misses
 
     @staticmethod
     def _construct_resolver(
@@ -334,15 +362,53 @@ class SNMPTrapTranslator:
     def _translate_binding_via_mibs(
         self, oid: pysnmp.proto.rfc1902.ObjectName, value: SimpleAsn1Type
     ) -> tuple[str, str]:
-        # Disable mib_var[0] type detection
-        mib_var = pysnmp.smi.rfc1902.ObjectType(
-            pysnmp.smi.rfc1902.ObjectIdentity(oid), value
-        ).resolveWithMib(self._mib_resolver)
-        node = mib_var[0].getMibNode()
-        translated_oid = mib_var[0].prettyPrint().replace('"', "")
-        translated_value = mib_var[1].prettyPrint()
+        rendering = self._var_bind_rendering_cached(oid, value.__class__)
+        if rendering.syntax is not None:
+            try:
+                value = rendering.syntax.clone(value)
+            except pyasn1.error.PyAsn1Error:
+                pass  # Like pysnmp does, we simply keep values we can not cast
+        if pysnmp.proto.rfc1902.ObjectIdentifier().isSuperTypeOf(value, matchConstraints=False):
+            translated_value = self._resolve_oid_cached(value)[0]
+        else:
+            translated_value = value.prettyPrint()
+        return rendering.oid, translated_value + rendering.suffix
+
+    def _resolve_oid(self, oid: pysnmp.proto.rfc1902.ObjectName) -> tuple[str, Any]:
+        """The symbolic name and the MIB node of an OID"""
+        identity = pysnmp.smi.rfc1902.ObjectIdentity(oid).resolveWithMib(self._mib_resolver)
+        return identity.prettyPrint(), identity.getMibNode()
+
+    def _var_bind_rendering(
+        self, oid: pysnmp.proto.rfc1902.ObjectName, value_type: type
+    ) -> "_VarBindRendering":
+        """Everything needed to render the values of an OID, see ObjectType.resolveWithMib()"""
+        name, node = self._resolve_oid_cached(oid)
+        assert self._mib_resolver is not None
+        mib_scalar, mib_table_column = self._mib_resolver.mibBuilder.importSymbols(
+            "SNMPv2-SMI", "MibScalar", "MibTableColumn"
+        )
+        if not isinstance(node, (mib_scalar, mib_table_column)) or issubclass(
+            value_type,
+            (
+                pysnmp.proto.rfc1905.UnSpecified,
+                pysnmp.proto.rfc1905.NoSuchObject,
+                pysnmp.proto.rfc1905.NoSuchInstance,
+                pysnmp.proto.rfc1905.EndOfMibView,
+            ),
+        ):
+            syntax = None
+        else:
+            syntax = node.getSyntax()
+        suffix = ""
         if units := getattr(node, "getUnits", lambda: "")():
-            translated_value += f" {units}"
+            suffix += f" {units}"
         if description := getattr(node, "getDescription", lambda: "")():
-            translated_value += f"({description})"
-        return translated_oid, translated_value
+            suffix += f"({description})"
+        return _VarBindRendering(oid=name.replace('"', ""), syntax=syntax, suffix=suffix)
+
+
+class _VarBindRendering(NamedTuple):
+    oid: str
+    syntax: SimpleAsn1Type | None
+    suffix: str
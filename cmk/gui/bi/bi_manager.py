@@ -12,10 +12,14 @@ from cmk.gui import sites
 from cmk.gui.i18n import _
 
 from cmk.bi.compiler import BICompiler
-from cmk.bi.computer import BIComputer
+from cmk.bi.computer import BIComputer, BINodeResultCache
 from cmk.bi.data_fetcher import BIStatusFetcher
 from cmk.bi.lib import SitesCallback
 
+# Shared by all requests of this process, so that a view refresh only recomputes the
+# aggregation nodes whose states changed since the previous computation
+_node_result_cache = BINodeResultCache()
+
 
 class BIManager:
     def __init__(self) -> None:
@@ -23,7 +27,9 @@ class BIManager:
         self.compiler = BICompiler(self.bi_configuration_file(), sites_callback)
         self.compiler.load_compiled_aggregations()
         self.status_fetcher = BIStatusFetcher(sites_callback)
-        self.computer = BIComputer(self.compiler.compiled_aggregations, self.status_fetcher)
+        self.computer = BIComputer(
+            self.compiler.compiled_aggregations, self.status_fetcher, _node_result_cache
+        )
 
     @classmethod
     def bi_configuration_file(cls) -> str:
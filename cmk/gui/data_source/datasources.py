@@ -12,7 +12,7 @@ from cmk.gui.type_defs import ColumnName, Rows, SingleInfos, VisualContext
 from cmk.gui.visuals.filter import Filter
 
 from .base import ABCDataSource, RowTable
-from .livestatus import DataSourceLivestatus, query_livestatus, RowTableLivestatus
+from .livestatus import DataSourceLivestatus, query_livestatus_iter, RowTableLivestatus
 from .registry import DataSourceRegistry
 
 
@@ -497,7 +497,7 @@ class ServiceDiscoveryRowTable(RowTable):
             columns.append("long_plugin_output")
 
         columns = [c for c in columns if c not in datasource.add_columns]
-        data = query_livestatus(
+        data = query_livestatus_iter(
             self.create_livestatus_query(columns, headers), only_sites, limit, "read"
         )
 
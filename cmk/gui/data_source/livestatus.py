@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import cast
 
 from livestatus import LivestatusColumn, LivestatusRow, OnlySites, Query, QuerySpecification
@@ -102,31 +102,62 @@ class RowTableLivestatus(RowTable):
         all_active_filters: Momentarily unused
         """
         columns, dynamic_columns = self._prepare_columns(datasource, cells, columns)
-        data = query_livestatus(
-            self.create_livestatus_query(columns, headers + datasource.add_headers),
-            only_sites,
-            limit,
-            datasource.auth_domain,
-        )
+        query = self.create_livestatus_query(columns, headers + datasource.add_headers)
 
+        # The rows are converted while they are being received, so the raw response of the
+        # sites is never held in memory as a whole
+        data: Iterable[LivestatusRow]
         if merge_column := datasource.merge_by:
-            data = _merge_data(data, columns, merge_column)
+            data = _merge_data(
+                query_livestatus_iter(query, only_sites, limit, datasource.auth_domain),
+                columns,
+                merge_column,
+            )
+        else:
+            data = query_livestatus_iter(query, only_sites, limit, datasource.auth_domain)
 
         # convert lists-rows into dictionaries.
         # performance, but makes live much easier later.
         columns = ["site"] + columns + datasource.add_columns
-        rows: Rows = datasource.post_process([dict(zip(columns, row)) for row in data])
+        unfiltered_rows: Rows = [dict(zip(columns, row)) for row in data]
+        rows: Rows = datasource.post_process(unfiltered_rows)
 
         for index, cell in enumerate(cells):
             painter = cell.painter()
             painter.derive(rows, cell, dynamic_columns.get(index, []))
 
-        return rows, len(data)
+        return rows, len(unfiltered_rows)
 
 
 def query_livestatus(
     query: Query, only_sites: OnlySites, limit: int | None, auth_domain: str
 ) -> list[LivestatusRow]:
+    _show_livestatus_query(query)
+
+    sites.live().set_auth_domain(auth_domain)
+    with sites.only_sites(only_sites), sites.prepend_site(), sites.set_limit(limit):
+        data = sites.live().query(query)
+
+    sites.live().set_auth_domain("read")
+
+    return data
+
+
+def query_livestatus_iter(
+    query: Query, only_sites: OnlySites, limit: int | None, auth_domain: str
+) -> Iterator[LivestatusRow]:
+    """Like query_livestatus, but yields the rows while they are being received"""
+    _show_livestatus_query(query)
+
+    sites.live().set_auth_domain(auth_domain)
+    try:
+        with sites.only_sites(only_sites), sites.prepend_site(), sites.set_limit(limit):
+            yield from sites.live().query_iter(query)
+    finally:
+        sites.live().set_auth_domain("read")
+
+
+def _show_livestatus_query(query: Query) -> None:
     if all(
         (
             active_config.debug_livestatus_queries,
@@ -138,17 +169,9 @@ def query_livestatus(
         html.tt(str(query).replace("\n", "<br>\n"))
         html.close_div()
 
-    sites.live().set_auth_domain(auth_domain)
-    with sites.only_sites(only_sites), sites.prepend_site(), sites.set_limit(limit):
-        data = sites.live().query(query)
-
-    sites.live().set_auth_domain("read")
-
-    return data
-
 
 def _merge_data(
-    data: list[LivestatusRow],
+    data: Iterable[LivestatusRow],
     columns: list[ColumnName],
     merge_column: ColumnName,
 ) -> list[LivestatusRow]:
@@ -40,6 +40,7 @@ from ._graph_pdf import (
 from ._graph_render_config import GraphRenderConfigImage, GraphRenderOptions, GraphTitleFormat
 from ._graph_specification import GraphDataRange, GraphRecipe, parse_raw_graph_specification
 from ._html_render import GraphDestinations
+from ._rrd_fetch import prefetch_rrd_data_for_graphs
 from ._utils import get_graph_data_from_livestatus
 
 
@@ -101,6 +102,9 @@ def _answer_graph_image_request() -> None:
         ).recipes()
         num_graphs = request.get_integer_input("num_graphs") or len(graph_recipes)
 
+        prefetch_rrd_data_for_graphs(
+            (graph_recipe, graph_data_range) for graph_recipe in graph_recipes[:num_graphs]
+        )
         graphs = []
         for graph_recipe in graph_recipes[:num_graphs]:
             graph_artwork = compute_graph_artwork(
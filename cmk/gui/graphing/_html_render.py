@@ -49,6 +49,7 @@ from ._artwork import (
 from ._color import render_color_icon
 from ._graph_render_config import GraphRenderConfig, GraphRenderConfigBase, GraphTitleFormat
 from ._graph_specification import GraphDataRange, GraphRecipe, GraphSpecification
+from ._rrd_fetch import prefetch_rrd_data_for_graphs
 from ._utils import SizeEx
 
 RenderOutput = HTML | str
@@ -733,13 +734,21 @@ def _render_graphs_from_definitions(
     graph_display_id: str = "",
 ) -> HTML:
     output = HTML()
-    for graph_recipe in graph_recipes:
+    graphs = [
+        (
+            graph_recipe,
+            graph_data_range.model_copy(update=dict(graph_recipe.data_range or {})),
+        )
+        for graph_recipe in graph_recipes
+    ]
+    if not render_async:
+        # Asynchronously rendered graphs fetch their data in separate requests, nothing to batch
+        prefetch_rrd_data_for_graphs(graphs)
+
+    for graph_recipe, recipe_specific_data_range in graphs:
         recipe_specific_render_config = graph_render_config.model_copy(
             update=dict(graph_recipe.render_options)
         )
-        recipe_specific_data_range = graph_data_range.model_copy(
-            update=dict(graph_recipe.data_range or {})
-        )
 
         if render_async:
             output += _render_graph_container_html(
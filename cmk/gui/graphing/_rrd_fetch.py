@@ -6,13 +6,11 @@
 
 
 import collections
-import contextlib
 import time
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from functools import lru_cache
 
-import livestatus
-from livestatus import livestatus_lql, SiteId
+from livestatus import lqencode, SiteId
 
 import cmk.utils.version as cmk_version
 from cmk.utils.exceptions import MKGeneralException
@@ -22,12 +20,13 @@ from cmk.utils.servicename import ServiceName
 from cmk.utils.version import parse_check_mk_version
 
 import cmk.gui.sites as sites
+from cmk.gui.ctx_stack import g
 from cmk.gui.i18n import _
 from cmk.gui.time_series import TimeSeries, TimeSeriesValues
 from cmk.gui.type_defs import ColumnName
 
 from ._graph_specification import GraphDataRange, GraphRecipe
-from ._timeseries import op_func_wrapper, time_series_operators
+from ._timeseries import time_series_math
 from ._type_defs import GraphConsoldiationFunction, RRDData, RRDDataKey
 from ._unit_info import unit_info
 from ._utils import check_metrics, CheckMetricEntry, find_matching_translation, metric_info
@@ -41,36 +40,31 @@ def fetch_rrd_data_for_graph(
         "conversion",
         lambda v: v,
     )
-    by_service = _group_needed_rrd_data_by_service(
-        key
-        for metric in graph_recipe.metrics
-        for key in metric.operation.keys()
-        if isinstance(key, RRDDataKey)
+    needed_columns = _needed_rrd_columns(graph_recipe, graph_data_range)
+    fetched = _fetch_rrd_data(
+        {
+            service: [column for _metric, column in columns]
+            for service, columns in needed_columns.items()
+        }
     )
     rrd_data: dict[RRDDataKey, TimeSeries] = {}
-    for (site, host_name, service_description), metrics in by_service.items():
-        with contextlib.suppress(livestatus.MKLivestatusNotFoundError):
-            for (metric_name, consolidation_func_name, scale), data in _fetch_rrd_data(
-                site,
-                host_name,
-                service_description,
-                metrics,
-                graph_recipe.consolidation_function,
-                graph_data_range,
-            ):
-                rrd_data[
-                    RRDDataKey(
-                        site,
-                        host_name,
-                        service_description,
-                        metric_name,
-                        consolidation_func_name,
-                        scale,
-                    )
-                ] = TimeSeries(
-                    data,
-                    conversion=unit_conversion,
+    for (site, host_name, service_description), columns in needed_columns.items():
+        for (metric_name, consolidation_func_name, scale), column in columns:
+            if (data := fetched.get((site, host_name, service_description, column))) is None:
+                continue
+            rrd_data[
+                RRDDataKey(
+                    site,
+                    host_name,
+                    service_description,
+                    metric_name,
+                    consolidation_func_name,
+                    scale,
                 )
+            ] = TimeSeries(
+                data,
+                conversion=unit_conversion,
+            )
     _align_and_resample_rrds(rrd_data, graph_recipe.consolidation_function)
     _chop_last_empty_step(graph_data_range, rrd_data)
 
@@ -99,13 +93,13 @@ def _align_and_resample_rrds(
         if start_time is None:
             start_time, end_time, step = time_series.twindow
         elif (start_time, end_time, step) != time_series.twindow:
-            time_series.values = (
-                time_series.downsample(
+            time_series.array = (
+                time_series.downsample_array(
                     (start_time, end_time, step),
                     key.consolidation_func_name or consolidation_func_name,
                 )
                 if step >= time_series.twindow[2]
-                else time_series.forward_fill_resample((start_time, end_time, step))
+                else time_series.forward_fill_resample_array((start_time, end_time, step))
             )
 
 
@@ -135,7 +129,7 @@ def _chop_last_empty_step(graph_data_range: GraphDataRange, rrd_data: RRDData) -
 
 def _chop_end_of_the_curve(rrd_data: RRDData, step: int) -> None:
     for data in rrd_data.values():
-        del data.values[-1]
+        data.array = data.array[:-1]
         data.end -= step
 
 
@@ -156,14 +150,33 @@ def _group_needed_rrd_data_by_service(
     return by_service
 
 
-def _fetch_rrd_data(
-    site: SiteId,
-    host_name: HostName,
-    service_description: ServiceName,
-    metrics: set[MetricProperties],
-    consolidation_func_name: GraphConsoldiationFunction | None,
-    graph_data_range: GraphDataRange,
-) -> list[tuple[MetricProperties, TimeSeriesValues]]:
+_ServiceKey = tuple[SiteId, HostName, ServiceName]
+_RRDColumnKey = tuple[SiteId, HostName, ServiceName, ColumnName]
+
+
+def prefetch_rrd_data_for_graphs(
+    graphs: Iterable[tuple[GraphRecipe, GraphDataRange]],
+) -> None:
+    """Fetch the RRD data of several graphs at once
+
+    Pages rendering many graphs within one request (synchronously rendered graph lists,
+    notification images) call this before rendering. All needed series are fetched with one
+    query per set of RRD columns, which livestatus sends to all affected sites in parallel. The
+    following calls of fetch_rrd_data_for_graph are then served from the cache of the current
+    request.
+
+    Graphs rendered asynchronously, like those of dashboard dashlets, are fetched by one AJAX
+    request each. Since the cache lives only as long as the request, they are not batched."""
+    needed: dict[_ServiceKey, set[ColumnName]] = collections.defaultdict(set)
+    for graph_recipe, graph_data_range in graphs:
+        for service, columns in _needed_rrd_columns(graph_recipe, graph_data_range).items():
+            needed[service].update(column for _metric, column in columns)
+    _fetch_rrd_data(needed)
+
+
+def _needed_rrd_columns(
+    graph_recipe: GraphRecipe, graph_data_range: GraphDataRange
+) -> dict[_ServiceKey, list[tuple[MetricProperties, ColumnName]]]:
     start_time, end_time = graph_data_range.time_range
 
     step = graph_data_range.step
@@ -172,11 +185,107 @@ def _fetch_rrd_data(
         step = max(1, step)
 
     point_range = ":".join(map(str, (start_time, end_time, step)))
-    lql_columns = list(rrd_columns(metrics, consolidation_func_name, point_range))
-    query = livestatus_lql([host_name], lql_columns, service_description)
+    return {
+        service: list(
+            zip(
+                metrics,
+                rrd_columns(metrics, graph_recipe.consolidation_function, point_range),
+            )
+        )
+        for service, metrics in _group_needed_rrd_data_by_service(
+            key
+            for metric in graph_recipe.metrics
+            for key in metric.operation.keys()
+            if isinstance(key, RRDDataKey)
+        ).items()
+    }
+
+
+def _rrd_data_cache() -> dict[_RRDColumnKey, TimeSeriesValues | None]:
+    """Already fetched RRD columns of the current request
 
-    with sites.only_sites(site):
-        return list(zip(metrics, sites.live().query_row(query)))
+    None marks columns of services which were not found."""
+    if "rrd_data_cache" not in g:
+        g.rrd_data_cache = {}
+    return g.rrd_data_cache
+
+
+def _fetch_rrd_data(
+    needed: Mapping[_ServiceKey, Iterable[ColumnName]],
+) -> Mapping[_RRDColumnKey, TimeSeriesValues | None]:
+    cache = _rrd_data_cache()
+
+    # Services sharing the same columns (e.g. the same metric of many hosts) are fetched together
+    services_by_columns: dict[tuple[ColumnName, ...], set[_ServiceKey]] = collections.defaultdict(
+        set
+    )
+    for service, columns in needed.items():
+        if missing := tuple(sorted({c for c in columns if (*service, c) not in cache})):
+            services_by_columns[missing].add(service)
+
+    for columns, services in services_by_columns.items():
+        cache.update(_query_rrd_columns(columns, services))
+
+    return cache
+
+
+def _query_rrd_columns(
+    columns: Sequence[ColumnName], services: Collection[_ServiceKey]
+) -> dict[_RRDColumnKey, TimeSeriesValues | None]:
+    result: dict[_RRDColumnKey, TimeSeriesValues | None] = {
+        (*service, column): None for service in services for column in columns
+    }
+    # The metrics of hosts belong to the pseudo service "_HOST_", they are found in the hosts table
+    if host_keys := {service for service in services if service[2] == "_HOST_"}:
+        query = "GET hosts\nColumns: %s\n" % " ".join(["host_name", *columns])
+        query += _or_filters(
+            "Filter: host_name = %s\n" % lqencode(host_name)
+            for host_name in sorted({host_name for _site, host_name, _service in host_keys})
+        )
+        for site, host_name, *values in _query_sites(query, host_keys):
+            _add_rrd_columns(result, host_keys, (site, host_name, "_HOST_"), columns, values)
+
+    if service_keys := set(services) - host_keys:
+        query = "GET services\nColumns: %s\n" % " ".join(
+            ["host_name", "service_description", *columns]
+        )
+        query += _or_filters(
+            "Filter: host_name = %s\nFilter: service_description = %s\nAnd: 2\n"
+            % (lqencode(host_name), lqencode(service))
+            for host_name, service in sorted(
+                {(host_name, service) for _site, host_name, service in service_keys}
+            )
+        )
+        for site, host_name, service_description, *values in _query_sites(query, service_keys):
+            _add_rrd_columns(
+                result, service_keys, (site, host_name, service_description), columns, values
+            )
+    return result
+
+
+def _or_filters(filters: Iterable[str]) -> str:
+    filter_list = list(filters)
+    return "".join(filter_list) + ("Or: %d\n" % len(filter_list) if len(filter_list) > 1 else "")
+
+
+def _query_sites(query: str, services: Collection[_ServiceKey]) -> Sequence[Sequence]:
+    with sites.only_sites(sorted({site for site, _host_name, _service in services})):
+        with sites.prepend_site():
+            return sites.live().query(query)
+
+
+def _add_rrd_columns(
+    result: dict[_RRDColumnKey, TimeSeriesValues | None],
+    services: Collection[_ServiceKey],
+    service: _ServiceKey,
+    columns: Sequence[ColumnName],
+    values: Sequence[TimeSeriesValues],
+) -> None:
+    # The same host/service pair may exist on sites we did not ask for
+    if service not in services:
+        return
+    for column, data in zip(columns, values):
+        result[(*service, column)] = data
 
 
 def rrd_columns(
@@ -289,11 +398,11 @@ def translate_and_merge_rrd_columns(
     if not relevant_ts:
         return TimeSeries([0, 0, 0])
 
-    _op_title, op_func = time_series_operators()["MERGE"]
-    single_value_series = [op_func_wrapper(op_func, list(tsp)) for tsp in zip(*relevant_ts)]
+    merged = time_series_math("MERGE", relevant_ts)
+    assert merged is not None
 
     return TimeSeries(
-        single_value_series,
+        merged.array,
         time_window=relevant_ts[0].twindow,
         conversion=_retrieve_unit_conversion_function(target_metric),
     )
@@ -3,17 +3,17 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
-import functools
-import operator
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Literal, TypeVar
+from typing import Literal
+
+import numpy as np
 
 from cmk.utils.exceptions import MKGeneralException
 
 import cmk.gui.utils.escaping as escaping
 from cmk.gui.i18n import _
-from cmk.gui.time_series import TimeSeries, TimeSeriesValues
+from cmk.gui.time_series import TimeSeries, TimeSeriesArray, TimeSeriesValues
 
 from ._type_defs import LineType, Operators, RRDData
 
@@ -43,8 +43,7 @@ def time_series_math(
     operator_id: Operators,
     operands_evaluated: list[TimeSeries],
 ) -> TimeSeries | None:
-    operators = time_series_operators()
-    if operator_id not in operators:
+    if operator_id not in _VECTORIZED_OPERATORS:
         raise MKGeneralException(
             _("Undefined operator '%s' in graph expression")
             % escaping.escape_attribute(operator_id)
@@ -60,89 +59,64 @@ def time_series_math(
         # Silently return so to get an empty graph slot
         return None
 
-    _op_title, op_func = operators[operator_id]
-    twindow = operands_evaluated[0].twindow
+    # Like zip, cut all operands to the length of the shortest one
+    num_points = min(len(operand) for operand in operands_evaluated)
+    operands = np.vstack([operand.array[:num_points] for operand in operands_evaluated])
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        result = _VECTORIZED_OPERATORS[operator_id](operands)
+    return TimeSeries(result, operands_evaluated[0].twindow)
 
-    return TimeSeries(
-        [op_func_wrapper(op_func, list(tsp)) for tsp in zip(*operands_evaluated)], twindow
-    )
 
+def _vectorized_sum(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.where(_all_missing(operands), np.nan, np.nansum(operands, axis=0))
 
-_TOperatorReturn = TypeVar("_TOperatorReturn")
 
+def _vectorized_product(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.prod(operands, axis=0)
 
-def op_func_wrapper(
-    op_func: Callable[[TimeSeries | TimeSeriesValues], _TOperatorReturn],
-    tsp: TimeSeries | TimeSeriesValues,
-) -> _TOperatorReturn | None:
-    if tsp.count(None) < len(tsp):  # At least one non-None value
-        try:
-            return op_func(tsp)
-        except ZeroDivisionError:
-            pass
-    return None
 
+def _vectorized_difference(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return operands[0] - operands[1]
 
-def clean_time_series_point(tsp: TimeSeries | TimeSeriesValues) -> list[float]:
-    """removes "None" entries from input list"""
-    return [x for x in tsp if x is not None]
 
+def _vectorized_fraction(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.where(operands[1] == 0, np.nan, operands[0] / operands[1])
 
-def _time_series_operator_sum(tsp: TimeSeries | TimeSeriesValues) -> float:
-    return sum(clean_time_series_point(tsp))
 
+def _vectorized_maximum(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.fmax.reduce(operands, axis=0)
 
-def _time_series_operator_product(tsp: TimeSeries | TimeSeriesValues) -> float | None:
-    if None in tsp:
-        return None
-    return functools.reduce(operator.mul, tsp, 1)
 
+def _vectorized_minimum(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.fmin.reduce(operands, axis=0)
 
-def _time_series_operator_difference(tsp: TimeSeries | TimeSeriesValues) -> float | None:
-    if None in tsp:
-        return None
-    assert tsp[0] is not None
-    assert tsp[1] is not None
-    return tsp[0] - tsp[1]
 
+def _vectorized_average(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.nansum(operands, axis=0) / np.count_nonzero(~np.isnan(operands), axis=0)
 
-def _time_series_operator_fraction(tsp: TimeSeries | TimeSeriesValues) -> float | None:
-    if None in tsp or tsp[1] == 0:
-        return None
-    assert tsp[0] is not None
-    assert tsp[1] is not None
-    return tsp[0] / tsp[1]
-
-
-def _time_series_operator_maximum(tsp: TimeSeries | TimeSeriesValues) -> float:
-    return max(clean_time_series_point(tsp))
-
-
-def _time_series_operator_minimum(tsp: TimeSeries | TimeSeriesValues) -> float:
-    return min(clean_time_series_point(tsp))
-
-
-def _time_series_operator_average(tsp: TimeSeries | TimeSeriesValues) -> float:
-    tsp_clean = clean_time_series_point(tsp)
-    return sum(tsp_clean) / len(tsp_clean)
-
-
-def time_series_operators() -> (
-    dict[
-        Operators,
-        tuple[
-            str,
-            Callable[[TimeSeries | TimeSeriesValues], float | None],
-        ],
-    ]
-):
-    return {
-        "+": (_("Sum"), _time_series_operator_sum),
-        "*": (_("Product"), _time_series_operator_product),
-        "-": (_("Difference"), _time_series_operator_difference),
-        "/": (_("Fraction"), _time_series_operator_fraction),
-        "MAX": (_("Maximum"), _time_series_operator_maximum),
-        "MIN": (_("Minimum"), _time_series_operator_minimum),
-        "AVERAGE": (_("Average"), _time_series_operator_average),
-        "MERGE": ("First non None", lambda x: next(iter(clean_time_series_point(x)))),
-    }
+
+def _vectorized_merge(operands: TimeSeriesArray) -> TimeSeriesArray:
+    first_present = np.argmax(~np.isnan(operands), axis=0)
+    return operands[first_present, np.arange(operands.shape[1])]
+
+
+def _all_missing(operands: TimeSeriesArray) -> TimeSeriesArray:
+    return np.isnan(operands).all(axis=0)
+
+
+# The operators work on all points of all operands at once
+_VECTORIZED_OPERATORS: dict[Operators, Callable[[TimeSeriesArray], TimeSeriesArray]] = {
+    "+": _vectorized_sum,
+    "*": _vectorized_product,
+    "-": _vectorized_difference,
+    "/": _vectorized_fraction,
+    "MAX": _vectorized_maximum,
+    "MIN": _vectorized_minimum,
+    "AVERAGE": _vectorized_average,
+    "MERGE": _vectorized_merge,
+}
+
+
+def clean_time_series_point(tsp: TimeSeries | TimeSeriesValues) -> list[float]:
+    """removes "None" entries from input list"""
+    return [x for x in tsp if x is not None]
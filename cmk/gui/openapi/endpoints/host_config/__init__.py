@@ -83,7 +83,13 @@ from cmk.gui.wato.pages.host_rename import rename_hosts_background_job
 from cmk.gui.watolib.activate_changes import has_pending_changes
 from cmk.gui.watolib.check_mk_automations import delete_hosts
 from cmk.gui.watolib.host_rename import RenameHostBackgroundJob, RenameHostsBackgroundJob
-from cmk.gui.watolib.hosts_and_folders import Folder, folder_tree, Host
+from cmk.gui.watolib.hosts_and_folders import (
+    Folder,
+    folder_tree,
+    Host,
+    host_attributes_index,
+    HostAttributesIndex,
+)
 
 from cmk import fields
 
@@ -369,11 +375,17 @@ def serve_host_collection(hosts: Iterable[Host], effective_attributes: bool = Fa
 
 
 def _host_collection(hosts: Iterable[Host], effective_attributes: bool = False) -> dict[str, Any]:
+    attributes_index = host_attributes_index() if effective_attributes else None
     return {
         "id": "host",
         "domainType": "host_config",
         "value": [
-            serialize_host(host, effective_attributes=effective_attributes) for host in hosts
+            serialize_host(
+                host,
+                effective_attributes=effective_attributes,
+                attributes_index=attributes_index,
+            )
+            for host in hosts
         ],
         "links": [constructors.link_rel("self", constructors.collection_href("host_config"))],
     }
@@ -751,11 +763,22 @@ def _serve_host(host: Host, effective_attributes: bool = False) -> Response:
 agent_links_hook: Callable[[HostName], list[LinkType]] = lambda h: []
 
 
-def serialize_host(host: Host, effective_attributes: bool) -> dict[str, Any]:
+def serialize_host(
+    host: Host,
+    effective_attributes: bool,
+    attributes_index: HostAttributesIndex | None = None,
+) -> dict[str, Any]:
+    if not effective_attributes:
+        effective = None
+    elif attributes_index is not None:
+        effective = attributes_index.effective_attributes(host)
+    else:
+        effective = host.effective_attributes()
+
     extensions = {
         "folder": "/" + host.folder().path(),
         "attributes": host.attributes,
-        "effective_attributes": host.effective_attributes() if effective_attributes else None,
+        "effective_attributes": effective,
         "is_cluster": host.is_cluster(),
         "is_offline": host.is_offline(),
         "cluster_nodes": host.cluster_nodes(),
@@ -230,6 +230,10 @@ class CREConfig:
 
     debug_livestatus_queries: bool = False
 
+    # Seconds to share the responses to identical livestatus queries between the requests of
+    # an apache process. 0 disables the cache.
+    livestatus_query_cache_ttl: int = 0
+
     # Show livestatus errors in multi site setup if some sites are
     # not reachable.
     show_livestatus_errors: bool = True
@@ -539,6 +543,7 @@ class CREConfig:
     wato_num_hostspecs: int = 12
     wato_num_itemspecs: int = 15
     wato_activation_method: str = "restart"
+    wato_activation_snapshot_workers: int = 5
     wato_write_nagvis_auth: bool = False
     wato_use_git: bool = False
     wato_hidden_users: list = field(default_factory=list)
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import cast, Literal, NamedTuple, NewType
@@ -13,12 +14,14 @@ from typing_extensions import TypedDict
 
 from livestatus import (
     ConnectedSite,
+    ConnectionPool,
     LivestatusOutputFormat,
     lqencode,
     MKLivestatusQueryError,
     MultiSiteConnection,
     NetworkSocketDetails,
     NetworkSocketInfo,
+    QueryCache,
     SiteConfiguration,
     SiteConfigurations,
     SiteId,
@@ -112,7 +115,15 @@ def disconnect() -> None:
         return
     logger.debug("Disconnecting site connections")
     if "live" in g:
+        if (query_cache := g.live.query_cache) is not None:
+            logger.debug(
+                "Livestatus query cache: %d hits, %d misses (hit ratio %.2f)",
+                query_cache.hits,
+                query_cache.misses,
+                query_cache.hit_ratio(),
+            )
         g.live.disconnect()
+        logger.debug("Livestatus connection pool: %r", _connection_pool.statistics())
     g.pop("live", None)
     g.pop("site_status", None)
 
@@ -279,7 +290,8 @@ ConnectionClass = MultiSiteConnection
 def _connect_multiple_sites(user: LoggedInUser) -> None:
     enabled_sites, disabled_sites = _get_enabled_and_disabled_sites(user)
     _set_initial_site_states(enabled_sites, disabled_sites)
-    g.live = ConnectionClass(enabled_sites, disabled_sites)
+    g.live = ConnectionClass(enabled_sites, disabled_sites, connection_pool=_connection_pool)
+    g.live.set_query_cache(query_cache := _get_query_cache())
 
     # Fetch status of sites by querying the version of Nagios and livestatus
     # This may be cached by a proxy for up to the next configuration reload.
@@ -348,6 +360,8 @@ def _connect_multiple_sites(user: LoggedInUser) -> None:
                     "core_pid": pid,
                 }
             )
+            if query_cache is not None:
+                query_cache.update_program_start(site_id, ps)
     g.live.set_prepend_site(False)
 
     # TODO(lm): Find a better way to make the Livestatus object trigger the update
@@ -355,6 +369,26 @@ def _connect_multiple_sites(user: LoggedInUser) -> None:
     update_site_states_from_dead_sites()
 
 
+# Hands the connections of finished requests over to the next requests of this process, which
+# saves the connection setup (especially the TLS handshake with remote sites)
+_connection_pool = ConnectionPool()
+# Background jobs are forked from the GUI processes and close all inherited file descriptors
+os.register_at_fork(after_in_child=_connection_pool.reset_after_fork)
+
+# Shared by the requests of this process, see livestatus_query_cache_ttl
+_query_cache: QueryCache | None = None
+
+
+def _get_query_cache() -> QueryCache | None:
+    global _query_cache  # pylint: disable=global-statement
+
+    if not (ttl := active_config.livestatus_query_cache_ttl):
+        return None
+    if _query_cache is None or _query_cache.ttl != ttl:
+        _query_cache = QueryCache(ttl)
+    return _query_cache
+
+
 def _get_enabled_and_disabled_sites(
     user: LoggedInUser,
 ) -> tuple[SiteConfigurations, SiteConfigurations]:
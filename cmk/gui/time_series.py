@@ -3,14 +3,20 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import math
 from collections.abc import Callable, Iterator, Sequence
 from statistics import fmean
 
+import numpy as np
+import numpy.typing as npt
+
 Timestamp = int
 
 TimeWindow = tuple[Timestamp, Timestamp, int]
 TimeSeriesValue = float | None
 TimeSeriesValues = Sequence[TimeSeriesValue]
+# Missing values are NaN
+TimeSeriesArray = npt.NDArray[np.float64]
 
 
 def rrd_timestamps(time_window: TimeWindow) -> list[Timestamp]:
@@ -38,6 +44,32 @@ def aggregation_functions(series: TimeSeriesValues, aggr: str | None) -> TimeSer
             raise ValueError(f"Invalid Aggregation function {aggr}, only max, min, average allowed")
 
 
+def to_time_series_array(values: TimeSeriesValues | TimeSeriesArray) -> TimeSeriesArray:
+    """Convert values with None for missing values to an array with NaN for missing values"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def to_time_series_values(array: TimeSeriesArray) -> list[TimeSeriesValue]:
+    """Convert an array with NaN for missing values to a list with None for missing values"""
+    values = array.astype(object)
+    values[np.isnan(array)] = None
+    return values.tolist()
+
+
+def _convert(array: TimeSeriesArray, conversion: Callable[[float], float]) -> TimeSeriesArray:
+    # The unit conversions are plain arithmetic, which also works on the whole array at once.
+    # Anything else is applied value by value.
+    try:
+        converted = conversion(array)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        converted = None
+    if isinstance(converted, np.ndarray) and converted.shape == array.shape:
+        return converted.astype(np.float64, copy=False)
+    return np.array(
+        [v if math.isnan(v) else conversion(v) for v in array.tolist()], dtype=np.float64
+    )
+
+
 class TimeSeries:
     """Describes the returned time series returned by livestatus
 
@@ -47,6 +79,9 @@ class TimeSeries:
     - The Series describes the interval [start; end[
     - Start has no associated value to it.
 
+    The values are held in a NumPy array with NaN for missing values, see `array`.
+    The attribute `values` provides them as list with None for missing values.
+
     args:
         data : list
             Includes [start, end, step, *values]
@@ -59,12 +94,12 @@ class TimeSeries:
 
     def __init__(
         self,
-        data: TimeSeriesValues,
+        data: TimeSeriesValues | TimeSeriesArray,
         time_window: TimeWindow | None = None,
         conversion: Callable[[float], float] = lambda v: v,
     ) -> None:
         if time_window is None:
-            if not data or data[0] is None or data[1] is None or data[2] is None:
+            if len(data) < 3 or data[0] is None or data[1] is None or data[2] is None:
                 raise ValueError(data)
 
             time_window = int(data[0]), int(data[1]), int(data[2])
@@ -74,7 +109,15 @@ class TimeSeries:
         self.start = int(time_window[0])
         self.end = int(time_window[1])
         self.step = int(time_window[2])
-        self.values = [v if v is None else conversion(v) for v in data]
+        self.array = _convert(to_time_series_array(data), conversion)
+
+    @property
+    def values(self) -> list[TimeSeriesValue]:
+        return to_time_series_values(self.array)
+
+    @values.setter
+    def values(self, values: TimeSeriesValues | TimeSeriesArray) -> None:
+        self.array = to_time_series_array(values)
 
     @property
     def twindow(self) -> TimeWindow:
@@ -86,15 +129,16 @@ class TimeSeries:
         twindow : 3-tuple, (start, end, step)
              description of target time interval
         """
-        if twindow == self.twindow:
-            return self.values
+        return to_time_series_values(self.forward_fill_resample_array(twindow))
 
-        idx_max = len(self.values) - 1
+    def forward_fill_resample_array(self, twindow: TimeWindow) -> TimeSeriesArray:
+        if twindow == self.twindow:
+            return self.array
 
-        return [
-            self.values[max(0, min(int((t - self.start) / self.step), idx_max))]
-            for t in range(*twindow)
-        ]
+        indexes = np.clip(
+            np.trunc((np.arange(*twindow) - self.start) / self.step), 0, len(self.array) - 1
+        )
+        return self.array[indexes.astype(np.intp)]
 
     def downsample(self, twindow: TimeWindow, cf: str | None = "max") -> TimeSeriesValues:
         """Downsample time series by consolidation function
@@ -104,26 +148,43 @@ class TimeSeries:
         cf : str ('max', 'average', 'min')
              consolidation function imitating RRD methods
         """
+        return to_time_series_values(self.downsample_array(twindow, cf))
+
+    def downsample_array(self, twindow: TimeWindow, cf: str | None = "max") -> TimeSeriesArray:
         if twindow == self.twindow:
-            return self.values
-
-        dwsa = []
-        co: list[TimeSeriesValue] = []
-        desired_times = rrd_timestamps(twindow)
-        i = 0
-        for t, val in self.time_data_pairs():
-            if t > desired_times[i]:
-                dwsa.append(aggregation_functions(co, cf))
-                co = []
-                i += 1
-            co.append(val)
-
-        diff_len = len(desired_times) - len(dwsa)
-        if diff_len > 0:
-            dwsa.append(aggregation_functions(co, cf))
-            dwsa += [None] * (diff_len - 1)
-
-        return dwsa
+            return self.array
+
+        cf = "max" if cf is None else cf.lower()
+        if cf not in ("max", "min", "average"):
+            raise ValueError(f"Invalid Aggregation function {cf}, only max, min, average allowed")
+
+        start, end, step = twindow
+        num_points = len(range(start, end, step))
+        downsampled = np.full(num_points, np.nan)
+
+        # Each value belongs to the first desired timestamp not before its own timestamp.
+        # Values before the desired time window are put into the first point.
+        timestamps = self.start + self.step * np.arange(1, len(self.array) + 1)
+        points = np.maximum(np.ceil((timestamps - start) / step) - 1, 0).astype(np.intp)
+        selected = (points < num_points) & ~np.isnan(self.array)
+        points = points[selected]
+        values = self.array[selected]
+        if not len(values):
+            return downsampled
+
+        # The points are ascending, so each point is a contiguous group of values
+        group_starts = np.flatnonzero(np.r_[True, points[1:] != points[:-1]])
+        match cf:
+            case "max":
+                aggregated = np.maximum.reduceat(values, group_starts)
+            case "min":
+                aggregated = np.minimum.reduceat(values, group_starts)
+            case _:
+                aggregated = np.add.reduceat(values, group_starts) / np.diff(
+                    np.r_[group_starts, len(values)]
+                )
+        downsampled[points[group_starts]] = aggregated
+        return downsampled
 
     def time_data_pairs(self) -> list[tuple[Timestamp, TimeSeriesValue]]:
         return list(zip(rrd_timestamps(self.twindow), self.values))
@@ -139,17 +200,20 @@ class TimeSeries:
             self.start == other.start
             and self.end == other.end
             and self.step == other.step
-            and self.values == other.values
+            and np.array_equal(self.array, other.array, equal_nan=True)
         )
 
     def __getitem__(self, i: int) -> TimeSeriesValue:
-        return self.values[i]
+        value = float(self.array[i])
+        return None if math.isnan(value) else value
 
     def __len__(self) -> int:
-        return len(self.values)
+        return len(self.array)
 
     def __iter__(self) -> Iterator[TimeSeriesValue]:
         yield from self.values
 
     def count(self, /, v: TimeSeriesValue) -> int:
-        return self.values.count(v)
+        if v is None:
+            return int(np.count_nonzero(np.isnan(self.array)))
+        return int(np.count_nonzero(self.array == v))
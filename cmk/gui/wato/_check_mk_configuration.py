@@ -135,6 +135,7 @@ def register(
     config_variable_registry.register(ConfigVariableDebug)
     config_variable_registry.register(ConfigVariableGUIProfile)
     config_variable_registry.register(ConfigVariableDebugLivestatusQueries)
+    config_variable_registry.register(ConfigVariableLivestatusQueryCacheTTL)
     config_variable_registry.register(ConfigVariableSelectionLivetime)
     config_variable_registry.register(ConfigVariableShowLivestatusErrors)
     config_variable_registry.register(ConfigVariableEnableSounds)
@@ -174,6 +175,7 @@ def register(
     config_variable_registry.register(ConfigVariableWATOMaxSnapshots)
     config_variable_registry.register(ConfigVariableWATOActivateChangesCommentMode)
     config_variable_registry.register(ConfigVariableWATOActivationMethod)
+    config_variable_registry.register(ConfigVariableWATOActivationSnapshotWorkers)
     config_variable_registry.register(ConfigVariableWATOHideFilenames)
     config_variable_registry.register(ConfigVariableWATOUploadInsecureSnapshots)
     config_variable_registry.register(ConfigVariableWATOHideHosttags)
@@ -633,6 +635,33 @@ class ConfigVariableDebugLivestatusQueries(ConfigVariable):
         )
 
 
+class ConfigVariableLivestatusQueryCacheTTL(ConfigVariable):
+    def group(self) -> type[ConfigVariableGroup]:
+        return ConfigVariableGroupUserInterface
+
+    def domain(self) -> type[ABCConfigDomain]:
+        return ConfigDomainGUI
+
+    def ident(self) -> str:
+        return "livestatus_query_cache_ttl"
+
+    def valuespec(self) -> ValueSpec:
+        return Age(
+            title=_("Livestatus query cache"),
+            help=_(
+                "Pages like dashboards or the sidebar issue many identical Livestatus queries, "
+                "also for concurrent users. With this option the GUI shares the responses to "
+                "identical queries of the same user for the configured time instead of asking "
+                "the sites again. The responses of a site are dropped when its core is "
+                "restarted or reloaded and when a command is sent to it. Set this to 0 to "
+                "disable the cache."
+            ),
+            display=["seconds"],
+            minvalue=0,
+            maxvalue=300,
+        )
+
+
 class ConfigVariableSelectionLivetime(ConfigVariable):
     def group(self) -> type[ConfigVariableGroup]:
         return ConfigVariableGroupUserInterface
@@ -2231,6 +2260,28 @@ class ConfigVariableWATOActivationMethod(ConfigVariable):
         )
 
 
+class ConfigVariableWATOActivationSnapshotWorkers(ConfigVariable):
+    def group(self) -> type[ConfigVariableGroup]:
+        return ConfigVariableGroupWATO
+
+    def domain(self) -> type[ABCConfigDomain]:
+        return ConfigDomainGUI
+
+    def ident(self) -> str:
+        return "wato_activation_snapshot_workers"
+
+    def valuespec(self) -> ValueSpec:
+        return Integer(
+            title=_("Parallel preparation of site configurations"),
+            help=_(
+                "When activating changes in a distributed setup, the configuration files to be "
+                "synchronized are prepared for each remote site. This setting controls how many "
+                "sites are prepared in parallel."
+            ),
+            minvalue=1,
+        )
+
+
 class ConfigVariableWATOHideFilenames(ConfigVariable):
     def group(self) -> type[ConfigVariableGroup]:
         return ConfigVariableGroupWATO
@@ -13,6 +13,8 @@ from cmk.gui.valuespec import (
     DropdownChoice,
     EmailAddress,
     Integer,
+    ListOf,
+    Tuple,
     ValueSpec,
 )
 from cmk.gui.wato import notification_parameter_registry
@@ -24,6 +26,7 @@ from cmk.gui.watolib.config_domain_name import (
 )
 from cmk.gui.watolib.config_domains import ConfigDomainCore, ConfigDomainGUI
 from cmk.gui.watolib.config_variable_groups import ConfigVariableGroupNotifications
+from cmk.gui.watolib.users import notification_script_choices
 from cmk.gui.watolib.utils import site_neutral_path
 
 
@@ -33,6 +36,8 @@ def register(config_variable_registry: ConfigVariableRegistry) -> None:
     config_variable_registry.register(ConfigVariableNotificationBacklog)
     config_variable_registry.register(ConfigVariableNotificationBulkInterval)
     config_variable_registry.register(ConfigVariableNotificationPluginTimeout)
+    config_variable_registry.register(ConfigVariableNotificationPluginWorkers)
+    config_variable_registry.register(ConfigVariableNotificationPluginConcurrency)
     config_variable_registry.register(ConfigVariableNotificationLogging)
     config_variable_registry.register(ConfigVariableFailedNotificationHorizon)
 
@@ -160,6 +165,63 @@ class ConfigVariableNotificationPluginTimeout(ConfigVariable):
         )
 
 
+class ConfigVariableNotificationPluginWorkers(ConfigVariable):
+    def group(self) -> type[ConfigVariableGroup]:
+        return ConfigVariableGroupNotifications
+
+    def domain(self) -> type[ABCConfigDomain]:
+        return ConfigDomainCore
+
+    def ident(self) -> str:
+        return "notification_plugin_workers"
+
+    def valuespec(self) -> ValueSpec:
+        return Integer(
+            title=_("Parallel notification plugin executions"),
+            help=_(
+                "The maximum number of notification plugins that are executed in parallel. "
+                "This way a slow plugin does not delay all other notifications. This applies "
+                "to notifications that are delivered without the notification spooler."
+            ),
+            minvalue=1,
+        )
+
+
+class ConfigVariableNotificationPluginConcurrency(ConfigVariable):
+    def group(self) -> type[ConfigVariableGroup]:
+        return ConfigVariableGroupNotifications
+
+    def domain(self) -> type[ABCConfigDomain]:
+        return ConfigDomainCore
+
+    def ident(self) -> str:
+        return "notification_plugin_concurrency"
+
+    def valuespec(self) -> ValueSpec:
+        return ListOf(
+            valuespec=Tuple(
+                orientation="horizontal",
+                elements=[
+                    DropdownChoice(
+                        title=_("Notification method"),
+                        choices=notification_script_choices,
+                    ),
+                    Integer(
+                        title=_("Parallel executions"),
+                        minvalue=1,
+                    ),
+                ],
+            ),
+            title=_("Parallel executions per notification method"),
+            help=_(
+                "Limits the number of parallel executions of single notification methods, "
+                "e.g. if a ticket system does not cope with concurrent requests. Methods "
+                "not listed here may use all parallel executions."
+            ),
+            add_label=_("Add limit"),
+        )
+
+
 class ConfigVariableNotificationLogging(ConfigVariable):
     def group(self) -> type[ConfigVariableGroup]:
         return ConfigVariableGroupNotifications
@@ -13,7 +13,7 @@ from cmk.gui.config import active_config
 from cmk.gui.http import request
 from cmk.gui.logged_in import user
 from cmk.gui.site_config import get_site_config
-from cmk.gui.watolib.hosts_and_folders import Folder, Host, SearchFolder
+from cmk.gui.watolib.hosts_and_folders import Folder, Host, host_attributes_index, SearchFolder
 
 
 def get_hostnames_from_checkboxes(
@@ -41,14 +41,15 @@ def _search_text_matches(
     search_text: str,
 ) -> bool:
     match_regex = re.compile(search_text, re.IGNORECASE)
+    effective = host_attributes_index().effective_attributes(host)
     for pattern in [
         host.name(),
-        str(host.effective_attributes().get("ipaddress")),
-        str(host.effective_attributes().get("alias")),
+        str(effective.get("ipaddress")),
+        str(effective.get("alias")),
         host.site_id(),
         str(get_site_config(active_config, host.site_id())["alias"]),
         str(host.tag_groups()),
-        str(host.labels()),
+        str(effective["labels"]),
     ]:
         if match_regex.search(pattern):
             return True
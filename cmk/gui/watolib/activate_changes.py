@@ -600,6 +600,16 @@ def _set_result(
     _save_state(current_state["_activation_id"], current_state["_site_id"], current_state)
 
 
+def _add_phase_duration(
+    site_activation_state: SiteActivationState, step: str, duration: float
+) -> None:
+    """Accumulates the time spent in the single steps of the activation of a site
+
+    The durations are persisted with the site state once the next result is set."""
+    durations = site_activation_state.setdefault("_phase_durations", {})
+    durations[step] = durations.get(step, 0.0) + duration
+
+
 def _handle_activation_changes_exception(
     exc_logger: logging.Logger, exc_msg: str, site_activation_status: SiteActivationState
 ) -> None:
@@ -719,6 +729,7 @@ def fetch_sync_state(
             site_id, replication_paths
         )
         site_logger.debug("Received %d file infos from remote", len(remote_file_infos))
+        _add_phase_duration(site_activation_state, "fetch_sync_state", time.time() - sync_start)
 
         return (
             SyncState(
@@ -747,7 +758,9 @@ def calc_sync_delta(
     try:
         _set_sync_state(site_activation_state, _("Computing differences"))
 
+        start = time.time()
         sync_delta = get_file_names_to_sync(site_id, site_logger, sync_state, file_filter_func)
+        _add_phase_duration(site_activation_state, "calc_sync_delta", time.time() - start)
 
         site_logger.debug("New files to be synchronized: %r", sync_delta.to_sync_new)
         site_logger.debug("Changed files to be synchronized: %r", sync_delta.to_sync_changed)
@@ -789,6 +802,7 @@ def synchronize_files(
                 len(sync_delta.to_delete),
             ),
         )
+        start = time.time()
         _synchronize_files(
             site_id,
             sync_delta.to_sync_new + sync_delta.to_sync_changed,
@@ -796,6 +810,7 @@ def synchronize_files(
             remote_config_generation,
             site_config_dir,
         )
+        _add_phase_duration(site_activation_state, "synchronize_files", time.time() - start)
         site_logger.debug("Finished config sync")
         return site_activation_state
     except Exception as e:
@@ -935,6 +950,7 @@ def _do_activate(
 
     duration = time.time() - start
     update_activation_time(site_id, ACTIVATION_TIME_RESTART, duration)
+    _add_phase_duration(site_activation_state, "activate", duration)
     return configuration_warnings
 
 
@@ -1222,6 +1238,7 @@ class ActivateChangesManager(ActivateChanges):
         "_activation_id",
         "_time_started",
         "_persisted_changes",
+        "_snapshot_durations",
     )
 
     def __init__(self) -> None:
@@ -1233,6 +1250,7 @@ class ActivateChangesManager(ActivateChanges):
         self._activation_id: str | None = None
         self._prevent_activate = False
         self._persisted_changes: list[dict[str, Any]] = []
+        self._snapshot_durations: dict[SiteId, float] = {}
 
         store.makedirs(ACTIVATION_PERISTED_DIR)
         super().__init__()
@@ -1253,6 +1271,10 @@ class ActivateChangesManager(ActivateChanges):
     def time_started(self) -> float:
         return self._time_started
 
+    @property
+    def snapshot_durations(self) -> Mapping[SiteId, float]:
+        return self._snapshot_durations
+
     @property
     def persisted_changes(self) -> Sequence[ActivationChange]:
         return [ActivationChange(**change) for change in self._persisted_changes]
@@ -1261,7 +1283,9 @@ class ActivateChangesManager(ActivateChanges):
         self._activation_id = activation_id
         from_file = self._load_activation_info(activation_id)
         for key in self.info_keys:
-            setattr(self, key, from_file[key])
+            # Activations started before an update may lack newer keys
+            if key in from_file:
+                setattr(self, key, from_file[key])
 
     # Creates the snapshot and starts the single site sync processes. In case these
     # steps could not be started, exceptions are raised and have to be handled by
@@ -1561,6 +1585,7 @@ class ActivateChangesManager(ActivateChanges):
                 work_dir, site_snapshot_settings, version.edition()
             )
             snapshot_manager.generate_snapshots()
+            self._snapshot_durations = dict(snapshot_manager.site_durations)
             logger.debug("Config sync snapshot creation took %.4f", time.time() - start)
 
             logger.debug("Waiting for backup snapshot creation to complete")
@@ -1712,6 +1737,10 @@ class SnapshotManager:
         # 2. Allow hooks to further modify the reference data for the remote site
         hooks.call("post-snapshot-creation", self._site_snapshot_settings)
 
+    @property
+    def site_durations(self) -> Mapping[SiteId, float]:
+        return self._data_collector.site_durations
+
 
 def _clone_site_config_directory(
     site_logger: logging.Logger,
@@ -1747,23 +1776,26 @@ class CRESnapshotDataCollector(ABCSnapshotDataCollector):
         a single directory per site containing a lot of hard links to the original files.
 
         As last step the site individual files will be added.
+
+        The sites are processed by a pool of workers (see "wato_activation_snapshot_workers").
+        Each worker clones the directory for one site and adds its individual files right away,
+        so the sites don't have to wait for each other.
         """
         # Choose one site to create the first site config for
         site_ids = list(self._site_snapshot_settings.keys())
         first_site = site_ids.pop(0)
 
         # Create first directory and clone it once for each destination site
+        start = time.time()
         self._prepare_site_config_directory(first_site)
-        self._clone_site_config_directories(first_site, site_ids)
+        prepare_duration = time.time() - start
 
-        for site_id, snapshot_settings in sorted(
-            self._site_snapshot_settings.items(), key=lambda x: x[0]
-        ):
-            site_globals = get_site_globals(site_id, snapshot_settings.site_config)
+        self._prepare_cloned_site_config_directories(first_site, site_ids)
 
-            save_site_global_settings(site_globals, custom_site_path=snapshot_settings.work_dir)
-
-            create_distributed_wato_files(Path(snapshot_settings.work_dir), site_id, is_remote=True)
+        # The individual files of the first site must not be added before it has been cloned
+        start = time.time()
+        self._add_site_individual_files(first_site)
+        self._site_durations[first_site] = prepare_duration + time.time() - start
 
     def _prepare_site_config_directory(self, site_id: SiteId) -> None:
         """
@@ -1838,22 +1870,30 @@ class CRESnapshotDataCollector(ABCSnapshotDataCollector):
 
         self._logger.debug("Finished site")
 
-    def _clone_site_config_directories(
+    def _prepare_cloned_site_config_directories(
         self, origin_site_id: SiteId, site_ids: list[SiteId]
     ) -> None:
-        clone_args = [
-            (
+        origin_site_work_dir = self._site_snapshot_settings[origin_site_id].work_dir
+
+        def prepare_site(site_id: SiteId) -> None:
+            start = time.time()
+            _clone_site_config_directory(
                 self._logger.getChild(f"site[{site_id}]"),
                 site_id,
                 self._site_snapshot_settings[site_id],
-                self._site_snapshot_settings[origin_site_id].work_dir,
+                origin_site_work_dir,
             )
-            for site_id in site_ids
-        ]
+            self._add_site_individual_files(site_id)
+            self._site_durations[site_id] = time.time() - start
 
-        num_threads = 5  # based on rudimentary tests, performance improvement drops off after
-        with multiprocessing.pool.ThreadPool(processes=num_threads) as copy_pool:
-            copy_pool.starmap(_clone_site_config_directory, clone_args)
+        with ThreadPool(processes=active_config.wato_activation_snapshot_workers) as copy_pool:
+            copy_pool.map(copy_request_context(prepare_site), site_ids)
+
+    def _add_site_individual_files(self, site_id: SiteId) -> None:
+        snapshot_settings = self._site_snapshot_settings[site_id]
+        site_globals = get_site_globals(site_id, snapshot_settings.site_config)
+        save_site_global_settings(site_globals, custom_site_path=snapshot_settings.work_dir)
+        create_distributed_wato_files(Path(snapshot_settings.work_dir), site_id, is_remote=True)
 
     def get_generic_components(self) -> list[ReplicationPath]:
         return get_replication_paths()
@@ -2058,7 +2098,8 @@ class ReplicationPathType(enum.StrEnum):
 def _get_config_sync_file_infos_per_inode(
     replication_paths: Sequence[ReplicationPath],
 ) -> Mapping[int, ConfigSyncFileInfo]:
-    inode_sync_states = {}
+    inode_sync_states: dict[int, ConfigSyncFileInfo] = {}
+    hash_cache = _central_config_sync_file_hash_cache()
 
     for replication_path in replication_paths:
         replication_path_full = os.path.join(cmk.utils.paths.omd_root, replication_path.site_path)
@@ -2068,15 +2109,16 @@ def _get_config_sync_file_infos_per_inode(
 
         if replication_path.ty == ReplicationPathType.FILE:
             inode_sync_states[os.stat(replication_path_full).st_ino] = _get_config_sync_file_info(
-                replication_path_full
+                replication_path_full, hash_cache
             )
         elif replication_path.ty == ReplicationPathType.DIR:
             _get_replication_dir_config_sync_file_infos_per_inode(
-                inode_sync_states, replication_path_full, replication_path.excludes
+                inode_sync_states, replication_path_full, replication_path.excludes, hash_cache
             )
         else:
             raise NotImplementedError()
 
+    hash_cache.save()
     return inode_sync_states
 
 
@@ -2084,6 +2126,7 @@ def _get_replication_dir_config_sync_file_infos_per_inode(
     inode_sync_states: MutableMapping[int, ConfigSyncFileInfo],
     replication_path: str,
     replication_path_excludes: Sequence[str],
+    hash_cache: ConfigSyncFileHashCache,
 ) -> None:
     # Use os functionality instead of pathlib since it is faster
     for root, dir_names, file_names in os.walk(replication_path):
@@ -2098,12 +2141,16 @@ def _get_replication_dir_config_sync_file_infos_per_inode(
                 and os.path.islink(dir_path)
                 and not dir_name == GENERAL_DIR_EXCLUDE
             ):
-                inode_sync_states[os.stat(dir_path).st_ino] = _get_config_sync_file_info(dir_path)
+                inode_sync_states[os.stat(dir_path).st_ino] = _get_config_sync_file_info(
+                    dir_path, hash_cache
+                )
 
         for file_name in file_names:
             file_path = os.path.join(root, file_name)
             if os.path.exists(file_path):
-                inode_sync_states[os.stat(file_path).st_ino] = _get_config_sync_file_info(file_path)
+                inode_sync_states[os.stat(file_path).st_ino] = _get_config_sync_file_info(
+                    file_path, hash_cache
+                )
 
 
 def _prepare_for_activation_tasks(
@@ -2112,13 +2159,9 @@ def _prepare_for_activation_tasks(
     site_snapshot_settings: Mapping[SiteId, SnapshotSettings],
     time_started: float,
     source: ActivationSource,
-) -> tuple[Mapping[SiteId, ConfigSyncFileInfos], Mapping[SiteId, SiteActivationState]]:
-    config_sync_file_infos_per_inode = _get_config_sync_file_infos_per_inode(
-        get_replication_paths()
-    )
-    central_file_infos_per_site = {}
+) -> Mapping[SiteId, SiteActivationState]:
     site_activation_states_per_site = {}
-    for site_id, snapshot_settings in sorted(site_snapshot_settings.items(), key=lambda e: e[0]):
+    for site_id in sorted(site_snapshot_settings):
         site_activation_state = _initialize_site_activation_state(
             site_id, activation_id, activate_changes, time_started, source
         )
@@ -2129,17 +2172,12 @@ def _prepare_for_activation_tasks(
 
             log_audit("activate-changes", "Started activation of site %s" % site_id)
             site_activation_states_per_site[site_id] = site_activation_state
-
-            if activate_changes.is_sync_needed(site_id):
-                central_file_infos_per_site[site_id] = _get_site_central_file_infos(
-                    site_id, snapshot_settings, config_sync_file_infos_per_inode
-                )
         except Exception as e:
             _handle_activation_changes_exception(
                 logger.getChild(f"site[{site_id}]"), str(e), site_activation_state
             )
             _cleanup_activation(site_id, activation_id, source)
-    return central_file_infos_per_site, site_activation_states_per_site
+    return site_activation_states_per_site
 
 
 def _get_site_central_file_infos(
@@ -2164,6 +2202,33 @@ def _get_site_central_file_infos(
     return central_file_infos
 
 
+def _collect_and_fetch_sync_state(
+    snapshot_settings: SnapshotSettings,
+    site_activation_state: SiteActivationState,
+    config_sync_file_infos_per_inode: Mapping[int, ConfigSyncFileInfo],
+) -> tuple[SyncState, SiteActivationState, float] | None:
+    """Collects the central file infos of the site before fetching the remote ones
+
+    This is done within the task of the site, so that the sync of a site does not have to wait
+    for the file infos of all other sites."""
+    site_id = site_activation_state["_site_id"]
+    start = time.time()
+    try:
+        central_file_infos = _get_site_central_file_infos(
+            site_id, snapshot_settings, config_sync_file_infos_per_inode
+        )
+    except Exception as e:
+        _handle_activation_changes_exception(
+            logger.getChild(f"site[{site_id}]"), str(e), site_activation_state
+        )
+        return None
+    _add_phase_duration(site_activation_state, "collect_file_infos", time.time() - start)
+
+    return fetch_sync_state(
+        snapshot_settings.snapshot_components, site_activation_state, central_file_infos
+    )
+
+
 class ActiveTasks(TypedDict):
     fetch_sync_state: MutableMapping[SiteId, AsyncResult]
     calc_sync_delta: MutableMapping[SiteId, AsyncResult]
@@ -2218,9 +2283,12 @@ def sync_and_activate(
             if _handle_distributed_sites_in_free(site_snapshot_settings, time_started):
                 return
 
-        (site_central_file_infos, site_activation_states) = _prepare_for_activation_tasks(
+        site_activation_states = _prepare_for_activation_tasks(
             activate_changes, activation_id, site_snapshot_settings, time_started, source
         )
+        config_sync_file_infos_per_inode = _get_config_sync_file_infos_per_inode(
+            get_replication_paths()
+        )
 
         task_pool = ThreadPool(processes=len(site_snapshot_settings))
 
@@ -2234,11 +2302,11 @@ def sync_and_activate(
         for site_id, site_activation_state in site_activation_states.items():
             if activate_changes.is_sync_needed(site_id):
                 async_result = task_pool.apply_async(
-                    func=copy_request_context(fetch_sync_state),
+                    func=copy_request_context(_collect_and_fetch_sync_state),
                     args=(
-                        site_snapshot_settings[site_id].snapshot_components,
+                        site_snapshot_settings[site_id],
                         site_activation_state,
-                        site_central_file_infos[site_id],
+                        config_sync_file_infos_per_inode,
                     ),
                     error_callback=_error_callback,
                 )
@@ -2302,11 +2370,11 @@ def _handle_active_tasks(
 ) -> None:
     for site_id, async_result in list(active_tasks["fetch_sync_state"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["fetch_sync_state"].pop(site_id)
         if (fetch_sync_state_results := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         sync_state, activation_state, sync_start_time = fetch_sync_state_results
         remote_config_generation_per_site[site_id] = sync_state.remote_config_generation
@@ -2319,11 +2387,11 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["calc_sync_delta"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["calc_sync_delta"].pop(site_id)
         if (calc_sync_delta_result := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         sync_delta, activation_state, sync_start_time = calc_sync_delta_result
         active_tasks["synchronize_files"][site_id] = task_pool.apply_async(
@@ -2340,11 +2408,11 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["synchronize_files"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["synchronize_files"].pop(site_id)
         if (activation_state := async_result.get()) is None:
-            return  # exception handling happens in thread
+            continue  # exception handling happens in thread
 
         active_tasks["activate_remote_changes"][site_id] = task_pool.apply_async(
             func=copy_request_context(activate_remote_changes),
@@ -2354,7 +2422,7 @@ def _handle_active_tasks(
 
     for site_id, async_result in list(active_tasks["activate_remote_changes"].items()):
         if not async_result.ready():
-            return
+            continue
 
         active_tasks["activate_remote_changes"].pop(site_id)
 
@@ -2896,7 +2964,11 @@ class AutomationGetConfigSyncState(AutomationCommand):
 
     def execute(self, api_request: list[ReplicationPath]) -> GetConfigSyncStateResponse:
         with store.lock_checkmk_configuration():
-            file_infos = _get_config_sync_file_infos(api_request, base_dir=cmk.utils.paths.omd_root)
+            hash_cache = _remote_config_sync_file_hash_cache()
+            file_infos = _get_config_sync_file_infos(
+                api_request, base_dir=cmk.utils.paths.omd_root, hash_cache=hash_cache
+            )
+            hash_cache.save()
             transport_file_infos = {
                 k: (v.st_mode, v.st_size, v.link_target, v.file_hash) for k, v in file_infos.items()
             }
@@ -2936,6 +3008,7 @@ def _get_config_sync_file_infos(
     replication_paths: list[ReplicationPath],
     base_dir: Path,
     config_sync_file_infos_per_inode: Mapping[int, ConfigSyncFileInfo] | None = None,
+    hash_cache: ConfigSyncFileHashCache | None = None,
 ) -> ConfigSyncFileInfos:
     """Scans the given replication paths for the information needed for the config sync
 
@@ -2955,7 +3028,9 @@ def _get_config_sync_file_infos(
             continue  # Only report back existing things
 
         if replication_path.ty == ReplicationPathType.FILE:
-            infos[replication_path.site_path] = _get_config_sync_file_info(replication_path_full)
+            infos[replication_path.site_path] = _get_config_sync_file_info(
+                replication_path_full, hash_cache
+            )
 
         elif replication_path.ty == ReplicationPathType.DIR:
             _get_replication_dir_config_sync_file_infos(
@@ -2964,6 +3039,7 @@ def _get_config_sync_file_infos(
                 base_dir,
                 replication_path_full,
                 replication_path.excludes,
+                hash_cache,
             )
         else:
             raise NotImplementedError()
@@ -2976,6 +3052,7 @@ def _get_replication_dir_config_sync_file_infos(
     base_dir: Path,
     replication_path: str,
     replication_path_excludes: Sequence[str],
+    hash_cache: ConfigSyncFileHashCache | None = None,
 ) -> None:
     # Use os functionality instead of pathlib since it is faster
     for root, dir_names, file_names in os.walk(replication_path):
@@ -2995,19 +3072,29 @@ def _get_replication_dir_config_sync_file_infos(
                 ):
                     infos[valid_site_path] = sync_file_info
                 else:
-                    infos[valid_site_path] = _get_config_sync_file_info(config_sync_path)
+                    infos[valid_site_path] = _get_config_sync_file_info(
+                        config_sync_path, hash_cache
+                    )
             except FileNotFoundError:  # e.g. broken symlinks
-                infos[valid_site_path] = _get_config_sync_file_info(config_sync_path)
+                infos[valid_site_path] = _get_config_sync_file_info(config_sync_path, hash_cache)
 
 
-def _get_config_sync_file_info(file_path: str) -> ConfigSyncFileInfo:
+def _get_config_sync_file_info(
+    file_path: str, hash_cache: ConfigSyncFileHashCache | None = None
+) -> ConfigSyncFileInfo:
     stat = os.lstat(file_path)
-    is_symlink = os.path.islink(file_path)
+    if os.path.islink(file_path):
+        return ConfigSyncFileInfo(stat.st_mode, stat.st_size, os.readlink(str(file_path)), None)
+
     return ConfigSyncFileInfo(
         stat.st_mode,
         stat.st_size,
-        os.readlink(str(file_path)) if is_symlink else None,
-        _create_config_sync_file_hash(file_path) if not is_symlink else None,
+        None,
+        (
+            _create_config_sync_file_hash(file_path)
+            if hash_cache is None
+            else hash_cache.file_hash(file_path, stat)
+        ),
     )
 
 
@@ -3022,6 +3109,48 @@ def _create_config_sync_file_hash(file_path: str) -> str:
     return sha256.hexdigest()
 
 
+class ConfigSyncFileHashCache:
+    """Persistent cache of the hashes of the files to be synchronized
+
+    The hashes are keyed by inode, size and modification time of the files, so only files that
+    have been changed since the last scan need to be hashed again. Only the entries used during a
+    scan are saved, which drops the ones of vanished or changed files.
+    """
+
+    # Files modified this recently may be modified again without changing their modification time
+    # (file systems with coarse timestamps). Their hashes are not cached.
+    _MIN_AGE_NS = 2 * 10**9
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._hashes: dict[tuple[int, int, int], str] = store.load_object_from_pickle_file(
+            path, default={}
+        )
+        self._used_hashes: dict[tuple[int, int, int], str] = {}
+        self._now_ns = time.time_ns()
+
+    def file_hash(self, file_path: str, stat: os.stat_result) -> str:
+        if self._now_ns - stat.st_mtime_ns < self._MIN_AGE_NS:
+            return _create_config_sync_file_hash(file_path)
+
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if (file_hash := self._hashes.get(key)) is None:
+            file_hash = _create_config_sync_file_hash(file_path)
+        self._used_hashes[key] = file_hash
+        return file_hash
+
+    def save(self) -> None:
+        store.save_object_to_pickle_file(self._path, self._used_hashes)
+
+
+def _central_config_sync_file_hash_cache() -> ConfigSyncFileHashCache:
+    return ConfigSyncFileHashCache(wato_var_dir() / "central_config_sync_hashes.pkl")
+
+
+def _remote_config_sync_file_hash_cache() -> ConfigSyncFileHashCache:
+    return ConfigSyncFileHashCache(wato_var_dir() / "remote_config_sync_hashes.pkl")
+
+
 def update_config_generation() -> None:
     """Increase the config generation ID
 
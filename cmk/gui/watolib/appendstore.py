@@ -23,7 +23,8 @@ _VT = TypeVar("_VT")
 class ABCAppendStore(Generic[_VT], abc.ABC):
     """Managing a file with structured data that can be appended in a cheap way
 
-    The file holds basic python structures separated by "\\0".
+    The file holds basic python structures separated by "\\0". Subclasses may choose another
+    encoding of the single entries by overriding _dumps() and _loads().
     """
 
     @staticmethod
@@ -56,17 +57,25 @@ class ABCAppendStore(Generic[_VT], abc.ABC):
     def exists(self) -> bool:
         return self._path.exists()
 
-    def __read(self) -> list[_VT]:
-        """Parse the file and return the entries"""
+    @staticmethod
+    def _dumps(raw: object) -> bytes:
+        """Encode a serialized entry for the file"""
+        return repr(raw).encode("utf-8")
+
+    @staticmethod
+    def _loads(raw: bytes) -> object:
+        """Decode an entry of the file for deserialization"""
+        return ast.literal_eval(raw.decode("utf-8"))
+
+    def _frame(self, entry: _VT) -> bytes:
+        return self._dumps(self._serialize(entry)) + b"\0"
+
+    def _parse(self, content: bytes) -> list[_VT]:
+        """Parse a sequence of entries read from the file"""
         try:
-            with self._path.open("rb") as f:
-                return [
-                    self._deserialize(ast.literal_eval(entry.decode("utf-8")))
-                    for entry in f.read().split(b"\0")
-                    if entry
-                ]
-        except FileNotFoundError:
-            return []
+            return [
+                self._deserialize(self._loads(entry)) for entry in content.split(b"\0") if entry
+            ]
         except SyntaxError as e:
             raise MKUserError(
                 None,
@@ -76,9 +85,17 @@ class ABCAppendStore(Generic[_VT], abc.ABC):
                     "content or remove the file before you visit this page "
                     "again.<br><br>The problematic entry is:<br>%s"
                 )
-                % (f.name, e.text),
+                % (self._path, e.text),
             )
 
+    def __read(self) -> list[_VT]:
+        """Parse the file and return the entries"""
+        try:
+            with self._path.open("rb") as f:
+                return self._parse(f.read())
+        except FileNotFoundError:
+            return []
+
     def read(self) -> Sequence[_VT]:
         with store.locked(self._path):
             return self.__read()
@@ -87,7 +104,7 @@ class ABCAppendStore(Generic[_VT], abc.ABC):
         with store.locked(self._path):
             try:
                 with self._path.open("ab+") as f:
-                    f.write(repr(self._serialize(entry)).encode("utf-8") + b"\0")
+                    f.write(self._frame(entry))
                     f.flush()
                     os.fsync(f.fileno())
                 self._path.chmod(0o660)
@@ -101,7 +118,7 @@ class ABCAppendStore(Generic[_VT], abc.ABC):
             try:
                 yield entries
             finally:
-                with self._path.open("wb"):  # truncate the file
-                    pass
-                for entry in entries:
-                    self.append(entry)
+                # Replace the file in one go instead of appending the entries one by one
+                store.save_bytes_to_file(
+                    self._path, b"".join(self._frame(entry) for entry in entries)
+                )
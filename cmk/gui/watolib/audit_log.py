@@ -5,16 +5,21 @@
 
 from __future__ import annotations
 
+import ast
 import copy
 import json
+import os
+import pickle
 import re
 import time
+import zlib
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import Any, BinaryIO, NamedTuple
 
 from typing_extensions import TypedDict
 
+from cmk.utils import store
 from cmk.utils.user import UserId
 
 import cmk.gui.watolib.git
@@ -48,7 +53,54 @@ class AuditLogFilterRaw(TypedDict, total=False):
     filter_regex: str | None
 
 
+class _AuditLogBlock(NamedTuple):
+    """A consecutive range of entries in the audit log file"""
+
+    offset: int
+    length: int
+    num_entries: int
+    time_from: int
+    time_to: int
+    user_ids: frozenset[str]
+    object_types: frozenset[str | None]
+
+    def may_match(self, options: AuditLogFilter) -> bool:
+        if "timestamp_from" in options and self.time_to < options["timestamp_from"]:
+            return False
+
+        if "timestamp_to" in options and self.time_from > options["timestamp_to"]:
+            return False
+
+        if options.get("user_id") is not None and options["user_id"] not in self.user_ids:
+            return False
+
+        object_type = options.get("object_type", "All")
+        if object_type == "None":
+            return None in self.object_types
+        if object_type != "All":
+            return object_type in self.object_types
+
+        return True
+
+
+class _AuditLogIndex(NamedTuple):
+    inode: int
+    size: int
+    mtime_ns: int
+    last_block_crc: int
+    blocks: Sequence[_AuditLogBlock]
+
+
 class AuditLogStore(ABCAppendStore["AuditLogStore.Entry"]):
+    """The audit log of the Setup
+
+    The entries are JSON encoded, entries of previous versions are python literals. Filtered
+    reads use a block index, which is kept next to the log file and extended with the entries
+    appended in the meantime. Only the blocks that may contain matching entries are parsed.
+    """
+
+    _BLOCK_ENTRIES = 1000
+
     def __init__(self, filepath: Path = wato_var_dir() / "log" / "wato_audit.log") -> None:
         super().__init__(path=filepath)
 
@@ -89,6 +141,18 @@ class AuditLogStore(ABCAppendStore["AuditLogStore.Entry"]):
     def _deserialize(raw: object) -> AuditLogStore.Entry:
         return AuditLogStore.Entry.deserialize(raw)
 
+    @staticmethod
+    def _dumps(raw: object) -> bytes:
+        return json.dumps(raw).encode("utf-8")
+
+    @staticmethod
+    def _loads(raw: bytes) -> object:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            # Entries written by previous versions
+            return ast.literal_eval(raw.decode("utf-8"))
+
     def clear(self) -> None:
         """Instead of just removing, like ABCAppendStore, archive the existing file"""
         if not self.exists():
@@ -107,12 +171,21 @@ class AuditLogStore(ABCAppendStore["AuditLogStore.Entry"]):
         self._path.rename(newpath)
 
     def read(self, options: AuditLogFilter | None = None) -> Sequence[AuditLogStore.Entry]:
-        entries = super().read()
-
         if options is None:
-            return entries
-
-        return [entry for entry in entries if AuditLogStore.filter_entry(entry, options)]
+            return super().read()
+
+        entries: list[AuditLogStore.Entry] = []
+        with store.locked(self._path), self._path.open("rb") as f:
+            for block in self._update_index(f).blocks:
+                if not block.may_match(options):
+                    continue
+                f.seek(block.offset)
+                entries.extend(
+                    entry
+                    for entry in self._parse(f.read(block.length))
+                    if AuditLogStore.filter_entry(entry, options)
+                )
+        return entries
 
     @staticmethod
     def filter_entry(entry: AuditLogStore.Entry, options: AuditLogFilter) -> bool:
@@ -147,8 +220,96 @@ class AuditLogStore(ABCAppendStore["AuditLogStore.Entry"]):
 
         return True
 
+    def _index_path(self) -> Path:
+        return self._path.with_name(f".{self._path.name}.index")
+
+    def _load_index(self) -> _AuditLogIndex | None:
+        try:
+            index = store.load_object_from_pickle_file(self._index_path(), default=None)
+        except (pickle.UnpicklingError, EOFError, TypeError, AttributeError):
+            return None
+        return index if isinstance(index, _AuditLogIndex) else None
+
+    def _update_index(self, f: BinaryIO) -> _AuditLogIndex:
+        """Index the entries appended since the last update
+
+        The index is built from scratch in case the file has been replaced or truncated."""
+        stat = os.fstat(f.fileno())
+        index = self._load_index()
+        if index is not None and (index.inode, index.size, index.mtime_ns) == (
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return index
+
+        blocks: list[_AuditLogBlock] = []
+        if (
+            index is not None
+            and index.blocks
+            and index.inode == stat.st_ino
+            and index.size <= stat.st_size
+            and self._block_crc(f, index.blocks[-1]) == index.last_block_crc
+        ):
+            blocks = list(index.blocks)
+            # Continue filling the last block
+            if blocks[-1].num_entries < self._BLOCK_ENTRIES:
+                blocks.pop()
+
+        offset = blocks[-1].offset + blocks[-1].length if blocks else 0
+        f.seek(offset)
+        blocks.extend(self._index_blocks(f.read(stat.st_size - offset), offset))
+
+        index = _AuditLogIndex(
+            inode=stat.st_ino,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            last_block_crc=self._block_crc(f, blocks[-1]) if blocks else 0,
+            blocks=blocks,
+        )
+        store.save_object_to_pickle_file(self._index_path(), index)
+        return index
+
+    @staticmethod
+    def _block_crc(f: BinaryIO, block: _AuditLogBlock) -> int:
+        f.seek(block.offset)
+        return zlib.crc32(f.read(block.length))
+
+    def _index_blocks(self, content: bytes, offset: int) -> list[_AuditLogBlock]:
+        blocks = []
+        block_start = position = num_entries = 0
+        for record in content.split(b"\0"):
+            position += len(record) + 1
+            if record:
+                num_entries += 1
+            if num_entries == self._BLOCK_ENTRIES:
+                blocks.append(
+                    self._index_block(offset + block_start, content[block_start:position])
+                )
+                block_start, num_entries = position, 0
+
+        if num_entries:
+            blocks.append(self._index_block(offset + block_start, content[block_start:position]))
+        return blocks
+
+    def _index_block(self, offset: int, raw: bytes) -> _AuditLogBlock:
+        entries = self._parse(raw)
+        return _AuditLogBlock(
+            offset=offset,
+            length=len(raw),
+            num_entries=len(entries),
+            time_from=min(entry.time for entry in entries),
+            time_to=max(entry.time for entry in entries),
+            user_ids=frozenset(entry.user_id for entry in entries),
+            object_types=frozenset(
+                entry.object_ref.object_type.name if entry.object_ref else None for entry in entries
+            ),
+        )
+
     def get_entries_since(self, timestamp: int) -> Sequence[AuditLogStore.Entry]:
-        return [entry for entry in self.read() if entry.time > timestamp]
+        return [
+            entry for entry in self.read({"timestamp_from": timestamp}) if entry.time > timestamp
+        ]
 
     @classmethod
     def to_json(cls, entries: Sequence[AuditLogStore.Entry]) -> str:
@@ -13,6 +13,7 @@ import subprocess
 import tarfile
 import time
 import traceback
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, NamedTuple
 
@@ -79,8 +80,14 @@ class ABCSnapshotDataCollector(abc.ABC):
     def __init__(self, site_snapshot_settings: dict[SiteId, SnapshotSettings]) -> None:
         super().__init__()
         self._site_snapshot_settings = site_snapshot_settings
+        self._site_durations: dict[SiteId, float] = {}
         self._logger = logger.getChild(self.__class__.__name__)
 
+    @property
+    def site_durations(self) -> Mapping[SiteId, float]:
+        """The time it took to prepare the files of the single sites"""
+        return self._site_durations
+
     @abc.abstractmethod
     def prepare_snapshot_files(self) -> None:
         """Site independent preparation of files to be used for the sync snapshots
@@ -11,13 +11,14 @@ import os
 import pickle
 import shutil
 import subprocess
+import threading
 import time
 import uuid
 from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager, suppress
 from enum import Enum
 from pathlib import Path
-from typing import Any, Final, Literal, NamedTuple, NotRequired, Protocol
+from typing import Any, Final, Literal, NamedTuple, NotRequired, Protocol, TypeVar
 
 from redis.client import Pipeline
 from typing_extensions import TypedDict
@@ -738,6 +739,131 @@ class _WATOInfoStorageManager:
             storage.write(store_file, data)
 
 
+_T = TypeVar("_T")
+_FileStamp = tuple[int, int, int]
+
+
+def _file_stamp(path: str) -> _FileStamp | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class _ParsedFolderFilesCache:
+    """Process wide cache of the parsed .wato and hosts.mk files of the folder tree
+
+    Without Redis, every request executes the files of all folders it touches. The parsed
+    data is kept in the memory of the process and persisted to a single pickle file shared
+    by all GUI processes. An entry is only used as long as inode, size and mtime of the file
+    it was parsed from are unchanged, so a changed hosts.mk is parsed again on the next access
+    and only the entry of this folder is updated.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._entries: dict[str, tuple[_FileStamp, bytes]] = {}
+        self._updated: dict[str, tuple[_FileStamp, bytes]] = {}
+        self._loaded_stamp: _FileStamp | None = None
+        # The cache is shared by all request threads of the process. _lock protects the
+        # attributes above, _save_lock serializes the saving, because the file lock of
+        # store.locked() does not exclude other threads of the same process.
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def get(self, file_path: str, parse: Callable[[], _T]) -> _T:
+        if (stamp := _file_stamp(file_path)) is None:
+            return parse()
+
+        with self._lock:
+            cached = self._lookup(file_path, stamp)
+        if cached is not None:
+            # Unpickle for every access: The callers are free to modify what they get
+            return pickle.loads(cached)
+
+        data = parse()
+        # Don't remember the result in case the file was replaced while it was parsed
+        if _file_stamp(file_path) == stamp:
+            entry = (stamp, pickle.dumps(data))
+            with self._lock:
+                self._updated[file_path] = self._entries[file_path] = entry
+        return data
+
+    def _lookup(self, file_path: str, stamp: _FileStamp) -> bytes | None:
+        entry = self._entries.get(file_path)
+        if (entry is None or entry[0] != stamp) and self._refresh():
+            entry = self._entries.get(file_path)
+        return entry[1] if entry is not None and entry[0] == stamp else None
+
+    def _refresh(self) -> bool:
+        """Pick up the entries other processes have saved since the last load
+
+        Has to be called with the lock held."""
+        if (stamp := _file_stamp(str(self._path))) is None or stamp == self._loaded_stamp:
+            return False
+        try:
+            entries = store.load_object_from_pickle_file(self._path, default={})
+        except (TypeError, EOFError, pickle.UnpicklingError) as e:
+            logger.warning("Unable to read the folder tree cache from disk: %s", str(e))
+            entries = {}
+        self._entries = entries | self._updated
+        self._loaded_stamp = stamp
+        return True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._updated:
+                return
+            saved = dict(self._updated)
+
+        store.makedirs(self._path.parent)
+        with self._save_lock, store.locked(self._path):
+            with self._lock:
+                self._refresh()
+                # Drop the entries of removed or changed files while we are at it
+                self._entries = entries = {
+                    file_path: entry
+                    for file_path, entry in self._entries.items()
+                    if _file_stamp(file_path) == entry[0]
+                }
+            store.save_object_to_pickle_file(self._path, entries)
+            stamp = _file_stamp(str(self._path))
+            with self._lock:
+                self._loaded_stamp = stamp
+                # Entries added by other threads in the meantime are saved the next time
+                for file_path, entry in saved.items():
+                    if self._updated.get(file_path) is entry:
+                        del self._updated[file_path]
+
+
+_PARSED_FOLDER_FILES_CACHES: dict[Path, _ParsedFolderFilesCache] = {}
+
+
+def _parsed_folder_files_cache() -> _ParsedFolderFilesCache:
+    path = Path(cmk.utils.paths.tmp_dir, "wato", "folder_tree.cache")
+    if (cache := _PARSED_FOLDER_FILES_CACHES.get(path)) is None:
+        cache = _PARSED_FOLDER_FILES_CACHES[path] = _ParsedFolderFilesCache(path)
+    return cache
+
+
+def _save_parsed_folder_files_caches() -> None:
+    for cache in _PARSED_FOLDER_FILES_CACHES.values():
+        try:
+            cache.save()
+        except OSError as e:
+            logger.warning("Unable to save the folder tree cache: %s", str(e))
+
+
+hooks.register_builtin("request-end", _save_parsed_folder_files_caches)
+
+
+def _load_wato_info(wato_info_path: str) -> WATOFolderInfo:
+    return _parsed_folder_files_cache().get(
+        wato_info_path, lambda: Folder.wato_info_storage_manager().read(Path(wato_info_path))
+    )
+
+
 class EffectiveAttributes:
     """A memoized access to the effective attributes of hosts and folders"""
 
@@ -988,7 +1114,7 @@ class FolderTree:
         if may_use_redis():
             get_wato_redis_client(self).clear_cached_folders()
         g.pop("wato_folders", {})
-        for cache_id in ["folder_choices", "folder_choices_full_title"]:
+        for cache_id in ["folder_choices", "folder_choices_full_title", "host_attributes_index"]:
             g.pop(cache_id, None)
 
     def _by_id(self, identifier: str) -> Folder:
@@ -1039,6 +1165,13 @@ def folder_tree() -> FolderTree:
     return g.folder_tree
 
 
+# Hope that we can cleanup these request global objects one day
+def host_attributes_index() -> HostAttributesIndex:
+    if "host_attributes_index" not in g:
+        g.host_attributes_index = HostAttributesIndex()
+    return g.host_attributes_index
+
+
 # Hope that we can cleanup these request global objects one day
 def folder_lookup_cache() -> FolderLookupCache:
     if "folder_lookup_cache" not in g:
@@ -1153,9 +1286,10 @@ class Folder(FolderProtocol):
         parent_folder: Folder | None,
     ) -> Folder:
         folder_path = os.path.join(parent_folder.path(), name) if parent_folder else name
-        serialized = cls.wato_info_storage_manager().read(
-            Path(_folder_wato_info_path(_folder_filesystem_path(tree.get_root_dir(), folder_path)))
+        wato_info_path = _folder_wato_info_path(
+            _folder_filesystem_path(tree.get_root_dir(), folder_path)
         )
+        serialized = _load_wato_info(wato_info_path)
 
         return cls(
             tree=tree,
@@ -1281,6 +1415,9 @@ class Folder(FolderProtocol):
         return variables
 
     def _load_wato_hosts(self) -> WATOHosts | None:
+        return _parsed_folder_files_cache().get(self.hosts_file_path(), self._parse_wato_hosts)
+
+    def _parse_wato_hosts(self) -> WATOHosts | None:
         if (variables := self._load_hosts_file()) is None:
             return None
         return WATOHosts(
@@ -1301,6 +1438,7 @@ class Folder(FolderProtocol):
                 host.drop_caches()
 
             self._save_hosts_file()
+            g.pop("host_attributes_index", None)
             if may_use_redis():
                 # Inform redis that the modified-timestamp of the folder has been updated.
                 get_wato_redis_client(self.tree).folder_updated(self.filesystem_path())
@@ -2959,28 +3097,21 @@ class SearchFolder(FolderProtocol):
         if not in_folder.permissions.may("read"):
             return {}
 
+        section = host_attributes_index().section(in_folder)
+        if not (matching := section.matching_hosts(self._criteria)):
+            return {}
+
         found = {}
         for host_name, host in in_folder.hosts().items():
+            if host_name not in matching:
+                continue
+
             if self._criteria[".name"] and not host_attribute_matches(
                 self._criteria[".name"], host_name
             ):
                 continue
 
-            # Compute inheritance
-            effective = host.effective_attributes()
-
-            # Check attributes
-            dont_match = False
-            for attr in host_attribute_registry.attributes():
-                attrname = attr.name()
-                if attrname in self._criteria and not attr.filter_matches(
-                    self._criteria[attrname], effective.get(attrname), host_name
-                ):
-                    dont_match = True
-                    break
-
-            if not dont_match:
-                found[host_name] = host
+            found[host_name] = host
 
         return found
 
@@ -2997,6 +3128,136 @@ def parent_folder_chain(origin: SearchFolder | Folder) -> list[Folder]:
     return folders[::-1]
 
 
+class HostAttributesIndexSection:
+    """The pre-evaluated effective attributes of the hosts of one folder
+
+    Only the effective attributes of the folder are computed in advance. The ones of the hosts
+    are derived from them on access, which keeps the index small on big installations.
+    """
+
+    def __init__(
+        self,
+        folder_attributes: HostAttributes,
+        folder_labels: Labels,
+        host_attributes: Mapping[HostName, HostAttributes],
+    ) -> None:
+        self._folder_attributes = folder_attributes
+        self._folder_labels = folder_labels
+        self._host_attributes = host_attributes
+        self._hosts_by_value: dict[str, Sequence[tuple[Any, Sequence[HostName]]]] = {}
+
+    def host_names(self) -> Collection[HostName]:
+        return self._host_attributes.keys()
+
+    def effective_attributes(self, host_name: HostName) -> HostAttributes:
+        effective = self._folder_attributes.copy()
+        effective.update(self._host_attributes[host_name])
+        effective["labels"] = self._labels(host_name)
+        return effective
+
+    def _labels(self, host_name: HostName) -> Labels:
+        return {**self._folder_labels, **self._host_attributes[host_name].get("labels", {})}
+
+    def _effective_value(self, host_name: HostName, attrname: str) -> Any:
+        if attrname == "labels":
+            return self._labels(host_name)
+        if attrname in (attributes := self._host_attributes[host_name]):
+            return attributes[attrname]  # type: ignore[literal-required]
+        return self._folder_attributes.get(attrname)
+
+    def hosts_by_value(self, attrname: str) -> Sequence[tuple[Any, Sequence[HostName]]]:
+        """The inverted index of one attribute: Its distinct effective values and their hosts"""
+        if (by_value := self._hosts_by_value.get(attrname)) is None:
+            groups: dict[str, tuple[Any, list[HostName]]] = {}
+            for host_name in self._host_attributes:
+                value = self._effective_value(host_name, attrname)
+                groups.setdefault(repr(value), (value, []))[1].append(host_name)
+            by_value = self._hosts_by_value[attrname] = list(groups.values())
+        return by_value
+
+    def matching_hosts(self, criteria: SearchCriteria) -> set[HostName]:
+        matching = set(self._host_attributes)
+        for attr in host_attribute_registry.attributes():
+            if not matching:
+                break
+            if (attrname := attr.name()) not in criteria:
+                continue
+            matching.intersection_update(
+                host_name
+                for value, host_names in self.hosts_by_value(attrname)
+                # The filters only look at the value, so one check per distinct value is enough
+                if attr.filter_matches(criteria[attrname], value, host_names[0])
+                for host_name in host_names
+            )
+        return matching
+
+
+_HOST_ATTRIBUTES_INDEX_SECTIONS: dict[
+    str, tuple[Sequence[_FileStamp | None], HostAttributesIndexSection]
+] = {}
+
+
+class HostAttributesIndex:
+    """Index of the effective attributes of the hosts in the folder tree
+
+    Computing the effective attributes means walking up the folder chain of each host. The index
+    holds one section per folder which is computed from the saved .wato files of the folder and
+    its parents and the hosts.mk of the folder. The sections are shared by all requests of the
+    process and are only computed again once one of these files changed. Together with the
+    inverted indexes of the sections this serves the host search, the host listing of the REST API
+    and the bulk operations without touching the hosts of non-matching folders.
+
+    Unsaved modifications of the folders and hosts are not reflected by the index.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[PathWithoutSlash, HostAttributesIndexSection] = {}
+
+    def section(self, folder: Folder) -> HostAttributesIndexSection:
+        if (section := self._sections.get(folder.path())) is None:
+            section = self._sections[folder.path()] = self._load_section(folder)
+        return section
+
+    def effective_attributes(self, host: Host) -> HostAttributes:
+        section = self.section(host.folder())
+        if host.name() not in section.host_names():
+            return host.effective_attributes()  # Not saved yet
+        return section.effective_attributes(host.name())
+
+    def _load_section(self, folder: Folder) -> HostAttributesIndexSection:
+        folders = parent_folder_chain(folder) + [folder]
+        file_paths = [f.wato_info_path() for f in folders] + [folder.hosts_file_path()]
+        stamps = [_file_stamp(file_path) for file_path in file_paths]
+
+        cached = _HOST_ATTRIBUTES_INDEX_SECTIONS.get(folder.filesystem_path())
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+
+        section = self._compute_section(folders)
+        _HOST_ATTRIBUTES_INDEX_SECTIONS[folder.filesystem_path()] = (stamps, section)
+        return section
+
+    def _compute_section(self, folders: Sequence[Folder]) -> HostAttributesIndexSection:
+        # Same as Folder._compute_effective_attributes(), but based on the saved attributes
+        attributes = HostAttributes()
+        labels: dict[str, str] = {}
+        for folder in folders:
+            saved_attributes = _load_wato_info(folder.wato_info_path()).get("attributes", {})
+            attributes.update(saved_attributes)  # type: ignore[typeddict-item]
+            labels.update(saved_attributes.get("labels", {}).items())
+
+        for host_attribute in host_attribute_registry.attributes():
+            # Mypy can not help here with the dynamic key
+            attributes.setdefault(host_attribute.name(), host_attribute.default_value())  # type: ignore[misc]
+
+        wato_hosts = folders[-1]._load_wato_hosts()
+        return HostAttributesIndexSection(
+            attributes,
+            labels,
+            wato_hosts["host_attributes"] if wato_hosts is not None else {},
+        )
+
+
 class Host:
     """Class representing one host that is managed via Setup. Hosts are contained in Folders."""
 
@@ -5,7 +5,7 @@
 
 
 from ._grouping import PREDICTION_PERIODS, Timegroup, timezone_at
-from ._plugin_interface import estimate_levels, make_updated_predictions
+from ._plugin_interface import estimate_levels, make_updated_predictions, precompute_predictions
 from ._prediction import DataStat, PredictionData, PredictionStore
 from ._query import PredictionQuerier
 
@@ -13,6 +13,7 @@ __all__ = [
     "DataStat",
     "estimate_levels",
     "make_updated_predictions",
+    "precompute_predictions",
     "PredictionData",
     "PREDICTION_PERIODS",
     "PredictionQuerier",
@@ -4,7 +4,9 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 """Code for predictive monitoring / anomaly detection"""
 
+import functools
 import logging
+import zlib
 from collections.abc import Callable, Mapping
 from typing import assert_never, Literal
 
@@ -12,6 +14,7 @@ from cmk.utils.log import VERBOSE
 
 from cmk.agent_based.prediction_backend import PredictionInfo
 
+from ._grouping import time_slices
 from ._prediction import (
     compute_prediction,
     LevelsSpec,
@@ -27,18 +30,71 @@ logger = logging.getLogger("cmk.prediction")
 
 def make_updated_predictions(
     store: PredictionStore,
-    get_recorded_data: Callable[[str, int, int], MetricRecord | None],
+    get_recorded_data: Callable[[str, int, int, int], MetricRecord | None],
     now: float,
 ) -> Mapping[int, tuple[float | None, tuple[float, float] | None]]:
     store.remove_outdated_predictions(now)
+    # Predictions of the same metric (e.g. upper and lower levels) share their RRD fetches
+    get_shared_recorded_data = functools.cache(get_recorded_data)
     return {
         hash(meta): _make_reference_and_prediction(
-            meta, valid_prediction or _update_prediction(store, meta, get_recorded_data), now
+            meta, valid_prediction or _update_prediction(store, meta, get_shared_recorded_data), now
         )
         for meta, valid_prediction in store.iter_all_valid_predictions(now)
     }
 
 
+def precompute_predictions(
+    store: PredictionStore,
+    get_recorded_data: Callable[[str, int, int, int], MetricRecord | None],
+    now: float,
+    lead_time: float,
+) -> int:
+    """Compute the predictions of the next interval before the current ones expire
+
+    All predictions expire at the same time (midnight), so computing their successors on demand
+    makes the first check cycle of the day very expensive. Each successor becomes due at some
+    point within the last lead_time seconds of the current interval. The point is derived from
+    the name of the prediction, so the work is spread over the lead time if this is called
+    periodically. Returns the number of computed predictions.
+
+    Periods like "hour" or "minute" use the current day as well. Data recorded during the
+    rest of it would be missing in their successors, so they are still computed on demand."""
+    get_shared_recorded_data = functools.cache(get_recorded_data)
+    computed = 0
+    for meta, _prediction in store.iter_all_valid_predictions(now):
+        successor = PredictionInfo.make(
+            meta.metric, meta.direction, meta.params, meta.valid_interval[1]
+        )
+        if (
+            successor == meta
+            or store.has_prediction(successor)
+            or now < _precomputation_due(store, successor, lead_time)
+            or _lacks_future_data(successor, now)
+        ):
+            continue
+
+        store.save_prediction_info(successor)
+        if _update_prediction(store, successor, get_shared_recorded_data) is not None:
+            computed += 1
+    return computed
+
+
+def _precomputation_due(store: PredictionStore, meta: PredictionInfo, lead_time: float) -> float:
+    name = str(store.path / store.relative_data_file(meta))
+    return meta.valid_interval[0] - lead_time * (1.0 - zlib.crc32(name.encode()) / 2**32)
+
+
+def _lacks_future_data(meta: PredictionInfo, now: float) -> bool:
+    """Does one of the time slices of the prediction end between now and its validity?"""
+    return any(
+        start < meta.valid_interval[0] and end > now
+        for start, end in time_slices(
+            meta.valid_interval[0], meta.params.horizon * 86400, meta.params.period
+        )
+    )
+
+
 def _make_reference_and_prediction(
     meta: PredictionInfo,
     prediction: PredictionData | None,
@@ -59,7 +115,7 @@ def _make_reference_and_prediction(
 def _update_prediction(
     store: PredictionStore,
     meta: PredictionInfo,
-    get_recorded_data: Callable[[str, int, int], MetricRecord | None],
+    get_recorded_data: Callable[[str, int, int, int], MetricRecord | None],
 ) -> PredictionData | None:
     logger.log(
         VERBOSE,
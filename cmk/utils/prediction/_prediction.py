@@ -4,10 +4,9 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import logging
-import math
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Final, Literal, NamedTuple, Protocol, Self
+from typing import Final, Literal, NamedTuple, Protocol, TYPE_CHECKING
 
 from pydantic import BaseModel
 
@@ -15,6 +14,12 @@ from cmk.agent_based.prediction_backend import PredictionInfo
 
 from ._grouping import time_slices
 
+# numpy is only needed to compute predictions. It is imported where it is used: This module
+# is imported by every checker process, and most of them never compute a prediction.
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 logger = logging.getLogger("cmk.prediction")
 
 
@@ -23,6 +28,9 @@ LevelsSpec = tuple[Literal["absolute", "relative", "stdev"], tuple[float, float]
 
 _DAY = 86400
 
+_MAX_ENTRIES_PER_SLICE: Final = 400
+_SLICES_PER_FETCH: Final = 7
+
 
 class MetricRecord(Protocol):
     @property
@@ -40,17 +48,6 @@ class DataStat(NamedTuple):
     max_: float
     stdev: float | None
 
-    @classmethod
-    def from_values(cls, values: Sequence[float]) -> Self:
-        """Statistically summarize all the measured values"""
-        average = sum(values) / float(len(values))
-        return cls(
-            average=average,
-            min_=min(values),
-            max_=max(values),
-            stdev=_std_dev(values, average),
-        )
-
 
 class PredictionData(BaseModel, frozen=True):
     points: list[DataStat | None]
@@ -105,6 +102,14 @@ class PredictionStore:
             if metric in prediction_file.parts
         )
 
+    def save_prediction_info(self, meta: PredictionInfo) -> None:
+        info_file = Path(self.meta_file_path_template.format(meta=meta))
+        info_file.parent.mkdir(exist_ok=True, parents=True)
+        info_file.write_text(meta.model_dump_json())
+
+    def has_prediction(self, meta: PredictionInfo) -> bool:
+        return self._data_file(meta).exists()
+
     def save_prediction(self, meta: PredictionInfo, prediction: PredictionData) -> None:
         data_file = self._data_file(meta)
         data_file.parent.mkdir(exist_ok=True, parents=True)
@@ -135,8 +140,10 @@ class PredictionStore:
 
             data_path = info_path.with_suffix(self.DATA_FILE_SUFFIX)
             try:
-                if info_path.stat().st_mtime >= data_path.stat().st_mtime:
+                # The data is only valid if it was computed after the info was (re)written
+                if data_path.stat().st_mtime >= info_path.stat().st_mtime:
                     yield meta, PredictionData.model_validate_json(data_path.read_text())
+                    continue
             except FileNotFoundError:
                 pass
 
@@ -145,40 +152,67 @@ class PredictionStore:
 
 def compute_prediction(
     info: PredictionInfo,
-    get_recorded_data: Callable[[str, int, int], MetricRecord | None],
+    get_recorded_data: Callable[[str, int, int, int], MetricRecord | None],
 ) -> PredictionData | None:
     time_windows = time_slices(
         info.valid_interval[0], info.params.horizon * 86400, info.params.period
     )
+    rrd_name = f"{info.metric}.max"
 
-    from_time = time_windows[0][0]
-    raw_slices = [
-        (
-            response.window,
-            response.values,
-            from_time - start,
-        )
-        for start, end in time_windows
-        if (response := get_recorded_data(f"{info.metric}.max", start, end))
+    # The youngest slice determines the resolution of the prediction.
+    (from_time, until_time), *older_windows = time_windows
+    if (
+        youngest := get_recorded_data(rrd_name, from_time, until_time, _MAX_ENTRIES_PER_SLICE)
+    ) is None:
+        return None
+
+    # Periods like "hour" use (almost) every day of the horizon. Their slices are fetched in
+    # chunks, which saves most of the RRD queries. Chunks are kept short, because RRDtool
+    # returns the whole chunk in the resolution available for its oldest part.
+    chunk_size = _SLICES_PER_FETCH if _cover_their_span(time_windows) else 1
+    raw_slices: list[tuple[range, Sequence[float | None], int]] = [
+        (youngest.window, youngest.values, 0)
     ]
+    for offset in range(0, len(older_windows), chunk_size):
+        chunk = older_windows[offset : offset + chunk_size]
+        if response := get_recorded_data(
+            rrd_name, chunk[-1][0], chunk[0][1], _MAX_ENTRIES_PER_SLICE * len(chunk)
+        ):
+            raw_slices.extend(
+                (response.window, response.values, from_time - start) for start, _end in chunk
+            )
+
+    return _calculate_data_for_prediction(youngest.window, raw_slices)
+
 
-    return _calculate_data_for_prediction(raw_slices[0][0], raw_slices) if raw_slices else None
+def _cover_their_span(time_windows: Sequence[tuple[int, int]]) -> bool:
+    """Do the slices cover (almost) all of the time between the oldest and the youngest one?
+
+    DST shifts may leave small gaps or overlaps, so anything above half the span counts."""
+    span = time_windows[0][1] - time_windows[-1][0]
+    return 2 * sum(end - start for start, end in time_windows) > span
 
 
 def _calculate_data_for_prediction(
     youngest_range: range,
     raw_slices: Sequence[tuple[range, Sequence[float | None], int]],
 ) -> PredictionData:
+    import numpy as np
+
     # Upsample all time slices to same resolution
     # We assume that the youngest slice has the finest resolution.
-    slices = [
-        _forward_fill_resample(
-            current_range,
-            values,
-            range(youngest_range.start - shift, youngest_range.stop - shift, youngest_range.step),
-        )
-        for current_range, values, shift in raw_slices
-    ]
+    timestamps = np.arange(youngest_range.start, youngest_range.stop, youngest_range.step)
+    # Slices cut from the same RRD fetch share their values, convert them only once
+    arrays: dict[int, "npt.NDArray[np.float64]"] = {}
+    for _range, values, _shift in raw_slices:
+        if id(values) not in arrays:
+            arrays[id(values)] = _to_array(values)
+    slices = np.stack(
+        [
+            _forward_fill_resample(current_range, arrays[id(values)], timestamps - shift)
+            for current_range, values, shift in raw_slices
+        ]
+    )
 
     return PredictionData(
         points=_data_stats(slices),
@@ -187,34 +221,53 @@ def _calculate_data_for_prediction(
     )
 
 
+def _to_array(values: Sequence[float | None]) -> "npt.NDArray[np.float64]":
+    """Convert RRD values to a float array, missing values become NaN"""
+    import numpy as np
+
+    return np.array(values, dtype=np.float64)
+
+
 def _forward_fill_resample(
-    current_range: range, values: Sequence[float | None], new_range: range
-) -> Sequence[float | None]:
-    if current_range == new_range:
-        return values
+    current_range: range, values: "npt.NDArray[np.float64]", timestamps: "npt.NDArray[np.int_]"
+) -> "npt.NDArray[np.float64]":
+    import numpy as np
 
-    idx_max = len(values) - 1
-    return [
-        values[max(0, min(int((t - current_range.start) / current_range.step), idx_max))]
-        for t in new_range
-    ]
+    indices = np.clip((timestamps - current_range.start) // current_range.step, 0, len(values) - 1)
+    return values[indices]
 
 
 def _data_stats(slices: Iterable[Iterable[float | None]]) -> list[DataStat | None]:
-    "Statistically summarize all the upsampled RRD data"
-    return [  # can't inline this b/c it is unit tested :-/
-        DataStat.from_values(point_line)
-        if (point_line := [x for x in time_column if x is not None])
+    """Statistically summarize all the upsampled RRD data
+
+    Every row of slices is one time slice, every column one point in time."""
+    import numpy as np
+
+    data = np.array(slices, dtype=np.float64, ndmin=2)
+    present = ~np.isnan(data)
+    samples = present.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average = np.where(present, data, 0.0).sum(axis=0) / samples
+        squares = np.where(present, data**2, 0.0).sum(axis=0)
+        # In the case of a single data-point an unbiased standard deviation is undefined.
+        stdev = np.sqrt(np.abs(squares - average**2 * samples) / (samples - 1))
+    minimum = np.where(present, data, np.inf).min(axis=0)
+    maximum = np.where(present, data, -np.inf).max(axis=0)
+
+    return [
+        DataStat(
+            average=avg,
+            min_=min_,
+            max_=max_,
+            stdev=std if count > 1 else None,
+        )
+        if count
         else None
-        for time_column in zip(*slices)
+        for count, avg, min_, max_, std in zip(
+            samples.tolist(),
+            average.tolist(),
+            minimum.tolist(),
+            maximum.tolist(),
+            stdev.tolist(),
+        )
     ]
-
-
-def _std_dev(point_line: Sequence[float], average: float) -> float | None:
-    samples = len(point_line)
-    # In the case of a single data-point an unbiased standard deviation is undefined.
-    if samples == 1:
-        return None
-    return math.sqrt(
-        abs(sum(p**2 for p in point_line) - average**2 * samples) / float(samples - 1)
-    )
@@ -17,11 +17,12 @@ import json
 import os
 import re
 import select
+import selectors
 import socket
 import ssl
 import threading
 import time
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Container, Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cache
@@ -275,6 +276,9 @@ class Helpers:
     def query(self, query: QueryTypes, add_headers: str = "") -> LivestatusResponse:
         raise NotImplementedError()
 
+    def query_iter(self, query: QueryTypes, add_headers: str = "") -> Iterator[LivestatusRow]:
+        raise NotImplementedError()
+
     def query_value(self, query: QueryTypes, deflt: Any = no_default) -> LivestatusColumn:
         """Issues a query that returns exactly one line and one columns and returns
         the response as a single value"""
@@ -501,6 +505,228 @@ Must begin with 'tcp:', 'tcp6:' or 'unix:'
     )
 
 
+def parse_response_header(header: bytes) -> tuple[str, int]:
+    """Parses the fixed16 response header to the status code and the payload length
+
+    Examples:
+
+        >>> parse_response_header(b"200          25\\n")
+        ('200', 25)
+
+        >>> parse_response_header(b"HTTP/1.1 400 Bad")
+        Traceback (most recent call last):
+        ...
+        cmk.livestatus_client.MKLivestatusSocketError: Malformed response header b'HTTP/1.1 400 \
+Bad'. Livestatus TCP socket might be unreachable or wrong encryption settings are used.
+
+    """
+    try:
+        # Headers are always ASCII encoded
+        return header[0:3].decode("ascii"), int(header[4:15].lstrip())
+    except Exception:
+        raise MKLivestatusSocketError(
+            f"Malformed response header {header!r}. Livestatus TCP socket might be "
+            "unreachable or wrong encryption settings are used."
+        )
+
+
+def check_response_code(code: str, data: bytes) -> bytes:
+    """Returns the payload of a successful response or raises the error reported by the core"""
+    if code == "200":
+        return data
+
+    error_info = data.decode("utf-8")
+    if code == "404":
+        raise MKLivestatusTableNotFoundError(f"Not Found ({code}): {error_info!r}")
+
+    if code == "502":
+        raise MKLivestatusBadGatewayError(error_info)
+
+    raise MKLivestatusQueryError(f"{code}: {error_info}")
+
+
+_RECEIVE_CHUNK_SIZE = 65536
+
+# Characters which change the nesting of a response outside of strings, and the characters
+# ending a string (or escaping the next character) inside of strings
+_STRUCTURE_CHARS = re.compile(rb"[][(){}\"']")
+_STRING_END_CHARS = {
+    ord('"'): re.compile(rb'["\\]'),
+    ord("'"): re.compile(rb"['\\]"),
+}
+
+
+class ResponseRowParser:
+    """Splits a response into its rows while it is being received
+
+    The data is fed in arbitrary chunks. Only the row which is currently being received is
+    buffered, which keeps the memory usage bounded even for huge responses. Each complete row
+    is handed over to parse_row, e.g. json.loads or ast.literal_eval.
+
+    Examples:
+
+        >>> parser = ResponseRowParser(json.loads)
+        >>> parser.feed(b'[["a]", 1],\\n["b')
+        [['a]', 1]]
+        >>> parser.feed(b'\\\\"c", 2]]\\n')
+        [['b"c', 2]]
+        >>> parser.close()
+
+    """
+
+    def __init__(self, parse_row: Callable[[str], LivestatusRow]) -> None:
+        self._parse_row = parse_row
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._quote: int | None = None
+        self._row_start: int | None = None
+
+    def feed(self, data: bytes) -> list[LivestatusRow]:
+        buf = self._buffer
+        buf += data
+        rows: list[LivestatusRow] = []
+        pos = self._pos
+        while True:
+            if self._quote is not None:
+                if (match := _STRING_END_CHARS[self._quote].search(buf, pos)) is None:
+                    pos = len(buf)
+                    break
+                pos = match.end()
+                if buf[match.start()] == ord("\\"):
+                    if pos == len(buf):
+                        # Look at the escape sequence again once it is complete
+                        pos = match.start()
+                        break
+                    pos += 1
+                else:
+                    self._quote = None
+                continue
+
+            if (match := _STRUCTURE_CHARS.search(buf, pos)) is None:
+                pos = len(buf)
+                break
+            pos = match.end()
+            char = buf[match.start()]
+            if char in b"\"'":
+                self._quote = char
+            elif char in b"[({":
+                self._depth += 1
+                if self._depth == 2:
+                    self._row_start = match.start()
+            else:
+                self._depth -= 1
+                if self._depth == 1 and self._row_start is not None:
+                    rows.append(self._parse(buf[self._row_start : pos]))
+                    self._row_start = None
+
+        # Drop everything not belonging to the row currently received
+        consumed = pos if self._row_start is None else self._row_start
+        del buf[:consumed]
+        self._pos = pos - consumed
+        if self._row_start is not None:
+            self._row_start = 0
+        return rows
+
+    def close(self) -> None:
+        if self._depth != 0 or self._quote is not None or self._buffer.strip():
+            raise MKLivestatusQueryError("Malformed raw response output")
+
+    def _parse(self, raw_row: bytearray) -> LivestatusRow:
+        try:
+            return self._parse_row(raw_row.decode("utf-8"))
+        except (ValueError, SyntaxError):
+            raise MKLivestatusQueryError("Malformed raw response output")
+
+
+ConnectionPoolKey = tuple[str, bool, bool, str | None]
+
+
+class ConnectionPool:
+    """Keeps the idle sockets of finished connections for reuse by later connections
+
+    Unlike the persistent connections, a socket is only used by one connection at a time, which
+    makes the pool safe to be shared by all threads of a process. The sockets are pooled per
+    socket URL and TLS settings. They carry no authorization state, the AuthUser is sent with
+    each query. Before handing out an idle socket, the pool makes sure that it is not readable,
+    which would mean that the peer has closed the connection.
+    """
+
+    def __init__(self, max_idle_per_site: int = 8, max_idle_time: float = 60.0) -> None:
+        self.max_idle_per_site = max_idle_per_site
+        self.max_idle_time = max_idle_time
+        self._lock = threading.Lock()
+        self._idle: dict[ConnectionPoolKey, list[tuple[float, socket.socket]]] = {}
+        self._reused = 0
+        self._missed = 0
+        self._discarded = 0
+
+    def reset_after_fork(self) -> None:
+        """Forgets the idle sockets inherited from the parent process
+
+        To be called in a forked child. The sockets are not closed, since they are still used
+        by the parent process (and the child may already have closed or reused their file
+        descriptors). The lock is replaced, it may have been held by another thread of the
+        parent while forking.
+        """
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def checkout(self, key: ConnectionPoolKey) -> socket.socket | None:
+        while True:
+            with self._lock:
+                if not (idle := self._idle.get(key)):
+                    self._missed += 1
+                    return None
+                idle_since, sock = idle.pop()
+
+            if time.time() - idle_since <= self.max_idle_time and _is_idle_socket_usable(sock):
+                with self._lock:
+                    self._reused += 1
+                return sock
+            self._discard(sock)
+
+    def checkin(self, key: ConnectionPoolKey, sock: socket.socket) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_site:
+                idle.append((time.time(), sock))
+                return
+        self._discard(sock)
+
+    def clear(self) -> None:
+        with self._lock:
+            idle_sockets = [sock for idle in self._idle.values() for _since, sock in idle]
+            self._idle.clear()
+        for sock in idle_sockets:
+            self._discard(sock)
+
+    def statistics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "reused": self._reused,
+                "missed": self._missed,
+                "discarded": self._discarded,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+            }
+
+    def _discard(self, sock: socket.socket) -> None:
+        with self._lock:
+            self._discarded += 1
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
+def _is_idle_socket_usable(sock: socket.socket) -> bool:
+    # There is nothing to read from an idle socket, unless the peer has closed the connection
+    try:
+        return not is_socket_readable(sock, 0.0)
+    except (OSError, ValueError):
+        return False
+
+
 class SingleSiteConnection(Helpers):
     # So we only collect in a specific thread, and not in all of them. We also use
     # a class-variable for this case, so we activate this across all sites at once.
@@ -515,6 +741,7 @@ class SingleSiteConnection(Helpers):
         tls: bool = False,
         verify: bool = True,
         ca_file_path: str | None = None,
+        pool: ConnectionPool | None = None,
     ) -> None:
         """Create a new connection to a MK Livestatus socket"""
         super().__init__()
@@ -531,6 +758,11 @@ class SingleSiteConnection(Helpers):
         self.socket: socket.socket | None = None
         self.timeout: int | None = None
         self.successful_persistence = False
+        self.pool = pool
+        # The process which opened the socket, a forked child must not hand it to the pool
+        self._socket_pid: int | None = None
+        # Whether the response to the last query has not been read completely
+        self.response_pending = False
         self._output_format = LivestatusOutputFormat.PYTHON
 
         # Whether to establish an encrypted connection
@@ -555,6 +787,10 @@ class SingleSiteConnection(Helpers):
             self.socket.settimeout(float(timeout))
 
     def _try_get_persisted_connection(self) -> socket.socket | None:
+        if self.pool is not None:
+            if (site_socket := self.pool.checkout(self._pool_key())) is not None:
+                self.successful_persistence = True
+            return site_socket
         if self.persist and self.socketurl in persistent_connections:
             self.successful_persistence = True
             return persistent_connections[self.socketurl]
@@ -563,9 +799,29 @@ class SingleSiteConnection(Helpers):
     def connect(self) -> None:
         if (site_socket := self._try_get_persisted_connection()) is None:
             site_socket = self._create_new_socket_connection()
-            if self.persist:
+            if self.persist and self.pool is None:
                 persistent_connections[self.socketurl] = site_socket
         self.socket = site_socket
+        self._socket_pid = os.getpid()
+        self.response_pending = False
+
+    def _pool_key(self) -> ConnectionPoolKey:
+        return (self.socketurl, self.tls, self.tls_verify, self._tls_ca_file_path)
+
+    def release(self) -> None:
+        """Hands the socket over to the connection pool for reuse
+
+        Without a pool, or in case a response has not been read completely, the connection is
+        closed instead. A socket inherited from the parent process is left to the parent."""
+        if self.pool is not None and self.socket is not None and self._socket_pid != os.getpid():
+            self.socket.detach()
+            self.socket = None
+            return
+        if self.pool is None or self.socket is None or self.response_pending:
+            self.disconnect()
+            return
+        self.pool.checkin(self._pool_key(), self.socket)
+        self.socket = None
 
     def _create_new_socket_connection(self) -> socket.socket:
         self.successful_persistence = False
@@ -646,7 +902,7 @@ class SingleSiteConnection(Helpers):
 
             self.socket = None
 
-        if self.persist:
+        if self.persist and self.pool is None:
             self.successful_persistence = False
             try:
                 del persistent_connections[self.socketurl]
@@ -718,6 +974,7 @@ class SingleSiteConnection(Helpers):
 
         try:
             self.socket.sendall(query.encode("utf-8") + b"\n\n")
+            self.response_pending = True
             if getattr(self.collect_queries, "active", False):
                 self.collect_queries.queries.append(query)
         except OSError as e:
@@ -741,35 +998,19 @@ class SingleSiteConnection(Helpers):
         timeout_at: float | None = None,
     ) -> bytes:
         try:
-            # Headers are always ASCII encoded
-            resp = self.receive_data(16)
-            code = resp[0:3].decode("ascii")
             try:
-                length = int(resp[4:15].lstrip())
-            except Exception:
+                code, length = parse_response_header(self.receive_data(16))
+            except MKLivestatusSocketError:
                 self.disconnect()
-                raise MKLivestatusSocketError(
-                    f"Malformed response header {resp!r}. Livestatus TCP socket might be "
-                    "unreachable or wrong encryption settings are used."
-                )
+                raise
 
             # Apply a lower timeout for the content because the data is already available
             # in the socket. The liveproxyd (same system) has the complete data available
             # while the data from a standard connection can still take some time.
             # 30 seconds should be more than enough for the maximum telegram size of 100MB
             data = self.receive_data(length, 30)
-
-            if code == "200":
-                return data
-
-            error_info = data.decode("utf-8")
-            if code == "404":
-                raise MKLivestatusTableNotFoundError(f"Not Found ({code}): {error_info!r}")
-
-            if code == "502":
-                raise MKLivestatusBadGatewayError(error_info)
-
-            raise MKLivestatusQueryError(f"{code}: {error_info}")
+            self.response_pending = False
+            return check_response_code(code, data)
 
         except (MKLivestatusSocketClosed, OSError) as e:
             # In case of an IO error or the other side having
@@ -851,6 +1092,66 @@ class SingleSiteConnection(Helpers):
                 row.insert(0, b"")
         return response
 
+    def query_iter(self, query: QueryTypes, add_headers: str = "") -> Iterator[LivestatusRow]:
+        """Like query(), but yields the rows while they are read from the socket
+
+        The response is never held in memory as a whole, which makes a difference for large
+        responses, e.g. of the log table."""
+        normalized_query = Query(query) if not isinstance(query, Query) else query
+
+        if self.limit is not None:
+            normalized_query = Query(
+                "%sLimit: %d\n" % (normalized_query, self.limit),
+                normalized_query.suppress_exceptions,
+            )
+
+        with _livestatus_output_format_switcher(normalized_query, self):
+            str_query = self.build_query(normalized_query, add_headers)
+        self.send_query(str_query)
+
+        for row in self.receive_rows(str_query, normalized_query):
+            if self.prepend_site:
+                row.insert(0, b"")
+            yield row
+
+    def receive_rows(self, query: str, query_obj: Query) -> Iterator[LivestatusRow]:
+        """Yields the rows of the response to an already sent query while receiving it"""
+        try:
+            header = self.receive_data(16)
+        except (MKLivestatusSocketClosed, OSError):
+            # Reconnect and try again once, e.g. the keepalive connection timed out
+            self.disconnect()
+            self.connect()
+            self.send_query(query)
+            header = self.receive_data(16)
+
+        try:
+            code, length = parse_response_header(header)
+            if code != "200":
+                data = self.receive_data(length, 30)
+                self.response_pending = False
+                check_response_code(code, data)
+        except (MKLivestatusSocketError, MKLivestatusQueryError):
+            self.disconnect()
+            raise
+
+        parser = ResponseRowParser(
+            json.loads if query_obj.supports_json_format() else ast.literal_eval
+        )
+        complete = False
+        try:
+            while length > 0:
+                chunk = self.receive_data(min(length, _RECEIVE_CHUNK_SIZE), 30)
+                length -= len(chunk)
+                yield from parser.feed(chunk)
+            parser.close()
+            complete = True
+            self.response_pending = False
+        finally:
+            if not complete:
+                # Don't leave the rest of the response on the socket for the next query
+                self.disconnect()
+
     def command(
         self, command: str, site: SiteId | None = None  # pylint: disable=unused-argument
     ) -> None:
@@ -913,6 +1214,75 @@ class SingleSiteConnection(Helpers):
 # it possible to connect/disconnect while an object is instantiated.
 
 
+QueryCacheKey = tuple[SiteId, str, str]
+
+
+class QueryCache:
+    """Shares the responses to identical queries for a short time
+
+    The cache is meant to be used by all MultiSiteConnection objects of a process, e.g. by the
+    concurrent requests of the GUI. Responses are cached per site, auth user and query. All
+    responses of a site are dropped once the site reports another program start (the core has
+    been restarted or has reloaded its configuration) and when a command is sent to the site.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1000) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[QueryCacheKey, tuple[float, LivestatusResponse]] = {}
+        self._program_starts: dict[SiteId, int] = {}
+
+    def get(self, key: QueryCacheKey) -> LivestatusResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return _copy_response(entry[1])
+
+    def store(self, key: QueryCacheKey, response: LivestatusResponse) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                now = time.time()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.time() + self.ttl, _copy_response(response))
+
+    def update_program_start(self, site_id: SiteId, program_start: int) -> None:
+        """Drops the responses of a site when it has been restarted since they were cached"""
+        with self._lock:
+            if self._program_starts.get(site_id, program_start) != program_start:
+                self._invalidate(site_id)
+            self._program_starts[site_id] = program_start
+
+    def invalidate(self, site_id: SiteId | None = None) -> None:
+        """Drops the responses of the given site or of all sites"""
+        with self._lock:
+            self._invalidate(site_id)
+
+    def _invalidate(self, site_id: SiteId | None) -> None:
+        if site_id is None:
+            self._entries.clear()
+            return
+        self._entries = {k: v for k, v in self._entries.items() if k[0] != site_id}
+
+    def hit_ratio(self) -> float:
+        if not (total := self.hits + self.misses):
+            return 0.0
+        return self.hits / total
+
+
+def _copy_response(response: LivestatusResponse) -> LivestatusResponse:
+    # The rows are modified by the callers, e.g. when prepending the site
+    return LivestatusResponse([LivestatusRow(list(row)) for row in response])
+
+
 class ConnectedSite(NamedTuple):
     id: SiteId
     config: SiteConfiguration
@@ -924,18 +1294,25 @@ ConnectedSites = list[ConnectedSite]
 
 class MultiSiteConnection(Helpers):
     def __init__(  # pylint: disable=too-many-branches
-        self, sites: SiteConfigurations, disabled_sites: SiteConfigurations | None = None
+        self,
+        sites: SiteConfigurations,
+        disabled_sites: SiteConfigurations | None = None,
+        connection_pool: ConnectionPool | None = None,
     ) -> None:
         if disabled_sites is None:
             disabled_sites = SiteConfigurations({})
 
         self.sites = sites
+        self.connection_pool = connection_pool
         self.connections: ConnectedSites = []
         self.deadsites: dict[SiteId, DeadSite] = {}
         self.prepend_site = False
         self.only_sites: OnlySites = None
         self.limit: int | None = None
         self.parallelize = True
+        self.query_timeout: float | None = None
+        self.timed_out_sites: list[SiteId] = []
+        self.query_cache: QueryCache | None = None
 
         # Status host: A status host helps to prevent trying to connect
         # to a remote site which is unreachable. This is done by looking
@@ -1074,6 +1451,7 @@ class MultiSiteConnection(Helpers):
             tls=tls_type != "plain_text",
             verify=tls_params.get("verify", True),
             ca_file_path=tls_params.get("ca_file_path", None),
+            pool=None if temporary else self.connection_pool,
         )
 
         if "timeout" in site:
@@ -1083,7 +1461,7 @@ class MultiSiteConnection(Helpers):
 
     def disconnect(self) -> None:
         for connected_site in self.connections:
-            connected_site.connection.disconnect()
+            connected_site.connection.release()
         self.connections.clear()
 
     # Needed for temporary connection for status_hosts in disabled sites
@@ -1110,6 +1488,24 @@ class MultiSiteConnection(Helpers):
         """Impose Limit on number of returned datasets (distributed among sites)"""
         self.limit = limit
 
+    def set_query_timeout(self, timeout: float | None = None) -> None:
+        """Stop waiting for the sites that have not answered within timeout seconds
+
+        Applies to parallel queries only. The rows of the sites that answered in time are
+        returned, the sites that did not are listed in timed_out_sites. In case None is given,
+        the queries wait for all sites.
+        """
+        self.query_timeout = timeout
+
+    def set_query_cache(self, cache: QueryCache | None = None) -> None:
+        """Answer parallel queries from the given cache where possible
+
+        The status table is never answered from the cache, because it is used to find out
+        whether the cached responses of a site are still valid. In case None is given, all
+        queries are sent to the sites.
+        """
+        self.query_cache = cache
+
     def dead_sites(self) -> dict[SiteId, DeadSite]:
         return self.deadsites
 
@@ -1185,18 +1581,20 @@ class MultiSiteConnection(Helpers):
     # New parallelized version of query(). The semantics differs in the handling
     # of Limit: since all sites are queried in parallel, the Limit: is simply
     # applied to all sites - resulting in possibly more results then Limit requests.
-    def query_parallel(  # pylint: disable=too-many-branches
-        self,
-        query: Query,
-        add_headers: str = "",
-    ) -> LivestatusResponse:
-        stillalive = []
+    def _send_queries(
+        self, query: Query, add_headers: str, skip_sites: Container[SiteId] = ()
+    ) -> tuple[list[tuple[str, ConnectedSite]], ConnectedSites]:
+        """Sends the query to all sites, returns the sent queries and the sites not queried
+
+        The sites to skip are neither queried nor part of the sites not queried."""
+        not_queried = []
         if self.only_sites is not None:
             connect_to_sites = [c for c in self.connections if c[0] in self.only_sites]
             # Unused sites are assumed to be alive
-            stillalive.extend([c for c in self.connections if c[0] not in self.only_sites])
+            not_queried.extend([c for c in self.connections if c[0] not in self.only_sites])
         else:
             connect_to_sites = self.connections
+        connect_to_sites = [c for c in connect_to_sites if c.id not in skip_sites]
 
         limit = self.limit
         if limit is not None:
@@ -1204,13 +1602,12 @@ class MultiSiteConnection(Helpers):
         else:
             limit_header = ""
 
-        # First send all queries
-        retrieve_responses: list[tuple[str, ConnectedSite]] = []
+        sent_queries: list[tuple[str, ConnectedSite]] = []
         for connected_site in connect_to_sites:
             try:
                 str_query = connected_site.connection.build_query(query, add_headers + limit_header)
                 connected_site.connection.send_query(str_query)
-                retrieve_responses.append((str_query, connected_site))
+                sent_queries.append((str_query, connected_site))
             except LivestatusTestingError:
                 raise
             except Exception as e:
@@ -1218,22 +1615,54 @@ class MultiSiteConnection(Helpers):
                     "exception": e,
                     "site": connected_site.config,
                 }
+        return sent_queries, not_queried
+
+    def query_parallel(  # pylint: disable=too-many-branches
+        self,
+        query: Query,
+        add_headers: str = "",
+    ) -> LivestatusResponse:
+        cached_responses = self._get_cached_responses(query, add_headers)
+        retrieve_responses, stillalive = self._send_queries(
+            query, add_headers, skip_sites=cached_responses
+        )
+
+        # Then read from all sockets as data arrives and parse each response as soon as it is
+        # complete, so that a slow site does not hold back reading the others.
+        site_rows: dict[SiteId, LivestatusResponse] = {}
+        answered: set[SiteId] = set()
+        self.timed_out_sites = []
+        deadline = None if self.query_timeout is None else time.time() + self.query_timeout
+        for response, result_or_error in _receive_responses(
+            [
+                _SiteResponse(connected_site, str_query)
+                for str_query, connected_site in retrieve_responses
+            ],
+            deadline,
+        ):
+            connected_site = response.connected_site
+            if result_or_error is None:
+                # Deadline passed: Only the rest of the response is lost, the site is still alive
+                connected_site.connection.disconnect()
+                self.timed_out_sites.append(connected_site.id)
+                answered.add(connected_site.id)
+                continue
 
-        # Then retrieve all raw responses. We will be as slow as the slowest of all connections.
-        site_responses: list[tuple[ConnectedSite, bytes]] = []
-        for str_query, connected_site in retrieve_responses:
             try:
-                site_responses.append(
-                    (
-                        connected_site,
-                        connected_site.connection.receive_raw_response(
-                            str_query, query.suppress_exceptions
-                        ),
-                    )
+                if isinstance(result_or_error, Exception):
+                    raise result_or_error
+                site_rows[connected_site.id] = connected_site.connection.parse_raw_response(
+                    result_or_error, query
                 )
+                answered.add(connected_site.id)
+                if self.query_cache is not None and _is_cacheable(query):
+                    self.query_cache.store(
+                        self._cache_key(connected_site, query, add_headers),
+                        site_rows[connected_site.id],
+                    )
             except query.suppress_exceptions:
                 # Mostly handles exception types MKLivestatusTableNotFoundError
-                stillalive.append(connected_site)
+                answered.add(connected_site.id)
                 continue
             except LivestatusTestingError:
                 raise
@@ -1244,31 +1673,95 @@ class MultiSiteConnection(Helpers):
                     "site": connected_site.config,
                 }
 
-        # Convert responses to python format
+        site_rows.update(cached_responses)
+        answered.update(cached_responses)
+
+        # Keep the order of the sites, no matter in which order the responses arrived
         result: list[LivestatusRow] = []
-        for connected_site, raw_response in site_responses:
-            try:
-                rows = connected_site.connection.parse_raw_response(raw_response, query)
-                stillalive.append(connected_site)
-                if self.prepend_site:
-                    for row in rows:
-                        row.insert(0, connected_site.id)
-                result.extend(rows)
-            except query.suppress_exceptions:
-                stillalive.append(connected_site)
+        for connected_site in self.connections:
+            if connected_site.id not in answered:
                 continue
-            except LivestatusTestingError:
-                raise
-            except Exception as e:
-                connected_site.connection.disconnect()
-                self.deadsites[connected_site.id] = {
-                    "exception": e,
-                    "site": connected_site.config,
-                }
+            stillalive.append(connected_site)
+            rows = site_rows.get(connected_site.id, LivestatusResponse([]))
+            if self.prepend_site:
+                for row in rows:
+                    row.insert(0, connected_site.id)
+            result.extend(rows)
 
         self.connections = stillalive
         return LivestatusResponse(result)
 
+    def _get_cached_responses(
+        self, query: Query, add_headers: str
+    ) -> dict[SiteId, LivestatusResponse]:
+        if self.query_cache is None or not _is_cacheable(query):
+            return {}
+        cached_responses = {}
+        for connected_site in self.connections:
+            if self.only_sites is not None and connected_site.id not in self.only_sites:
+                continue
+            response = self.query_cache.get(self._cache_key(connected_site, query, add_headers))
+            if response is not None:
+                cached_responses[connected_site.id] = response
+        return cached_responses
+
+    def _cache_key(
+        self, connected_site: ConnectedSite, query: Query, add_headers: str
+    ) -> QueryCacheKey:
+        connection = connected_site.connection
+        return (
+            connected_site.id,
+            connection.auth_header,
+            _combine_query(
+                str(query),
+                [
+                    add_headers,
+                    "OutputFormat: %s" % connection.get_output_format().value,
+                    "" if self.limit is None else "Limit: %d" % self.limit,
+                ],
+            ),
+        )
+
+    def query_iter(self, query: QueryTypes, add_headers: str = "") -> Iterator[LivestatusRow]:
+        """Like query(), but yields the rows while they are read from the sites
+
+        The query is sent to all sites first, so they all start computing their answer at once,
+        but the responses are streamed one site after the other. Like with query_parallel(),
+        the Limit is applied to each site.
+        """
+        normalized_query = Query(query) if not isinstance(query, Query) else query
+
+        with _livestatus_output_format_switcher(normalized_query, self):
+            sent_queries, stillalive = self._send_queries(normalized_query, add_headers)
+
+        try:
+            while sent_queries:
+                str_query, connected_site = sent_queries[0]
+                try:
+                    for row in connected_site.connection.receive_rows(str_query, normalized_query):
+                        if self.prepend_site:
+                            row.insert(0, connected_site.id)
+                        yield row
+                    stillalive.append(connected_site)
+                except normalized_query.suppress_exceptions:
+                    stillalive.append(connected_site)
+                except LivestatusTestingError:
+                    raise
+                except Exception as e:
+                    connected_site.connection.disconnect()
+                    self.deadsites[connected_site.id] = {
+                        "exception": e,
+                        "site": connected_site.config,
+                    }
+                del sent_queries[0]
+        finally:
+            # In case the caller stopped early, the responses of the remaining sites are still
+            # waiting on the sockets. They reconnect with the next query.
+            for _str_query, connected_site in sent_queries:
+                connected_site.connection.disconnect()
+
+        self.connections = stillalive
+
     def command(self, command: str, sitename: SiteId | None = SiteId("local")) -> None:
         if sitename in self.deadsites:
             raise MKLivestatusSocketError(
@@ -1280,6 +1773,9 @@ class MultiSiteConnection(Helpers):
                 "Cannot send command to unconfigured site '%s'" % sitename
             )
         conn[0].command(command)
+        if self.query_cache is not None:
+            # The command will most likely change the state of some objects
+            self.query_cache.invalidate(sitename)
 
     # Return connection to localhost (UNIX), if available
     def local_connection(self) -> SingleSiteConnection:
@@ -1296,6 +1792,151 @@ class MultiSiteConnection(Helpers):
         raise KeyError("Connection does not exist")
 
 
+class _SiteResponse:
+    """Assembles the raw response of a single site from whatever its socket has to offer"""
+
+    def __init__(self, connected_site: ConnectedSite, query: str) -> None:
+        self.connected_site = connected_site
+        self.query = query
+        self.reconnected = False
+        self.receive_until: float | None = None
+        self._header = b""
+        self._code = ""
+        self._length: int | None = None
+        self._data = BytesIO()
+
+    @property
+    def socket(self) -> socket.socket:
+        if (sock := self.connected_site.connection.socket) is None:
+            raise MKLivestatusSocketError(
+                "Socket to '%s' is not connected" % self.connected_site.connection.socketurl
+            )
+        return sock
+
+    def reconnect(self) -> None:
+        """Sends the query again on a fresh connection, but only once"""
+        connection = self.connected_site.connection
+        connection.disconnect()
+        connection.connect()
+        connection.send_query(self.query)
+        self.reconnected = True
+        self.receive_until = None
+        self._header = b""
+        self._length = None
+        self._data = BytesIO()
+
+    def read(self) -> bool:
+        """Reads the available data and tells whether the response is complete"""
+        if self._length is None:
+            self._header += self._recv(16 - len(self._header))
+            if len(self._header) < 16:
+                return False
+            self._code, self._length = parse_response_header(self._header)
+            # Apply a timeout for the content, see SingleSiteConnection.receive_raw_response
+            self.receive_until = time.time() + 30
+        elif (missing := self._length - self._data.tell()) > 0:
+            self._data.write(self._recv(min(missing, _RECEIVE_CHUNK_SIZE)))
+        if self._data.tell() < self._length:
+            return False
+        self.connected_site.connection.response_pending = False
+        return True
+
+    def _recv(self, size: int) -> bytes:
+        if not (packet := self.socket.recv(size)):
+            raise MKLivestatusSocketClosed(
+                "Read zero data from socket, remote peer closed connection."
+            )
+        return packet
+
+    def payload(self) -> bytes:
+        return check_response_code(self._code, self._data.getvalue())
+
+
+def _receive_responses(
+    responses: list[_SiteResponse], deadline: float | None
+) -> Iterator[tuple[_SiteResponse, bytes | Exception | None]]:
+    """Reads all responses at once and yields each one as soon as it is complete
+
+    Yields the payload or the error of each site. Sites that have not answered until the
+    deadline are yielded with None.
+    """
+    with selectors.DefaultSelector() as selector:
+        for response in responses:
+            try:
+                selector.register(response.socket, selectors.EVENT_READ, response)
+            except Exception as e:
+                yield response, e
+
+        while selector.get_map():
+            pending: list[_SiteResponse] = [key.data for key in selector.get_map().values()]
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                for response in pending:
+                    selector.unregister(response.socket)
+                    yield response, None
+                return
+
+            for response in [r for r in pending if r.receive_until and now > r.receive_until]:
+                pending.remove(response)
+                selector.unregister(response.socket)
+                yield response, MKLivestatusSocketError("Timed out while reading data from socket")
+
+            # SSL sockets may have data lingering around in pending, see is_socket_readable
+            ready = [
+                r
+                for r in pending
+                if isinstance(r.connected_site.connection.socket, ssl.SSLSocket)
+                and r.connected_site.connection.socket.pending()
+            ]
+            timeouts = [r.receive_until for r in pending if r.receive_until is not None]
+            if deadline is not None:
+                timeouts.append(deadline)
+            timeout = 0.0 if ready else (max(min(timeouts) - now, 0.0) if timeouts else None)
+            for key, _events in selector.select(timeout):
+                if key.data not in ready:
+                    ready.append(key.data)
+
+            for response in ready:
+                sock = response.socket
+                try:
+                    if not response.read():
+                        continue
+                except (MKLivestatusSocketClosed, OSError) as e:
+                    # In case of an IO error or the other side having closed the socket do a
+                    # reconnect and try again, like SingleSiteConnection.receive_raw_response
+                    selector.unregister(sock)
+                    if response.reconnected:
+                        yield response, MKLivestatusSocketError(str(e))
+                        continue
+                    try:
+                        response.reconnect()
+                        selector.register(response.socket, selectors.EVENT_READ, response)
+                    except LivestatusTestingError:
+                        raise
+                    except Exception as e2:
+                        yield response, e2
+                    continue
+                except LivestatusTestingError:
+                    raise
+                except Exception as e:
+                    selector.unregister(sock)
+                    yield response, e
+                    continue
+
+                selector.unregister(sock)
+                try:
+                    payload = response.payload()
+                except Exception as e:
+                    yield response, e
+                    continue
+                yield response, payload
+
+
+def _is_cacheable(query: Query) -> bool:
+    # The status table tells whether the cached responses are still valid
+    return str(query).split("\n", 1)[0].strip() != "GET status"
+
+
 @contextlib.contextmanager
 def _livestatus_output_format_switcher(
     query: Query, connection: MultiSiteConnection | SingleSiteConnection
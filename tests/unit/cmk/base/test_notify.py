@@ -4,7 +4,13 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import os
-from collections.abc import Mapping
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, cast
 
 import pytest
 from pytest import MonkeyPatch
@@ -14,7 +20,10 @@ from tests.testlib.base import Scenario
 from cmk.utils.notify_types import (
     ContactName,
     EventContext,
+    EventRule,
     NotificationContext,
+    NotificationPluginNameStr,
+    NotificationRuleID,
     NotifyPluginParams,
 )
 from cmk.utils.store.host_storage import ContactgroupName
@@ -110,3 +119,184 @@ def test_rbn_groups_contacts(
     assert notify.rbn_groups_contacts(["all"]) == {"dong"}
     assert notify.rbn_groups_contacts(["foo"]) == {"ding", "harry"}
     assert notify.rbn_groups_contacts(["foo", "all"]) == {"ding", "dong", "harry"}
+
+
+def _make_rule(**conditions: Any) -> EventRule:
+    return cast(
+        EventRule,
+        {
+            "rule_id": NotificationRuleID("rule"),
+            "allow_disable": True,
+            "contact_all": False,
+            "contact_all_with_email": False,
+            "contact_object": True,
+            "description": "",
+            "disabled": False,
+            "notify_plugin": ("mail", None),
+            **conditions,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "context, expected",
+    [
+        pytest.param(
+            {"WHAT": "HOST", "HOSTNAME": "heute", "HOSTCONTACTGROUPNAMES": "all"},
+            {0, 2, 4, 6},
+            id="host notification",
+        ),
+        pytest.param(
+            {
+                "WHAT": "SERVICE",
+                "HOSTNAME": "other",
+                "SERVICECONTACTGROUPNAMES": "",
+                "HOSTLABEL_os": "linux",
+            },
+            {0, 3, 5},
+            id="service notification",
+        ),
+        pytest.param(
+            {"WHAT": "SERVICE", "HOSTNAME": "other"},
+            {0, 3, 6},
+            id="unknown contact groups",
+        ),
+    ],
+)
+def test_notification_rule_index_candidates(context: EventContext, expected: set[int]) -> None:
+    rule_index = notify.NotificationRuleIndex(
+        [
+            _make_rule(),
+            _make_rule(disabled=True),
+            _make_rule(match_hosts=["heute"]),
+            _make_rule(match_service_event=["?c"]),
+            _make_rule(match_host_event=["?d"]),
+            _make_rule(match_hostlabels={"os": "linux"}),
+            _make_rule(match_contactgroups=["all"]),
+        ]
+    )
+    assert rule_index.candidates(context) == expected
+
+
+def test_notification_plugin_pool_limits_concurrency_per_plugin(monkeypatch: MonkeyPatch) -> None:
+    lock = threading.Lock()
+    running: Counter[str] = Counter()
+    max_running: Counter[str] = Counter()
+    history: list[str] = []
+
+    def execute(
+        plugin_name: str, plugin_context: NotificationContext, plugin_log: Callable[[str], None]
+    ) -> tuple[int, list[str]]:
+        with lock:
+            running[plugin_name] += 1
+            max_running[plugin_name] = max(max_running[plugin_name], running[plugin_name])
+        time.sleep(0.05)
+        with lock:
+            running[plugin_name] -= 1
+        return 0, ["sent"]
+
+    monkeypatch.setattr(notify, "_execute_notification_script", execute)
+    monkeypatch.setattr(notify, "log_to_history", history.append)
+
+    pool = notify.NotificationPluginPool(max_workers=4, plugin_limits={"mail": 1})
+    jobs: list[tuple[NotificationPluginNameStr, str]] = [
+        ("mail", "c1"),
+        ("mail", "c2"),
+        ("mail", "c3"),
+        ("slack", "c4"),
+        ("slack", "c5"),
+    ]
+    for plugin_name, contact in jobs:
+        pool.submit(
+            plugin_name,
+            NotificationContext(
+                {
+                    "CONTACTNAME": contact,
+                    "HOSTNAME": "heute",
+                    "HOSTSTATE": "DOWN",
+                    "HOSTOUTPUT": "down",
+                }
+            ),
+        )
+    pool.shutdown()
+
+    assert max_running == {"mail": 1, "slack": 2}
+    stats = pool.stats()
+    assert (stats.queued, stats.running, stats.completed) == (0, 0, 5)
+    assert stats.max_wait_time >= 0.1
+    for contact in ("c1", "c2", "c3", "c4", "c5"):
+        entries = [entry for entry in history if f": {contact};" in entry]
+        assert len(entries) == 2
+        assert entries[0].startswith("HOST NOTIFICATION: ")
+        assert entries[1].startswith("HOST NOTIFICATION RESULT: ")
+
+
+def test_bulk_index(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    bulkdir = tmp_path / "bulk"
+    monkeypatch.setattr(notify, "notification_bulkdir", str(bulkdir))
+    monkeypatch.setattr(notify, "log_to_history", lambda message: None)
+    sent: list[list[str]] = []
+
+    def call_bulk_notification_script(
+        plugin_name: str, context_lines: list[str]
+    ) -> tuple[int, list[str]]:
+        sent.append(context_lines)
+        return 0, []
+
+    monkeypatch.setattr(notify, "call_bulk_notification_script", call_bulk_notification_script)
+
+    for hostname in ["heute", "heute", "morgen"]:
+        notify.do_bulk_notify(
+            "mail",
+            {},
+            NotificationContext(
+                {
+                    "WHAT": "HOST",
+                    "CONTACTNAME": "hh",
+                    "HOSTNAME": hostname,
+                    "HOSTSTATE": "DOWN",
+                    "HOSTOUTPUT": "down",
+                }
+            ),
+            {"interval": 60, "count": 2, "groupby": ["host"]},
+        )
+
+    assert {key: count for key, (_oldest, count) in notify._load_bulk_index().items()} == {
+        "hh/mail/60,2,host,heute": 2,
+        "hh/mail/60,2,host,morgen": 1,
+    }
+    assert [bulk[0] for bulk in notify.find_bulks(only_ripe=False)] == [
+        str(bulkdir / "hh/mail/60,2,host,heute"),
+        str(bulkdir / "hh/mail/60,2,host,morgen"),
+    ]
+
+    # A missing index is rebuilt from the spool
+    (bulkdir / ".index").unlink()
+    ripe = notify.find_bulks(only_ripe=True)
+    assert [(bulk[0], len(bulk[-1])) for bulk in ripe] == [
+        (str(bulkdir / "hh/mail/60,2,host,heute"), 2)
+    ]
+
+    notify.send_ripe_bulks()
+    assert len(sent) == 1
+    assert list(notify._load_bulk_index()) == ["hh/mail/60,2,host,morgen"]
+    assert not (bulkdir / "hh/mail/60,2,host,heute").exists()
+
+    # A notification missing in the index (crash before saving it) is picked up by the next rescan
+    bulk_dir = bulkdir / "hh/mail/60,1,host,heute"
+    bulk_dir.mkdir()
+    context = {
+        "WHAT": "HOST",
+        "CONTACTNAME": "hh",
+        "HOSTNAME": "heute",
+        "HOSTSTATE": "DOWN",
+        "HOSTOUTPUT": "down",
+    }
+    (bulk_dir / str(uuid.uuid4())).write_text(f"{({}, context)!r}\n")
+    notify.send_ripe_bulks()
+    assert len(sent) == 1
+
+    os.utime(bulkdir / ".index_scanned", (0, 0))
+    notify.send_ripe_bulks()
+    assert len(sent) == 2
+    assert list(notify._load_bulk_index()) == ["hh/mail/60,2,host,morgen"]
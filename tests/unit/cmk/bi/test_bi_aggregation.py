@@ -3,10 +3,20 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import multiprocessing
+import threading
+
 import pytest
 
+from livestatus import SiteId
+
+from cmk.utils.hostaddress import HostName
+
 from cmk.bi.actions import BICallARuleAction
 from cmk.bi.aggregation import BIAggregation
+from cmk.bi.compiler import compile_aggregations
+from cmk.bi.computer import BINodeResultCache
+from cmk.bi.lib import BIHostSpec
 
 from .bi_test_data import sample_config
 
@@ -74,3 +84,100 @@ def test_compute_aggregation(
     assert actual_result.acknowledged == expected_acknowledgment
     assert actual_result.downtime_state == expected_downtime_state
     assert actual_result.in_service_period == expected_service_period
+
+
+def test_compute_aggregation_with_node_result_cache(
+    bi_packs_sample_config, bi_structure_fetcher, bi_searcher, bi_status_fetcher
+):
+    bi_structure_fetcher.add_site_data("heute", sample_config.bi_structure_states)
+    bi_searcher.set_hosts(bi_structure_fetcher.hosts)
+    bi_status_fetcher.states = bi_status_fetcher.create_bi_status_data(sample_config.bi_status_rows)
+    compiled_aggregation = bi_packs_sample_config.get_aggregation("default_aggregation").compile(
+        bi_searcher
+    )
+    branches = compiled_aggregation.branches
+    node_result_cache = BINodeResultCache()
+
+    first_results = node_result_cache.compute_branches(
+        compiled_aggregation, branches, bi_status_fetcher
+    )
+    assert first_results == compiled_aggregation.compute_branches(branches, bi_status_fetcher)
+    assert node_result_cache.hits == 0
+    computed_nodes = node_result_cache.misses
+
+    # Nothing changed: The very same results are handed out again
+    second_results = node_result_cache.compute_branches(
+        compiled_aggregation, branches, bi_status_fetcher
+    )
+    assert all(a is b for a, b in zip(first_results, second_results))
+    assert node_result_cache.misses == computed_nodes
+
+    # Acknowledge the problem of the discovery service of the host "heute"
+    host_spec = BIHostSpec(SiteId("heute"), HostName("heute"))
+    host_row = bi_status_fetcher.states[host_spec]
+    services = dict(host_row.services_with_fullstate)
+    services["Check_MK Discovery"] = services["Check_MK Discovery"]._replace(acknowledged=True)
+    bi_status_fetcher.states = {
+        **bi_status_fetcher.states,
+        host_spec: host_row._replace(services_with_fullstate=services),
+    }
+
+    third_results = node_result_cache.compute_branches(
+        compiled_aggregation, branches, bi_status_fetcher
+    )
+    assert third_results == compiled_aggregation.compute_branches(branches, bi_status_fetcher)
+    assert third_results != first_results
+    # Only the changed leaf and the rules above it have been recomputed
+    assert computed_nodes < node_result_cache.misses < 2 * computed_nodes
+
+
+def test_compile_aggregations_in_worker_processes(
+    bi_packs_sample_config, bi_structure_fetcher, bi_searcher
+):
+    bi_structure_fetcher.add_site_data("heute", sample_config.bi_structure_states)
+    bi_searcher.set_hosts(bi_structure_fetcher.hosts)
+    default_aggregation = bi_packs_sample_config.get_aggregation("default_aggregation")
+    schema_config = BIAggregation.schema()().dump(default_aggregation)
+    aggregations = [default_aggregation]
+    for idx in range(3):
+        aggregations.append(BIAggregation({**schema_config, "id": f"clone_{idx}"}))
+
+    sequential = list(compile_aggregations(aggregations, bi_searcher, processes=1))
+    parallel = list(compile_aggregations(aggregations, bi_searcher, processes=2))
+
+    assert [x[0].id for x in parallel] == [x.id for x in aggregations]
+    assert [x[1] for x in parallel] == [x[1] for x in sequential]
+    assert all(len(compiled.branches) == 2 for compiled, _result, _duration in parallel)
+
+
+def test_compile_aggregations_in_multithreaded_process(
+    bi_packs_sample_config, bi_structure_fetcher, bi_searcher, monkeypatch
+):
+    bi_structure_fetcher.add_site_data("heute", sample_config.bi_structure_states)
+    bi_searcher.set_hosts(bi_structure_fetcher.hosts)
+    default_aggregation = bi_packs_sample_config.get_aggregation("default_aggregation")
+    schema_config = BIAggregation.schema()().dump(default_aggregation)
+    aggregations = [default_aggregation, BIAggregation({**schema_config, "id": "clone"})]
+    sequential = list(compile_aggregations(aggregations, bi_searcher, processes=1))
+
+    start_methods = []
+    get_context = multiprocessing.get_context
+
+    def _get_context(method: str) -> multiprocessing.context.BaseContext:
+        start_methods.append(method)
+        return get_context(method)
+
+    monkeypatch.setattr(multiprocessing, "get_context", _get_context)
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        compiled = list(compile_aggregations(aggregations, bi_searcher, processes=2))
+    finally:
+        stop.set()
+        thread.join()
+
+    # The workers are forked by a spawned interpreter, not by this multithreaded process
+    assert start_methods == ["spawn"]
+    assert [x[0].id for x in compiled] == ["default_aggregation", "clone"]
+    assert [x[1] for x in compiled] == [x[1] for x in sequential]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Copyright (C) 2024 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import marshal
+from pathlib import Path
+from typing import cast
+
+from livestatus import LivestatusOutputFormat, LivestatusResponse, SiteId
+
+from cmk.utils.hostaddress import HostName
+
+from cmk.bi.data_fetcher import (
+    BIStructureFetcher,
+    host_structure_checksum,
+    load_site_structure_index,
+    load_site_structure_with_index,
+    save_site_structure,
+)
+from cmk.bi.lib import SitesCallback
+
+from .bi_test_data import sample_config
+
+# As read from livestatus: The host names are plain str, marshal can not serialize HostName
+STRUCTURE = cast(
+    dict[HostName, tuple],
+    {
+        str(host_name): (*values[:-1], str(values[-1]))
+        for host_name, values in sample_config.bi_structure_states.items()
+    },
+)
+
+
+def test_site_structure_file(tmp_path: Path) -> None:
+    path = tmp_path / "structure"
+    index = save_site_structure(path, STRUCTURE)
+
+    assert load_site_structure_index(path) == index
+    assert load_site_structure_with_index(path) == (STRUCTURE, index)
+
+
+def test_site_structure_file_previous_format(tmp_path: Path) -> None:
+    path = tmp_path / "structure"
+    path.write_bytes(marshal.dumps(STRUCTURE))
+
+    assert load_site_structure_index(path).keys() == STRUCTURE.keys()
+    assert load_site_structure_with_index(path) == (STRUCTURE, load_site_structure_index(path))
+
+
+def test_host_structure_checksum_ignores_ordering() -> None:
+    values = STRUCTURE[HostName("heute")]
+    reordered = (
+        values[0],
+        set(sorted(values[1], reverse=True)),
+        dict(reversed(values[2].items())),
+        values[3],
+        dict(reversed(values[4].items())),
+        *values[5:],
+    )
+    assert host_structure_checksum(reordered) == host_structure_checksum(values)
+    assert host_structure_checksum((*values[:3], "other_folder/", *values[4:])) != (
+        host_structure_checksum(values)
+    )
+
+
+def _structure_query(
+    query: str,
+    only_sites: list[SiteId] | None = None,
+    output_format: LivestatusOutputFormat = LivestatusOutputFormat.PYTHON,
+    fetch_full_data: bool = False,
+) -> LivestatusResponse:
+    if query.startswith("GET hosts"):
+        return LivestatusResponse(
+            [
+                ["heute", "heute", {"criticality": "prod"}, {}, [], [], "heute", "/wato/hosts.mk"],
+                [
+                    "heute",
+                    "heute_clone",
+                    {"criticality": "test"},
+                    {"cmk/check_mk_server": "no"},
+                    [],
+                    ["heute"],
+                    "heute_clone",
+                    "/wato/subfolder/hosts.mk",
+                ],
+            ]
+        )
+    return LivestatusResponse(
+        [
+            ["heute", "heute", "Uptime", [], {}],
+            ["heute", "heute_clone", "Uptime", [], {"label": "value"}],
+        ]
+    )
+
+
+def test_structure_checksum_across_program_starts() -> None:
+    sites_callback = SitesCallback(lambda: [], _structure_query, lambda s: s)
+
+    structure_fetcher = BIStructureFetcher(sites_callback)
+    structure_fetcher.update_data({(SiteId("heute"), 1000)})
+    assert structure_fetcher.hosts["heute_clone"].folder == "subfolder/"
+    checksum = structure_fetcher.structure_checksum()
+
+    # A restart of the core: The new data is fetched, but the structure did not change
+    restarted_structure_fetcher = BIStructureFetcher(sites_callback)
+    restarted_structure_fetcher.update_data({(SiteId("heute"), 2000)})
+    assert restarted_structure_fetcher.structure_checksum() == checksum
+
+    cached_structure_fetcher = BIStructureFetcher(sites_callback)
+    cached_structure_fetcher.update_data({(SiteId("heute"), 2000)})
+    assert cached_structure_fetcher.hosts == restarted_structure_fetcher.hosts
+    assert cached_structure_fetcher.structure_checksum() == checksum
+
+    assert BIStructureFetcher(sites_callback).structure_checksum() != checksum
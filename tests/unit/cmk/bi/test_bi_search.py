@@ -188,3 +188,57 @@ def test_service_search(
     search = BIServiceSearch(schema_config)
     results = search.execute({}, bi_searcher_with_sample_config)
     assert len(results) == expected_matches
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        pytest.param({"host_folder": "subfolder"}, id="folder"),
+        pytest.param({"host_tags": {"clone-tag": {"$ne": "clone-tag"}}}, id="tag $ne"),
+        pytest.param({"host_tags": {"criticality": {"$or": ["prod", "test"]}}}, id="tag $or"),
+        pytest.param({"host_tags": {"clone-tag": {"$nor": ["clone-tag"]}}}, id="tag $nor"),
+        pytest.param(
+            {"host_label_groups": [("and", [("and", "cmk/check_mk_server:no")])]},
+            id="label",
+        ),
+        pytest.param(
+            {
+                "host_label_groups": [
+                    ("and", [("and", "cmk/check_mk_server:no"), ("or", "cmk/check_mk_server:yes")])
+                ]
+            },
+            id="label or",
+        ),
+        pytest.param(
+            {"host_label_groups": [("not", [("and", "cmk/check_mk_server:no")])]},
+            id="label not",
+        ),
+        pytest.param(
+            {"host_choice": {"type": "host_name_regex", "pattern": "heutes?_clone"}},
+            id="host name optional character",
+        ),
+        pytest.param(
+            {
+                "host_choice": {"type": "host_name_regex", "pattern": "heu(te)"},
+                "host_tags": {"criticality": "prod"},
+            },
+            id="host name and tag",
+        ),
+    ],
+)
+def test_indexed_host_search(conditions, bi_searcher_with_sample_config: BISearcher) -> None:
+    schema_config = BIHostSearch.schema()().dump({"conditions": conditions})
+    search = BIHostSearch(schema_config)
+    results = search.execute({}, bi_searcher_with_sample_config)
+
+    # Evaluate the conditions on each host without any index
+    conditions = schema_config["conditions"]
+    bi_searcher = bi_searcher_with_sample_config
+    hosts, _matched_re_groups = bi_searcher.filter_host_choice(
+        list(bi_searcher.hosts.values()), conditions["host_choice"]
+    )
+    matched_hosts = bi_searcher.filter_host_folder(hosts, conditions["host_folder"])
+    matched_hosts = bi_searcher.filter_host_tags(matched_hosts, conditions["host_tags"])
+    matched_hosts = bi_searcher.filter_host_labels(matched_hosts, conditions["host_label_groups"])
+
+    assert [x["$HOSTNAME$"] for x in results] == [x.name for x in matched_hosts]
@@ -4,6 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 import logging
+import time
 
 from tests.testlib import CMKEventConsole
 
@@ -11,7 +12,13 @@ from cmk.utils.hostaddress import HostName
 
 import cmk.ec.export as ec
 from cmk.ec.config import Config, ServiceLevel
-from cmk.ec.main import create_history, EventServer, StatusTableEvents, StatusTableHistory
+from cmk.ec.main import (
+    create_history,
+    EventServer,
+    EventStatus,
+    StatusTableEvents,
+    StatusTableHistory,
+)
 
 RULE = ec.Rule(
     actions=[],
@@ -61,3 +68,34 @@ def test_event_rewrite(
 
     assert event["text"] == "SUPERWARN"
     assert event["state"] == 2
+
+
+def test_handle_event_timeouts(event_server: EventServer, event_status: EventStatus) -> None:
+    now = time.time()
+    for host, attrs in [
+        ("expired", {"live_until": now - 1}),
+        ("alive", {"live_until": now + 3600}),
+        ("expired-but-acked", {"live_until": now - 1, "phase": "ack"}),
+        ("delay-over", {"phase": "delayed", "delay_until": now - 1}),
+        ("still-delayed", {"phase": "delayed", "delay_until": now + 3600}),
+    ]:
+        event_status.new_event(
+            CMKEventConsole.new_event(
+                ec.Event(host=HostName(host), core_host=HostName(host), rule_id=None, **attrs)
+            )
+        )
+
+    event_server.hk_handle_event_timeouts()
+    assert [(e["host"], e["phase"]) for e in event_status.events()] == [
+        ("alive", "open"),
+        ("expired-but-acked", "ack"),
+        ("delay-over", "open"),
+        ("still-delayed", "delayed"),
+    ]
+
+    # Acknowledged events only expire when their phase is allowed to expire
+    acked_event = event_status.events()[1]
+    acked_event["live_until_phases"] = ["open", "ack"]
+    event_status.mark_event_changed(acked_event)
+    event_server.hk_handle_event_timeouts()
+    assert [e["host"] for e in event_status.events()] == ["alive", "delay-over", "still-delayed"]
@@ -3,6 +3,7 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import logging
 import time
 
 import pytest
@@ -14,7 +15,10 @@ from tests.unit.cmk.ec.helpers import FakeStatusSocket
 from cmk.utils.hostaddress import HostName
 
 import cmk.ec.export as ec
-from cmk.ec.main import EventStatus, StatusServer
+from cmk.ec.config import Config
+from cmk.ec.history_file import FileHistory
+from cmk.ec.main import EventServer, EventStatus, StatusServer
+from cmk.ec.perfcounters import Perfcounters
 
 
 def test_handle_client(status_server: StatusServer) -> None:
@@ -131,3 +135,155 @@ def test_mkevent_query_filters(
     status_server.handle_client(status_socket, True, "127.0.0.1")
     response = status_socket.get_response()
     assert (len(response) == 2) is is_match
+
+
+def test_save_status_appends_changes_to_journal(
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_status: EventStatus,
+    event_server: EventServer,
+) -> None:
+    for num in range(3):
+        event_status.new_event(
+            CMKEventConsole.new_event({"host": HostName(f"host-{num}"), "core_host": None})
+        )
+    event_status.save_status()
+    assert settings.paths.status_file.value.exists()
+    assert not settings.paths.status_journal_file.value.exists()
+
+    first, second, _third = event_status.events()
+    second["comment"] = "changed"
+    event_status.mark_event_changed(second)
+    event_status.remove_event(first, "DELETE")
+    event_status.new_event(
+        CMKEventConsole.new_event({"host": HostName("host-3"), "core_host": None})
+    )
+    event_status.save_status()
+    assert settings.paths.status_journal_file.value.exists()
+
+    loaded_status = EventStatus(
+        settings, config, perfcounters, history, logging.getLogger("cmk.mkeventd.EventStatus")
+    )
+    loaded_status.load_status(event_server)
+    assert [(e["id"], e["host"], e["comment"]) for e in loaded_status.events()] == [
+        (2, "host-1", "changed"),
+        (3, "host-2", ""),
+        (4, "host-3", ""),
+    ]
+    assert loaded_status.pack_status()["next_event_id"] == 5
+
+    # The replayed journal is compacted into a new snapshot with the next save
+    loaded_status.save_status()
+    assert not settings.paths.status_journal_file.value.exists()
+
+
+def test_stale_journal_is_not_replayed_after_flush(
+    settings: ec.Settings,
+    config: Config,
+    perfcounters: Perfcounters,
+    history: FileHistory,
+    event_status: EventStatus,
+    event_server: EventServer,
+) -> None:
+    settings.paths.status_file.value.parent.mkdir(parents=True, exist_ok=True)
+    event_status.save_status()
+    event_status.new_event(
+        CMKEventConsole.new_event({"host": HostName("host-0"), "core_host": None})
+    )
+    event_status.save_status()
+    journal_path = settings.paths.status_journal_file.value
+    stale_journal = journal_path.read_bytes()
+
+    # Simulate a crash between writing the new snapshot and removing the old journal
+    event_status.flush()
+    event_status.save_status()
+    journal_path.write_bytes(stale_journal)
+
+    loaded_status = EventStatus(
+        settings, config, perfcounters, history, logging.getLogger("cmk.mkeventd.EventStatus")
+    )
+    loaded_status.load_status(event_server)
+    assert not list(loaded_status.events())
+
+
+def test_remove_oldest_event_of_host_and_rule(event_status: EventStatus) -> None:
+    for num in range(6):
+        event_status.new_event(
+            CMKEventConsole.new_event(
+                {
+                    "host": HostName(f"host-{num % 2}"),
+                    "core_host": HostName(f"host-{num % 2}"),
+                    "rule_id": f"rule-{num % 3}",
+                }
+            )
+        )
+
+    event_status.remove_oldest_event("by_host", event_status.events()[-1])
+    assert [e["id"] for e in event_status.events()] == [1, 3, 4, 5, 6]
+    assert event_status.num_existing_events_by_host[("host-1", HostName("host-1"))] == 2
+
+    event_status.remove_oldest_event("by_rule", {"rule_id": "rule-0", "host": HostName("")})
+    assert [e["id"] for e in event_status.events()] == [3, 4, 5, 6]
+    assert event_status.num_existing_events_by_rule["rule-0"] == 1
+    assert event_status.get_num_existing_events_by("overall", {}) == 4
+
+
+def test_mark_event_changed_reindexes_rewritten_host(event_status: EventStatus) -> None:
+    for num in range(2):
+        event_status.new_event(
+            CMKEventConsole.new_event(
+                {"host": HostName(f"host-{num}"), "core_host": None, "rule_id": "rule"}
+            )
+        )
+
+    first, _second = event_status.events()
+    first["host"] = HostName("host-1")
+    event_status.mark_event_changed(first)
+
+    assert event_status.num_existing_events == 2
+    assert event_status.num_existing_events_by_host[("host-0", None)] == 0
+    assert event_status.num_existing_events_by_host[("host-1", None)] == 2
+    assert [e["id"] for e in event_status.get_events_of_hosts(lambda h: h == "host-1")] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (
+            b"GET events\nColumns: event_id event_host\nFilter: event_host in HOST-2 host-4\n",
+            [["event_id", "event_host"], [3, "host-2"], [5, "host-4"]],
+        ),
+        (
+            b"GET events\nColumns: event_id event_nonexisting\nFilter: event_host = host-1\n",
+            [["event_id", "event_nonexisting"], [2, None]],
+        ),
+        (
+            b"GET events\nColumns: event_id\nFilter: event_rule_id = rule-1\nFilter: event_id > 2\n",
+            [["event_id"], [5]],
+        ),
+        (
+            b"GET events\nColumns: event_id\nFilter: event_text ~ text-[12]\nLimit: 1\n"
+            b"OutputFormat: json\n",
+            [["event_id"], [2]],
+        ),
+    ],
+)
+def test_query_events(
+    event_status: EventStatus, status_server: StatusServer, query: bytes, expected: object
+) -> None:
+    for num in range(5):
+        event_status.new_event(
+            CMKEventConsole.new_event(
+                {
+                    "host": HostName(f"host-{num}"),
+                    "core_host": HostName(f"host-{num}"),
+                    "rule_id": f"rule-{num % 3}",
+                    "text": f"text-{num}",
+                }
+            )
+        )
+    s = FakeStatusSocket(query)
+    status_server.handle_client(s, True, "127.0.0.1")
+    assert s.get_response() == expected
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# Copyright (C) 2023 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+import logging
+
+import pysnmp.proto.rfc1902  # type: ignore[import]
+
+import cmk.ec.export as ec
+from cmk.ec.config import Config
+from cmk.ec.snmp import SNMPTrapTranslator
+
+
+def test_translate_via_mibs_is_cached(settings: ec.Settings, config: Config) -> None:
+    translator = SNMPTrapTranslator(
+        settings, {**config, "translate_snmptraps": (True, {})}, logging.getLogger("cmk.mkeventd")
+    )
+    oid = pysnmp.proto.rfc1902.ObjectName("1.3.6.1.2.1.1.5.0")
+
+    first = translator.translate("127.0.0.1", [(oid, pysnmp.proto.rfc1902.OctetString("abc"))])
+    second = translator.translate("127.0.0.1", [(oid, pysnmp.proto.rfc1902.OctetString("abc"))])
+    third = translator.translate("127.0.0.1", [(oid, pysnmp.proto.rfc1902.OctetString("xyz"))])
+
+    assert first == second == [("SNMPv2-MIB::sysName.0", "abc")]
+    # The value is not part of the cache key, only its syntax is
+    assert third == [("SNMPv2-MIB::sysName.0", "xyz")]
+    assert translator.cache_info() == (2, 1)
@@ -25,6 +25,7 @@ from cmk.gui.graphing._graph_templates import TemplateGraphSpecification
 from cmk.gui.graphing._rrd_fetch import (
     _reverse_translate_into_all_potentially_relevant_metrics,
     fetch_rrd_data_for_graph,
+    prefetch_rrd_data_for_graphs,
     translate_and_merge_rrd_columns,
 )
 from cmk.gui.graphing._type_defs import RRDDataKey
@@ -48,10 +49,10 @@ def _setup_livestatus(mock_livestatus: MockLiveStatusConnection) -> Iterator[Non
         )
         mock_live.expect_query(
             """GET services
-Columns: rrddata:temp:temp.max:1681985455:1681999855:20
+Columns: host_name service_description rrddata:temp:temp.max:1681985455:1681999855:20
 Filter: host_name = my-host
 Filter: service_description = Temperature Zone 6
-ColumnHeaders: off
+And: 2
 
             """,
             sites=["NO_SITE"],
@@ -136,6 +137,120 @@ def test_fetch_rrd_data_for_graph_with_conversion(
         }
 
 
+def test_fetch_rrd_data_for_graph_is_cached_per_request(
+    mock_livestatus: MockLiveStatusConnection,
+    request_context: None,
+) -> None:
+    with _setup_livestatus(mock_livestatus):
+        first = fetch_rrd_data_for_graph(_GRAPH_RECIPE, _GRAPH_DATA_RANGE)
+    # No further query is expected
+    with mock_livestatus(expect_status_query=False):
+        assert fetch_rrd_data_for_graph(_GRAPH_RECIPE, _GRAPH_DATA_RANGE) == first
+
+
+def test_prefetch_rrd_data_for_graphs(
+    mock_livestatus: MockLiveStatusConnection,
+    request_context: None,
+) -> None:
+    other_recipe = _GRAPH_RECIPE.model_copy(
+        update={
+            "metrics": [
+                _GRAPH_RECIPE.metrics[0].model_copy(
+                    update={
+                        "operation": _GRAPH_RECIPE.metrics[0].operation.model_copy(
+                            update={"host_name": HostName("other-host")}
+                        )
+                    }
+                )
+            ]
+        }
+    )
+    with mock_livestatus(expect_status_query=True) as mock_live:
+        mock_live.add_table(
+            "services",
+            [
+                {
+                    "host_name": host_name,
+                    "service_description": "Temperature Zone 6",
+                    "rrddata:temp:temp.max:1681985455:1681999855:20": [1, 2, 3, 4, 5, None],
+                }
+                for host_name in ("my-host", "other-host", "unrelated-host")
+            ],
+        )
+        mock_live.expect_query(
+            """GET services
+Columns: host_name service_description rrddata:temp:temp.max:1681985455:1681999855:20
+Filter: host_name = my-host
+Filter: service_description = Temperature Zone 6
+And: 2
+Filter: host_name = other-host
+Filter: service_description = Temperature Zone 6
+And: 2
+Or: 2
+
+            """,
+            sites=["NO_SITE"],
+        )
+        prefetch_rrd_data_for_graphs(
+            [(_GRAPH_RECIPE, _GRAPH_DATA_RANGE), (other_recipe, _GRAPH_DATA_RANGE)]
+        )
+
+    with mock_livestatus(expect_status_query=False):
+        assert list(fetch_rrd_data_for_graph(other_recipe, _GRAPH_DATA_RANGE).values()) == [
+            TimeSeries([4, 5, None], time_window=(1, 2, 3))
+        ]
+
+
+def test_fetch_rrd_data_for_host_metric_graph(
+    mock_livestatus: MockLiveStatusConnection,
+    request_context: None,
+) -> None:
+    host_recipe = _GRAPH_RECIPE.model_copy(
+        update={
+            "metrics": [
+                _GRAPH_RECIPE.metrics[0].model_copy(
+                    update={
+                        "operation": _GRAPH_RECIPE.metrics[0].operation.model_copy(
+                            update={"service_name": "_HOST_"}
+                        )
+                    }
+                )
+            ]
+        }
+    )
+    with mock_livestatus(expect_status_query=True) as mock_live:
+        mock_live.add_table(
+            "hosts",
+            [
+                {
+                    "host_name": "my-host",
+                    "rrddata:temp:temp.max:1681985455:1681999855:20": [1, 2, 3, 4, 5, None],
+                }
+            ],
+        )
+        mock_live.expect_query(
+            """GET hosts
+Columns: host_name rrddata:temp:temp.max:1681985455:1681999855:20
+Filter: host_name = my-host
+
+            """,
+            sites=["NO_SITE"],
+        )
+        assert fetch_rrd_data_for_graph(host_recipe, _GRAPH_DATA_RANGE) == {
+            RRDDataKey(
+                SiteId("NO_SITE"),
+                HostName("my-host"),
+                "_HOST_",
+                "temp",
+                "max",
+                1,
+            ): TimeSeries(
+                [4, 5, None],
+                time_window=(1, 2, 3),
+            )
+        }
+
+
 def test_translate_and_merge_rrd_columns() -> None:
     assert translate_and_merge_rrd_columns(
         MetricName("my_metric"),
@@ -29,3 +29,30 @@ def test__time_series_math_exc_symbol(args: tuple[Literal["%"], list[TimeSeries]
 def test__time_series_math_stable_singles(operator: Operators) -> None:
     test_ts = TimeSeries([0, 180, 60, 6, 5, 10, None, -2, -3.14])
     assert time_series_math(operator, [test_ts]) == test_ts
+
+
+@pytest.mark.parametrize(
+    "operator, expected",
+    [
+        pytest.param("+", [3, 1, None, 6], id="sum"),
+        pytest.param("*", [2, None, None, 8], id="product"),
+        pytest.param("-", [-1, None, None, -2], id="difference"),
+        pytest.param("/", [0.5, None, None, 0.5], id="fraction"),
+        pytest.param("MAX", [2, 1, None, 4], id="maximum"),
+        pytest.param("MIN", [1, 1, None, 2], id="minimum"),
+        pytest.param("AVERAGE", [1.5, 1, None, 3], id="average"),
+        pytest.param("MERGE", [1, 1, None, 2], id="merge"),
+    ],
+)
+def test__time_series_math_missing_values(
+    operator: Operators, expected: list[float | None]
+) -> None:
+    result = time_series_math(
+        operator,
+        [
+            TimeSeries([1, 1, None, 2, 0], (0, 240, 60)),
+            TimeSeries([2, None, None, 4], (0, 240, 60)),
+        ],
+    )
+    assert result is not None
+    assert result.values == expected
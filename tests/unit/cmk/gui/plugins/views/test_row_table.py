@@ -6,6 +6,7 @@ import pytest
 
 from cmk.utils.livestatus_helpers.testing import MockLiveStatusConnection
 
+import cmk.gui.data_source.livestatus as livestatus_data_source
 from cmk.gui.data_source import RowTableLivestatus
 from cmk.gui.view import View
 from cmk.gui.views.store import multisite_builtin_views
@@ -54,3 +55,47 @@ def test_row_table_object(mock_livestatus: MockLiveStatusConnection) -> None:
             limit=None,
             all_active_filters=[],
         )
+
+
+@pytest.mark.usefixtures("request_context")
+def test_row_table_streams_rows(
+    mock_livestatus: MockLiveStatusConnection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    live = mock_livestatus
+    live.add_table(
+        "hosts",
+        [
+            {"name": "heute", "host_state": 0, "host_has_been_checked": True},
+            {"name": "morgen", "host_state": 1, "host_has_been_checked": True},
+        ],
+    )
+    live.expect_query("GET hosts\nColumns: host_has_been_checked host_state name")
+    # The whole response must not be fetched at once
+    monkeypatch.setattr(livestatus_data_source, "query_livestatus", None)
+
+    view_spec = multisite_builtin_views["allhosts"].copy()
+    view_spec["painters"] = []
+    view_spec["group_painters"] = []
+    view_spec["sorters"] = []
+    view_spec["context"] = {}
+    view = View("allhosts", view_spec, view_spec["context"])
+
+    with live(expect_status_query=True):
+        result = RowTableLivestatus("hosts").query(
+            view.datasource,
+            view.row_cells,
+            columns=["name"],
+            context=view.context,
+            headers="",
+            only_sites=None,
+            limit=None,
+            all_active_filters=[],
+        )
+
+    assert isinstance(result, tuple)
+    rows, num_rows = result
+    assert num_rows == 2
+    assert [(row["site"], row["name"], row["host_state"]) for row in rows] == [
+        ("NO_SITE", "heute", 0),
+        ("NO_SITE", "morgen", 1),
+    ]
@@ -53,6 +53,7 @@ def test_default_config_from_plugins() -> None:
         "acknowledge_problems",
         "custom_links",
         "debug_livestatus_queries",
+        "livestatus_query_cache_ttl",
         "show_livestatus_errors",
         "liveproxyd_enabled",
         "visible_views",
@@ -123,6 +124,7 @@ def test_default_config_from_plugins() -> None:
         "wato_num_hostspecs",
         "wato_num_itemspecs",
         "wato_activation_method",
+        "wato_activation_snapshot_workers",
         "wato_write_nagvis_auth",
         "wato_use_git",
         "wato_hidden_users",
@@ -3,6 +3,9 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import os
+import socket
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
@@ -100,3 +103,17 @@ def test_sorted_sites(mocker: MockerFixture, request_context: None) -> None:
     ]
     assert user_sites.sorted_sites() == expected
     mocker.stopall()
+
+
+def test_connection_pool_is_reset_in_forked_child() -> None:
+    sock, peer = socket.socketpair()
+    sites._connection_pool.checkin(("unix:/live", False, True, None), sock)
+    try:
+        if (pid := os.fork()) == 0:
+            # The inherited socket must neither be handed out nor be closed by the child
+            os._exit(0 if sites._connection_pool.statistics()["idle"] == 0 else 1)
+        assert os.waitpid(pid, 0)[1] == 0
+        assert sites._connection_pool.statistics()["idle"] == 1
+    finally:
+        sites._connection_pool.clear()
+        peer.close()
@@ -4,6 +4,7 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 
+import numpy as np
 import pytest
 
 from cmk.gui.time_series import rrd_timestamps, TimeSeries, TimeSeriesValues, TimeWindow
@@ -101,3 +102,19 @@ class TestTimeseries:
             ).count(None)
             == 2
         )
+
+    def test_array(self) -> None:
+        ts = TimeSeries([0, 180, 60, 1, None, 3.5])
+        assert np.array_equal(ts.array, [1, np.nan, 3.5], equal_nan=True)
+        assert ts.values == [1, None, 3.5]
+        assert ts[1] is None
+
+        ts.values = [None, 2]
+        assert ts.array[1] == 2
+        assert ts.count(None) == 1
+
+    def test_non_vectorized_conversion(self) -> None:
+        assert TimeSeries(
+            [1, 2, 3, 4, None, 5],
+            conversion=lambda v: float(round(v)) * 2,
+        ).values == [8, None, 10]
@@ -5,6 +5,7 @@
 
 import io
 import logging
+import os
 import tarfile
 from pathlib import Path
 
@@ -403,6 +404,40 @@ def _create_get_config_sync_file_infos_test_config(base_dir: Path) -> None:
     base_dir.joinpath("links/working-symlink-to-file").symlink_to("../etc/d3/xyz")
 
 
+def test_config_sync_file_hash_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = tmp_path / "hashes.pkl"
+    old_file = tmp_path / "old.mk"
+    old_file.write_text("a = 1\n")
+    os.utime(old_file, (1700000000, 1700000000))
+    new_file = tmp_path / "new.mk"
+    new_file.write_text("b = 1\n")
+
+    hash_cache = activate_changes.ConfigSyncFileHashCache(cache_path)
+    old_hash = hash_cache.file_hash(str(old_file), old_file.stat())
+    new_hash = hash_cache.file_hash(str(new_file), new_file.stat())
+    hash_cache.save()
+
+    hashed = []
+    create_hash = activate_changes._create_config_sync_file_hash
+
+    def _create_config_sync_file_hash(file_path: str) -> str:
+        hashed.append(file_path)
+        return create_hash(file_path)
+
+    monkeypatch.setattr(
+        activate_changes, "_create_config_sync_file_hash", _create_config_sync_file_hash
+    )
+    hash_cache = activate_changes.ConfigSyncFileHashCache(cache_path)
+    assert hash_cache.file_hash(str(old_file), old_file.stat()) == old_hash
+    # Recently modified files are always hashed
+    assert hash_cache.file_hash(str(new_file), new_file.stat()) == new_hash
+    assert hashed == [str(new_file)]
+
+    old_file.write_text("a = 2\n")
+    os.utime(old_file, (1700000001, 1700000001))
+    assert hash_cache.file_hash(str(old_file), old_file.stat()) != old_hash
+
+
 def test_get_file_names_to_sync(request_context: None) -> None:
     remote, central = _get_test_file_infos()
     sync_delta = activate_changes.get_file_names_to_sync(
@@ -26,7 +26,7 @@ from cmk.utils.user import UserId
 import cmk.gui.i18n as i18n
 from cmk.gui.utils.html import HTML
 from cmk.gui.utils.script_helpers import application_and_request_context
-from cmk.gui.watolib.audit_log import AuditLogStore, log_audit
+from cmk.gui.watolib.audit_log import AuditLogFilter, AuditLogStore, log_audit
 from cmk.gui.watolib.changes import ActivateChangesWriter, add_change
 from cmk.gui.watolib.objref import ObjectRef, ObjectRefType
 from cmk.gui.watolib.site_changes import ChangeSpec, SiteChanges
@@ -78,6 +78,7 @@ class TestAuditLogStore:
             yield store
         finally:
             store._path.unlink(missing_ok=True)
+            store._index_path().unlink(missing_ok=True)
 
     def test_read_not_existing(self, store: AuditLogStore) -> None:
         assert not store.exists()
@@ -106,6 +107,49 @@ class TestAuditLogStore:
         store.append(entry)
         assert list(store.read()) == [entry]
 
+    def test_read_entries_of_previous_versions(self, store: AuditLogStore) -> None:
+        entry = AuditLogStore.Entry(1000, None, "user", "action", "Mässädsch", None)
+        store._path.parent.mkdir(parents=True, exist_ok=True)
+        store._path.write_bytes(repr(AuditLogStore.Entry.serialize(entry)).encode() + b"\0")
+        store.append(entry)
+        assert list(store.read()) == [entry, entry]
+
+    def test_read_filtered(self, store: AuditLogStore, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(AuditLogStore, "_BLOCK_ENTRIES", 3)
+        host_ref = ObjectRef(ObjectRefType.Host, "node1")
+        entries = [
+            AuditLogStore.Entry(
+                1000 + n,
+                host_ref if n % 2 else None,
+                "user%d" % (n % 3),
+                "action",
+                "Message %d" % n,
+                None,
+            )
+            for n in range(10)
+        ]
+        for entry in entries[:5]:
+            store.append(entry)
+        assert store.get_entries_since(1002) == entries[3:5]
+
+        # The index is extended with the appended entries
+        for entry in entries[5:]:
+            store.append(entry)
+        for options in [
+            AuditLogFilter(timestamp_from=1002, timestamp_to=1006),
+            AuditLogFilter(user_id="user1"),
+            AuditLogFilter(object_type="Host"),
+            AuditLogFilter(object_type="None", filter_regex="Message [0-5]"),
+        ]:
+            assert store.read(options) == [
+                entry for entry in entries if AuditLogStore.filter_entry(entry, options)
+            ]
+
+        # The index is rebuilt for a rewritten file
+        store._path.write_bytes(b"")
+        store.append(entries[9])
+        assert store.get_entries_since(0) == [entries[9]]
+
     def test_clear(self, store: AuditLogStore) -> None:
         entry = AuditLogStore.Entry(int(time.time()), None, "user", "action", "Mässädsch", None)
         store.append(entry)
@@ -263,6 +263,8 @@ def _generate_sync_snapshot(
     snapshot_manager.generate_snapshots()
 
     assert Path(snapshot_settings.work_dir).exists()
+    if edition is not cmk_version.Edition.CME:
+        assert set(snapshot_manager.site_durations) == set(site_snapshot_settings)
 
     return snapshot_settings
 
@@ -545,3 +547,4 @@ def _synchronize_site(
         sync_start,
     )
     assert sync_result is not None
+    assert set(sync_result["_phase_durations"]) >= {"fetch_sync_state", "calc_sync_delta"}
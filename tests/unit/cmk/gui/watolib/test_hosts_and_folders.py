@@ -8,12 +8,14 @@ import os
 import pprint
 import shutil
 import sys
+import threading
 import time
 import uuid
 from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from itertools import count
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -55,6 +57,70 @@ def test_effective_attributes() -> None:
     assert first_attributes != attributes()
 
 
+def test_parsed_folder_files_cache(tmp_path: Path) -> None:
+    hosts_file = tmp_path / "hosts.mk"
+    hosts_file.write_text("a")
+    parsed: list[str] = []
+
+    def parse() -> dict[str, str]:
+        parsed.append(content := hosts_file.read_text())
+        return {"content": content}
+
+    cache_path = tmp_path / "folder_tree.cache"
+    cache = hosts_and_folders._ParsedFolderFilesCache(cache_path)
+    assert cache.get(str(hosts_file), parse) == {"content": "a"}
+    # The cached data is handed out as a copy
+    cache.get(str(hosts_file), parse)["content"] = "modified"
+    assert cache.get(str(hosts_file), parse) == {"content": "a"}
+    assert parsed == ["a"]
+
+    # Other processes use the saved entries
+    cache.save()
+    other_cache = hosts_and_folders._ParsedFolderFilesCache(cache_path)
+    assert other_cache.get(str(hosts_file), parse) == {"content": "a"}
+    assert parsed == ["a"]
+
+    # A changed file is parsed again
+    hosts_file.write_text("bb")
+    assert other_cache.get(str(hosts_file), parse) == {"content": "bb"}
+    assert parsed == ["a", "bb"]
+
+    # Missing files are not cached
+    hosts_file.unlink()
+    assert cache.get(str(hosts_file), lambda: None) is None
+
+
+def test_parsed_folder_files_cache_keeps_entries_added_while_saving(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    first_file = tmp_path / "first.mk"
+    first_file.write_text("1")
+    second_file = tmp_path / "second.mk"
+    second_file.write_text("2")
+    cache_path = tmp_path / "folder_tree.cache"
+    cache = hosts_and_folders._ParsedFolderFilesCache(cache_path)
+    cache.get(str(first_file), first_file.read_text)
+
+    save_object_to_pickle_file = hosts_and_folders.store.save_object_to_pickle_file
+
+    def save_while_other_thread_parses(path: Path, data: object) -> None:
+        save_object_to_pickle_file(path, data)
+        thread = threading.Thread(target=cache.get, args=(str(second_file), second_file.read_text))
+        thread.start()
+        thread.join()
+
+    with monkeypatch.context() as m:
+        m.setattr(
+            hosts_and_folders.store, "save_object_to_pickle_file", save_while_other_thread_parses
+        )
+        cache.save()
+    cache.save()
+
+    other_cache = hosts_and_folders._ParsedFolderFilesCache(cache_path)
+    assert other_cache.get(str(first_file), lambda: "parsed") == "1"
+    assert other_cache.get(str(second_file), lambda: "parsed") == "2"
+
+
 @pytest.fixture(autouse=True)
 def test_env(with_admin_login: UserId, load_config: None) -> Iterator[None]:
     # Ensure we have clean folder/host caches
@@ -557,6 +623,42 @@ def test_subfolder_creation() -> None:
     assert len(folder._subfolders) == 1
 
 
+def test_host_attributes_index() -> None:
+    tree = folder_tree()
+    folder = tree.root_folder().create_subfolder(
+        "index", "Index", {"labels": {"from": "folder"}, "tag_address_family": "no-ip"}
+    )
+    folder.create_hosts(
+        [
+            (HostName("host1"), HostAttributes(ipaddress=HostAddress("127.0.0.1")), None),
+            (HostName("host2"), HostAttributes(labels={"from": "host", "os": "linux"}), None),
+        ]
+    )
+    tree.invalidate_caches()
+
+    index = hosts_and_folders.host_attributes_index()
+    for host in folder.hosts().values():
+        assert index.effective_attributes(host) == host.effective_attributes()
+
+    def search(criteria: dict[str, object]) -> list[HostName]:
+        return sorted(
+            hosts_and_folders.SearchFolder(tree, tree.root_folder(), {".name": None, **criteria})
+            .hosts()
+            .keys()
+        )
+
+    assert search({"ipaddress": "127.0.0.1"}) == ["host1"]
+    assert search({"labels": {"os": "linux"}}) == ["host2"]
+    assert search({"tag_address_family": "no-ip"}) == ["host1", "host2"]
+
+    # Saving the hosts updates the index
+    folder.load_host(HostName("host2")).edit(
+        HostAttributes(ipaddress=HostAddress("127.0.0.1")), None
+    )
+    tree.invalidate_caches()
+    assert search({"ipaddress": "127.0.0.1"}) == ["host1", "host2"]
+
+
 def test_match_item_generator_hosts() -> None:
     assert list(
         hosts_and_folders.MatchItemGeneratorHosts(
@@ -119,6 +119,7 @@ def test_registered_configvars() -> None:
         "log_logon_failures",
         "lock_on_logon_failures",
         "log_level",
+        "livestatus_query_cache_ttl",
         "log_levels",
         "log_messages",
         "log_rulehits",
@@ -135,7 +136,9 @@ def test_registered_configvars() -> None:
         "notification_fallback_email",
         "notification_fallback_format",
         "notification_logging",
+        "notification_plugin_concurrency",
         "notification_plugin_timeout",
+        "notification_plugin_workers",
         "page_heading",
         "pagetitle_date_format",
         "password_policy",
@@ -185,6 +188,7 @@ def test_registered_configvars() -> None:
         "acknowledge_problems",
         "virtual_host_trees",
         "wato_activation_method",
+        "wato_activation_snapshot_workers",
         "wato_activate_changes_comment_mode",
         "wato_hide_filenames",
         "wato_hide_folders_without_read_permissions",
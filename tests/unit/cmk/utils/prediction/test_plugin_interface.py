@@ -3,8 +3,21 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
+import time
+from pathlib import Path
 
-from cmk.utils.prediction import estimate_levels
+from tests.testlib import on_time
+
+from livestatus import RRDResponse
+
+from cmk.utils.prediction import (
+    estimate_levels,
+    make_updated_predictions,
+    precompute_predictions,
+    PredictionStore,
+)
+
+from cmk.agent_based.prediction_backend import PredictionInfo, PredictionParameters
 
 
 def test_estimate_levels_absolute() -> None:
@@ -45,3 +58,35 @@ def test_estimate_levels_lower_ubound() -> None:
     )
 
     assert estimate_levels(42.0, 1.0, "lower", ("stdev", (2.3, 3.2)), (38.5, 50.0)) == (38.5, 38.8)
+
+
+def test_precompute_predictions(tmp_path: Path) -> None:
+    midnight = 1700006400  # UTC
+    store = PredictionStore(tmp_path)
+    params = PredictionParameters(period="wday", horizon=14, levels=("absolute", (1.0, 2.0)))
+    with on_time(midnight + 3600, "UTC"):
+        store.save_prediction_info(PredictionInfo.make("load15", "upper", params, time.time()))
+        # The rest of the current day would be missing in the successor of this one
+        store.save_prediction_info(
+            PredictionInfo.make(
+                "load1", "upper", params.model_copy(update={"period": "hour"}), time.time()
+            )
+        )
+
+    def get_recorded_data(metric: str, start: int, end: int, max_entries: int) -> RRDResponse:
+        return RRDResponse(window=range(start, end, 3600), values=[1.0] * 24)
+
+    with on_time(midnight + 3600, "UTC"):
+        assert precompute_predictions(store, get_recorded_data, time.time(), 3600) == 0
+
+    with on_time(midnight + 86399, "UTC"):
+        assert precompute_predictions(store, get_recorded_data, time.time(), 3600) == 1
+        assert precompute_predictions(store, get_recorded_data, time.time(), 3600) == 0
+
+    def fail(metric: str, start: int, end: int, max_entries: int) -> RRDResponse:
+        raise AssertionError("precomputed prediction should be used")
+
+    with on_time(midnight + 86400 + 60, "UTC"):
+        assert list(make_updated_predictions(store, fail, time.time()).values()) == [
+            (1.0, (2.0, 3.0))
+        ]
@@ -7,12 +7,14 @@ import json
 
 import pytest
 
-from tests.testlib import repo_path
+from tests.testlib import on_time, repo_path
 
 from livestatus import RRDResponse
 
 from cmk.utils.prediction import _prediction
 
+from cmk.agent_based.prediction_backend import PredictionInfo, PredictionParameters
+
 
 def _load_fake_rrd_response(start: int, end: int) -> RRDResponse:
     raw = json.loads(
@@ -208,3 +210,36 @@ def test_calculate_data_for_prediction(
     assert len(expected_reference.points) == len(data_for_pred.points)
     for cal, ref in zip(data_for_pred.points, expected_reference.points):
         assert cal == pytest.approx(ref, rel=1e-12, abs=1e-12)
+
+
+def test_compute_prediction_fetches_contiguous_slices_in_chunks() -> None:
+    step = 3600
+    now = 1700006400  # midnight UTC
+    queried: list[tuple[int, int, int]] = []
+
+    def get_recorded_data(metric: str, start: int, end: int, max_entries: int) -> RRDResponse:
+        queried.append((start, end, max_entries))
+        window = range(start, end, step)
+        return RRDResponse(window=window, values=[float(t % 86400) for t in window])
+
+    info = PredictionInfo(
+        valid_interval=(now, now + 86400),
+        metric="load15",
+        direction="upper",
+        params=PredictionParameters(period="hour", horizon=10, levels=("absolute", (1.0, 2.0))),
+    )
+    with on_time(now, "UTC"):
+        prediction = _prediction.compute_prediction(info, get_recorded_data)
+
+    assert queried == [
+        (now, now + 86400, 400),
+        (now - 7 * 86400, now, 2800),
+        (now - 9 * 86400, now - 7 * 86400, 800),
+    ]
+    assert prediction is not None
+    assert prediction.points == [
+        _prediction.DataStat(
+            average=hour * 3600.0, min_=hour * 3600.0, max_=hour * 3600.0, stdev=0.0
+        )
+        for hour in range(24)
+    ]
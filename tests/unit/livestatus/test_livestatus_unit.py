@@ -6,9 +6,12 @@
 # pylint: disable=redefined-outer-name
 
 import errno
+import os
 import socket
 import ssl
-from collections.abc import Sequence
+import threading
+import time
+from collections.abc import Iterator, Sequence
 from contextlib import closing
 from pathlib import Path
 
@@ -259,6 +262,160 @@ def test_local_connection(patch_omd_site: None, mock_livestatus: MockLiveStatusC
         livestatus.LocalConnection().query_value("GET status\nColumns: program_start")
 
 
+def _serve_livestatus(path: Path, response: bytes | None, delay: float = 0.0) -> None:
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(str(path))
+    server.listen(1)
+
+    def serve() -> None:
+        with closing(server), closing(server.accept()[0]) as conn:
+            while not conn.recv(4096).endswith(b"\n\n"):
+                pass
+            if response is None:
+                conn.recv(1)  # Never answer, wait for the client to give up
+                return
+            time.sleep(delay)
+            for offset in range(0, len(response), 7):
+                conn.sendall(response[offset : offset + 7])
+            conn.recv(1)
+
+    threading.Thread(target=serve, daemon=True).start()
+
+
+@pytest.fixture
+def multisite_connection(tmp_path: Path) -> Iterator[livestatus.MultiSiteConnection]:
+    _serve_livestatus(tmp_path / "slow", b"200          11\n[['slow']]\n", delay=0.2)
+    _serve_livestatus(tmp_path / "fast", b"200          11\n[['fast']]\n")
+    _serve_livestatus(tmp_path / "dead", None)
+    live = livestatus.MultiSiteConnection(
+        livestatus.SiteConfigurations(
+            {
+                livestatus.SiteId(name): {"socket": f"unix:{tmp_path / name}"}
+                for name in ["slow", "fast", "dead"]
+            }
+        )
+    )
+    yield live
+    live.disconnect()
+
+
+def test_multisite_query_parallel_timeout(
+    multisite_connection: livestatus.MultiSiteConnection,
+) -> None:
+    multisite_connection.set_prepend_site(True)
+    multisite_connection.set_query_timeout(1.0)
+
+    assert multisite_connection.query("GET hosts\nColumns: name") == [
+        ["slow", "slow"],
+        ["fast", "fast"],
+    ]
+    assert multisite_connection.timed_out_sites == ["dead"]
+    assert not multisite_connection.dead_sites()
+    assert multisite_connection.alive_sites() == ["slow", "fast", "dead"]
+
+
+def test_multisite_query_cache(multisite_connection: livestatus.MultiSiteConnection) -> None:
+    cache = livestatus.QueryCache(ttl=60)
+    multisite_connection.set_query_cache(cache)
+    multisite_connection.set_query_timeout(0.5)
+    query = "GET hosts\nColumns: name"
+
+    assert multisite_connection.query(query) == [["slow"], ["fast"]]
+    # The sites only answer once
+    assert multisite_connection.query(query) == [["slow"], ["fast"]]
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.update_program_start(livestatus.SiteId("fast"), 1)
+    cache.update_program_start(livestatus.SiteId("fast"), 2)
+    # The restarted site is asked again, but is gone by now
+    assert multisite_connection.query(query) == [["slow"]]
+    assert "fast" in multisite_connection.dead_sites()
+
+
+def test_multisite_connection_pool(tmp_path: Path) -> None:
+    accepted = []
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(str(tmp_path / "live"))
+    server.listen(2)
+
+    def serve() -> None:
+        with closing(server):
+            while True:
+                conn = server.accept()[0]
+                accepted.append(conn)
+                while conn.recv(4096).endswith(b"\n\n"):
+                    conn.sendall(b"200           8\n[['a']]\n")
+                conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    pool = livestatus.ConnectionPool()
+    sites = livestatus.SiteConfigurations(
+        {livestatus.SiteId("site"): {"socket": f"unix:{tmp_path / 'live'}"}}
+    )
+
+    for _request in range(3):
+        live = livestatus.MultiSiteConnection(sites, connection_pool=pool)
+        assert live.query("GET hosts\nColumns: name") == [["a"]]
+        live.disconnect()
+
+    assert len(accepted) == 1
+    assert pool.statistics() == {"reused": 2, "missed": 1, "discarded": 0, "idle": 1}
+
+    # The site closing an idle connection is noticed before handing it out
+    accepted[0].shutdown(socket.SHUT_RDWR)
+    live = livestatus.MultiSiteConnection(sites, connection_pool=pool)
+    assert live.query("GET hosts\nColumns: name") == [["a"]]
+    assert len(accepted) == 2
+    assert pool.statistics()["discarded"] == 1
+
+
+def test_connection_pool_reset_after_fork(monkeypatch: MonkeyPatch) -> None:
+    idle, idle_peer = socket.socketpair()
+    in_use, in_use_peer = socket.socketpair()
+    in_use_fd = in_use.fileno()
+    pool = livestatus.ConnectionPool()
+    pool.checkin(("unix:/idle", False, True, None), idle)
+    connection = livestatus.SingleSiteConnection("unix:/in_use", pool=pool)
+    monkeypatch.setattr(connection, "_create_new_socket_connection", lambda: in_use)
+    connection.connect()
+
+    # Now in the forked child: The sockets of the parent are forgotten, but not closed
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    pool.reset_after_fork()
+    connection.release()
+
+    assert connection.socket is None
+    assert pool.statistics()["idle"] == 0
+    assert idle.fileno() != -1
+    os.fstat(in_use_fd)
+
+    for sock in (idle, idle_peer, in_use_peer):
+        sock.close()
+    os.close(in_use_fd)
+
+
+def test_single_site_query_iter(tmp_path: Path) -> None:
+    response = b"[['a', b'\\x00'],\n['b\\'\\\\]', 1],\n['c', [1, 2]]]\n"
+    _serve_livestatus(tmp_path / "live", b"200 %11d\n" % len(response) + response)
+    live = livestatus.SingleSiteConnection(f"unix:{tmp_path / 'live'}")
+
+    assert list(live.query_iter("GET hosts\nColumns: name")) == [
+        ["a", b"\x00"],
+        ["b'\\]", 1],
+        ["c", [1, 2]],
+    ]
+
+
+def test_multisite_query_iter_stopped_early(
+    multisite_connection: livestatus.MultiSiteConnection,
+) -> None:
+    rows = multisite_connection.query_iter("GET hosts\nColumns: name")
+    assert next(rows) == ["slow"]
+    rows.close()
+
+    assert [c.connection.socket for c in multisite_connection.connections][1:] == [None, None]
+
+
 # Regression test for Werk 14384
 @pytest.mark.parametrize(
     "user_id,allowed",